@@ -13,6 +13,7 @@ class NetBoxCustomObjectsTabConfig(PluginConfig):
     base_url = "custom-objects-tab"
     min_version = "4.5.0"
     max_version = "4.5.99"
+    middleware = ["netbox_custom_objects_tab.routing.ReadReplicaPinMiddleware"]
     default_settings = {
         # Per-type tabs: each Custom Object Type gets its own tab (opt-in, empty by default).
         "typed_models": [],
@@ -29,13 +30,53 @@ class NetBoxCustomObjectsTabConfig(PluginConfig):
         "combined_weight": 2000,
         # Tab sort weight for all typed tabs.
         "typed_weight": 2100,
+        # Rollup tabs: parent model -> {child model: lookup from the child to the parent}, e.g.
+        # {"dcim.site": {"dcim.device": "site", "dcim.interface": "device__site"}} (opt-in).
+        "rollup_models": {},
+        # Label and tab sort weight of the rollup tabs.
+        "rollup_label": "Related Custom Objects",
+        "rollup_weight": 2050,
+        # Maintain the denormalized reference index and read tabs/badges/search from it.
+        # Run `manage.py rebuild_custom_objects_tab_index` after enabling.
+        "reference_index": False,
+        # Offer a sortable "Custom Objects" count column on combined_models list tables.
+        "count_column": True,
+        # Add has_custom_objects / has_custom_object_type filters to combined_models list views and API.
+        "list_filters": True,
+        # Seconds to cache custom object display strings (keyed by pk and last_updated); 0 disables.
+        "display_cache_timeout": 3600,
+        # Send ETags from the tabs and answer unchanged revalidations with 304 Not Modified.
+        "conditional_get": True,
+        # Seconds to cache rendered combined-tab rows; 0 disables.
+        "row_cache_timeout": 3600,
+        # Max. concurrent per-field queries (each on its own DB connection) when loading the combined tab; 1 = serial.
+        "fetch_concurrency": 1,
+        # Database alias (e.g. a PostgreSQL replica) for tab, badge and count queries; None = primary.
+        "read_database_alias": None,
+        # Seconds a session keeps reading from the primary after writing a custom object.
+        "read_pin_seconds": 10,
+        # Stop counting badge references above this many and show e.g. "1000+"; None = exact counts.
+        "badge_count_cap": None,
+        # Maintain per-parent reference counters and read badges/bulk counts from them.
+        # Run `manage.py reconcile_custom_objects_tab_counters` after enabling.
+        "reference_counters": False,
+        # Default combined-tab layout: "flat" (one paginated list) or "grouped" (one
+        # lazily loaded section per Custom Object Type). Users can switch with ?layout=.
+        "combined_layout": "flat",
+        # Let users with the profile permission append ?_profile=1 to a tab URL to get a profile report.
+        "profile_requests": False,
+        # Directory where ?_profile requests also save their raw cProfile stats; None = not saved.
+        "profile_directory": None,
     }
 
     def ready(self):
         super().ready()
-        from . import views
+        from . import signals, views
 
+        signals.connect_signals()
         views.register_tabs()
+        # Registers the "Most referenced objects" dashboard widget
+        from . import widgets  # noqa: F401
 
 
 config = NetBoxCustomObjectsTabConfig
@@ -0,0 +1,17 @@
+from django.urls import path
+
+from . import views
+
+# Mounted by NetBox under /api/plugins/custom-objects-tab/
+urlpatterns = [
+    path(
+        "linked/<str:model>/<int:pk>/",
+        views.LinkedCustomObjectsView.as_view(),
+        name="linked_custom_objects",
+    ),
+    path(
+        "counts/<str:model>/",
+        views.LinkedCustomObjectCountsView.as_view(),
+        name="linked_custom_object_counts",
+    ),
+]
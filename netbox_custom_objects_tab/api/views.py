@@ -0,0 +1,290 @@
+import base64
+import binascii
+import logging
+from collections import defaultdict
+from itertools import islice
+
+from django.apps import apps
+from django.utils.module_loading import import_string
+from netbox.api.authentication import IsAuthenticatedOrLoginNotRequired
+from rest_framework.exceptions import NotFound, ValidationError
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param
+from rest_framework.views import APIView
+
+from ..counts import count_linked_custom_objects
+from ..references import get_reference_fields, reference_lookup
+from ..routing import read_alias, using
+from ..views.combined import _resolve_values_bulk
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+# Keys of a serialized row; a subset can be requested with ?fields=.
+ROW_FIELDS = ("type", "object", "field", "value", "tags")
+
+
+def _encode_cursor(field_pk, obj_pk):
+    return base64.urlsafe_b64encode(f"{field_pk}:{obj_pk}".encode()).decode()
+
+
+def _decode_cursor(cursor):
+    """Return the (field_pk, custom_object_pk) position encoded in an opaque cursor."""
+    try:
+        field_pk, obj_pk = base64.urlsafe_b64decode(cursor.encode()).decode().split(":")
+        return int(field_pk), int(obj_pk)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError({"cursor": "Invalid cursor."})
+
+
+def _parse_fields(value):
+    """Parse the ?fields= projection; an empty value selects every row field."""
+    if not value:
+        return set(ROW_FIELDS)
+    requested = {name.strip() for name in value.split(",") if name.strip()}
+    if unknown := requested - set(ROW_FIELDS):
+        raise ValidationError({"fields": f"Unknown field(s): {', '.join(sorted(unknown))}"})
+    return requested
+
+
+def _page_size(value):
+    """
+    The ?limit= page size, defaulting to PAGINATE_COUNT and capped at MAX_PAGE_SIZE.
+    Both are NetBox dynamic configuration parameters, not Django settings.
+    """
+    from netbox.config import get_config
+
+    config = get_config()
+    try:
+        limit = int(value or config.PAGINATE_COUNT)
+    except ValueError:
+        raise ValidationError({"limit": "Must be an integer."})
+    return max(1, min(limit, config.MAX_PAGE_SIZE or limit))
+
+
+def _iter_linked(
+    instance, fields, after=None, q="", type_slug="", tag_slug="", with_tags=True, chunk_size=100, user=None
+):
+    """
+    Yield (custom_object, field, model) for every reference to `instance`, in stable
+    (field pk, custom object pk) order, starting strictly after the `after` position.
+    With a `user`, only custom objects that user may view are yielded.
+
+    Keyset pagination: each field is read in pk-ordered chunks of `chunk_size`, so a
+    consumer that stops after one page only issues the queries that page needs.
+    """
+    q = q.strip().lower()
+    db = read_alias()
+    for field in sorted(fields, key=lambda f: f.pk):
+        if after and field.pk < after[0]:
+            continue
+        custom_object_type = field.custom_object_type
+        if type_slug and custom_object_type.slug != type_slug:
+            continue
+        try:
+            model = custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+
+        qs = using(model.objects, db).filter(**{reference_lookup(field): instance.pk}).order_by("pk")
+        if user is not None:
+            qs = qs.restrict(user, "view")
+        if tag_slug:
+            qs = qs.filter(tags__slug=tag_slug)
+        if with_tags:
+            qs = qs.prefetch_related("tags")
+        match_all = not q or q in str(custom_object_type).lower() or q in str(field).lower()
+
+        last_pk = after[1] if after and field.pk == after[0] else None
+        while True:
+            chunk = list((qs if last_pk is None else qs.filter(pk__gt=last_pk))[:chunk_size])
+            for obj in chunk:
+                if match_all or q in str(obj).lower():
+                    yield obj, field, model
+            if len(chunk) < chunk_size:
+                break
+            last_pk = chunk[-1].pk
+
+
+def _get_parent_model(label):
+    """Resolve an "<app_label>.<model>" URL segment to a model class, or raise NotFound."""
+    try:
+        app_label, model_name = label.lower().split(".", 1)
+        return apps.get_model(app_label, model_name)
+    except (ValueError, LookupError):
+        raise NotFound(f"Unknown model {label!r}.")
+
+
+def _restricted_queryset(model_class, user):
+    try:
+        return model_class.objects.restrict(user, "view")
+    except AttributeError:
+        return model_class.objects.all()
+
+
+def _get_filterset_class(model_class):
+    """Return the NetBox filterset for model_class (e.g. dcim.filtersets.DeviceFilterSet), or None."""
+    try:
+        return import_string(f"{model_class._meta.app_label}.filtersets.{model_class.__name__}FilterSet")
+    except ImportError:
+        return None
+
+
+def _is_true(value):
+    return str(value).lower() in ("1", "true", "yes", "on")
+
+
+def _brief(obj, request):
+    url = obj.get_absolute_url() if hasattr(obj, "get_absolute_url") else None
+    return {
+        "id": obj.pk,
+        "display": str(obj),
+        "url": request.build_absolute_uri(url) if url else None,
+    }
+
+
+def _serialize_row(obj, field, value, projection, request):
+    row = {}
+    if "type" in projection:
+        custom_object_type = field.custom_object_type
+        row["type"] = {"id": custom_object_type.pk, "slug": custom_object_type.slug, "display": str(custom_object_type)}
+    if "object" in projection:
+        row["object"] = _brief(obj, request)
+    if "field" in projection:
+        row["field"] = {"id": field.pk, "name": field.name, "label": str(field), "type": field.type}
+    if "value" in projection:
+        if isinstance(value, list):
+            row["value"] = [_brief(v, request) for v in value]
+        else:
+            row["value"] = _brief(value, request) if value is not None else None
+    if "tags" in projection:
+        row["tags"] = [{"id": t.pk, "name": t.name, "slug": t.slug, "color": t.color} for t in obj.tags.all()]
+    return row
+
+
+class LinkedCustomObjectsView(APIView):
+    """
+    List the custom objects referencing one object, e.g.
+    GET /api/plugins/custom-objects-tab/linked/dcim.device/42/
+
+    Returns the same rows as the combined tab (one per custom object and referencing
+    field) with cursor pagination (?cursor=, ?limit=), filtering (?q=, ?type=, ?tag=)
+    and field projection (?fields=type,object,value).
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def get_view_name(self):
+        return "Linked Custom Objects"
+
+    def get(self, request, model, pk):
+        model_class = _get_parent_model(model)
+        instance = _restricted_queryset(model_class, request.user).filter(pk=pk).first()
+        if instance is None:
+            raise NotFound()
+
+        params = request.query_params
+        projection = _parse_fields(params.get("fields", ""))
+        limit = _page_size(params.get("limit"))
+        after = _decode_cursor(params["cursor"]) if params.get("cursor") else None
+
+        rows = list(
+            islice(
+                _iter_linked(
+                    instance,
+                    get_reference_fields(model_class),
+                    after=after,
+                    q=params.get("q", ""),
+                    type_slug=params.get("type", ""),
+                    tag_slug=params.get("tag", "").strip(),
+                    with_tags="tags" in projection,
+                    chunk_size=limit + 1,
+                    user=request.user,
+                ),
+                limit + 1,
+            )
+        )
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        # Resolve the Value column in bulk: one query per referencing field on this page
+        values = {}
+        if "value" in projection:
+            by_field = defaultdict(list)
+            for obj, field, model in rows:
+                by_field[field.pk, model].append((obj, field))
+            for (field_pk, model), pairs in by_field.items():
+                resolved = _resolve_values_bulk(model, pairs[0][1], [obj for obj, _field in pairs])
+                values.update({(field_pk, obj_pk): value for obj_pk, value in resolved.items()})
+
+        next_url = None
+        if has_more:
+            last_obj, last_field, _model = rows[-1]
+            next_url = replace_query_param(
+                request.build_absolute_uri(), "cursor", _encode_cursor(last_field.pk, last_obj.pk)
+            )
+
+        return Response(
+            {
+                "next": next_url,
+                "results": [
+                    _serialize_row(obj, field, values.get((field.pk, obj.pk)), projection, request)
+                    for obj, field, _model in rows
+                ],
+            }
+        )
+
+
+class LinkedCustomObjectCountsView(APIView):
+    """
+    Reference counts for many objects of one model in a single request, e.g.
+    GET  /api/plugins/custom-objects-tab/counts/dcim.device/?site=prg1&by_type=true
+    POST /api/plugins/custom-objects-tab/counts/dcim.device/  {"pks": [1, 2, 3]}
+
+    GET accepts ?pk= (repeatable) and/or any filter of the model's filterset; without
+    either, every object visible to the user is counted. Objects without references
+    are omitted from the result.
+    """
+
+    permission_classes = [IsAuthenticatedOrLoginNotRequired]
+
+    def get_view_name(self):
+        return "Linked Custom Object Counts"
+
+    def get(self, request, model):
+        model_class = _get_parent_model(model)
+        params = request.query_params.copy()
+        by_type = _is_true(params.pop("by_type", ["false"])[-1])
+        pks = params.pop("pk", [])
+        params.pop("format", None)
+
+        qs = _restricted_queryset(model_class, request.user)
+        if pks:
+            try:
+                qs = qs.filter(pk__in=[int(pk) for pk in pks])
+            except ValueError:
+                raise ValidationError({"pk": "Must be integers."})
+        if params:
+            filterset_class = _get_filterset_class(model_class)
+            if filterset_class is None:
+                raise ValidationError(f"Filtering is not supported for {model_class._meta.label_lower}.")
+            filterset = filterset_class(params, queryset=qs)
+            if not filterset.is_valid():
+                raise ValidationError(filterset.errors)
+            qs = filterset.qs
+
+        return Response({"results": count_linked_custom_objects(model_class, qs, by_type=by_type)})
+
+    def post(self, request, model):
+        model_class = _get_parent_model(model)
+        pks = request.data.get("pks")
+        if not isinstance(pks, list) or not all(isinstance(pk, int) for pk in pks):
+            raise ValidationError({"pks": "Must be a list of integers."})
+
+        # Restricting through a subquery keeps this one grouped query per referencing field
+        qs = _restricted_queryset(model_class, request.user).filter(pk__in=pks)
+        counts = count_linked_custom_objects(model_class, qs, by_type=_is_true(request.data.get("by_type", False)))
+        return Response({"results": counts})
@@ -0,0 +1,196 @@
+"""
+Batched bulk actions of the combined tab: delete, add/remove tags, clear reference.
+
+Selected rows arrive as "<custom object type id>:<field id>:<custom object pk>" and are
+grouped per referencing field; each group is handled with a few set-based queries, all
+inside one transaction. Only custom objects that reference the tab's object through the
+selected field, and that the user may change or delete, are touched.
+
+NetBox's changelog signal handlers would write one ObjectChange per object, so they are
+bypassed while the queries run (current_request cleared); the ObjectChange records are
+written with a single bulk_create and the usual events are enqueued per object.
+"""
+
+import logging
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.utils import timezone
+from extras.choices import CustomFieldTypeChoices
+from netbox.plugins import get_plugin_config
+
+from . import counters, reference_index
+from .references import reference_lookup
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+ACTIONS = ("delete", "add_tags", "remove_tags", "clear_reference")
+
+
+def parse_selection(values):
+    """{field_id: {custom object pk, ...}} from "<cot id>:<field id>:<pk>" checkbox values, skipping malformed ones."""
+    selection = defaultdict(set)
+    for value in values:
+        try:
+            _cot_id, field_id, pk = (int(part) for part in value.split(":"))
+        except ValueError:
+            continue
+        selection[field_id].add(pk)
+    return dict(selection)
+
+
+@contextmanager
+def _changelog_suspended():
+    """Make NetBox's per-object changelog and event signal handlers skip the enclosed writes."""
+    from netbox.context import current_request
+
+    token = current_request.set(None)
+    try:
+        yield
+    finally:
+        current_request.reset(token)
+
+
+def _record(request, objects, action, event_type, changes, events):
+    """
+    Collect an ObjectChange and an event for each object (written after the transaction's
+    queries). bulk_create skips ObjectChange.save(), so the fields it fills are set here.
+    """
+    for obj in objects:
+        change = obj.to_objectchange(action)
+        change.user = request.user
+        change.user_name = request.user.username
+        change.object_repr = change.object_repr or str(obj)[:200]
+        change.request_id = getattr(request, "id", None)
+        changes.append(change)
+        events.append((obj, event_type))
+
+
+def _changed_objects(model, objects):
+    """Re-read `objects` after an update, carrying over their pre-change snapshots."""
+    fresh = model.objects.filter(pk__in=[obj.pk for obj in objects]).prefetch_related("tags").in_bulk()
+    result = []
+    for obj in objects:
+        if (updated := fresh.get(obj.pk)) is not None:
+            updated._prechange_snapshot = obj._prechange_snapshot
+            result.append(updated)
+    return result
+
+
+def _resync_index(objects):
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        for obj in objects:
+            reference_index.sync_custom_object(obj)
+
+
+def _set_tags(model, objects, tags, add):
+    from extras.models import TaggedItem
+
+    content_type = ContentType.objects.get_for_model(model)
+    pks = [obj.pk for obj in objects]
+    if add:
+        TaggedItem.objects.bulk_create(
+            [TaggedItem(tag=tag, content_type=content_type, object_id=pk) for pk in pks for tag in tags],
+            ignore_conflicts=True,
+        )
+    else:
+        TaggedItem.objects.filter(content_type=content_type, object_id__in=pks, tag__in=tags).delete()
+
+
+def uncleared_fields(reference_fields, selection):
+    """
+    The selected fields whose reference "clear_reference" leaves in place: required
+    fields, which clearing could leave empty (NULL, or no MULTIOBJECT value left).
+    """
+    return [field for field in reference_fields if field.pk in selection and field.required]
+
+
+def _clear_reference(instance, model, field, objects):
+    """Remove the reference from `objects` to `instance` through `field`; returns the number of references removed."""
+    pks = [obj.pk for obj in objects]
+    if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+        removed = model.objects.filter(pk__in=pks, **{f"{field.name}_id": instance.pk}).update(**{field.name: None})
+    else:
+        through = model._meta.get_field(field.name).remote_field.through
+        removed, _deleted = through.objects.filter(source_id__in=pks, target_id=instance.pk).delete()
+    if removed and get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        parent_key = (ContentType.objects.get_for_model(instance).pk, instance.pk)
+        counters.apply_deltas(field.custom_object_type_id, {parent_key: -removed})
+    return removed
+
+
+def apply(request, instance, reference_fields, action, selection, tags=()):
+    """
+    Run `action` on the selected custom objects referencing `instance`.
+
+    `reference_fields` are the fields pointing at `instance`'s model (selections naming any
+    other field are ignored; "clear_reference" also ignores required fields, see
+    uncleared_fields()). Returns the number of custom objects affected.
+    """
+    from core.choices import ObjectChangeActionChoices
+    from core.events import OBJECT_DELETED, OBJECT_UPDATED
+    from core.models import ObjectChange
+    from extras.events import enqueue_event
+    from netbox.context import events_queue
+
+    fields = {field.pk: field for field in reference_fields}
+    if action == "clear_reference":
+        for field in uncleared_fields(reference_fields, selection):
+            del fields[field.pk]
+    permission = "delete" if action == "delete" else "change"
+    changes, events = [], []
+    affected = set()
+
+    with transaction.atomic():
+        for field_id, pks in selection.items():
+            if (field := fields.get(field_id)) is None:
+                continue
+            try:
+                model = field.custom_object_type.get_model()
+            except Exception:
+                logger.exception("Could not get model for CustomObjectType %s", field.custom_object_type_id)
+                continue
+
+            objects = list(
+                model.objects.restrict(request.user, permission)
+                .filter(pk__in=pks, **{reference_lookup(field): instance.pk})
+                .distinct()
+                .prefetch_related("tags")
+            )
+            if action != "clear_reference":
+                # An object selected through several fields is deleted/tagged once
+                objects = [obj for obj in objects if (field.custom_object_type_id, obj.pk) not in affected]
+            if not objects:
+                continue
+            affected.update((field.custom_object_type_id, obj.pk) for obj in objects)
+
+            if action == "delete":
+                # The delete ObjectChange carries the object's last state as prechange_data
+                for obj in objects:
+                    obj.snapshot()
+                _record(request, objects, ObjectChangeActionChoices.ACTION_DELETE, OBJECT_DELETED, changes, events)
+                with _changelog_suspended():
+                    model.objects.filter(pk__in=[obj.pk for obj in objects]).delete()
+                continue
+
+            for obj in objects:
+                obj.snapshot()
+            with _changelog_suspended():
+                if action == "clear_reference":
+                    _clear_reference(instance, model, field, objects)
+                else:
+                    _set_tags(model, objects, tags, add=action == "add_tags")
+                model.objects.filter(pk__in=[obj.pk for obj in objects]).update(last_updated=timezone.now())
+            updated = _changed_objects(model, objects)
+            _resync_index(updated)
+            _record(request, updated, ObjectChangeActionChoices.ACTION_UPDATE, OBJECT_UPDATED, changes, events)
+
+        ObjectChange.objects.bulk_create(changes)
+
+    queue = events_queue.get()
+    for obj, event_type in events:
+        enqueue_event(queue, obj, request, event_type)
+    events_queue.set(queue)
+    return len(affected)
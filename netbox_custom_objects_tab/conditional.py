@@ -0,0 +1,163 @@
+"""
+Conditional GET for the combined and typed tabs (`conditional_get` setting).
+
+Before building any rows, the views compute an ETag from cheap inputs: the parent
+object, the user's permissions and table preferences, the query string and HTMX
+headers, per Custom Object Type MAX(last_updated) / COUNT of the referencing custom
+objects, each type's schema version, and each type's m2m version. When the browser
+(or HTMX) revalidates with a matching If-None-Match, a 304 is returned without
+materializing rows or rendering templates.
+
+Tag and MULTIOBJECT changes do not touch last_updated, so the m2m_changed handler
+(signals.handle_m2m_version) replaces a per-type token in the Django cache instead.
+"""
+
+import hashlib
+import json
+import uuid
+from collections import defaultdict
+from importlib.metadata import version
+
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db.models import Count, Max, Q
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from netbox.plugins import get_plugin_config
+
+from . import reference_index
+from .references import reference_lookup
+from .routing import read_alias, using
+
+# Templates change between releases; a new version invalidates every ETag and row fragment.
+VERSION = version("netbox-custom-objects-tab")
+
+# Request headers that select which template (full page or partial) is rendered.
+_VARY_HEADERS = ("Cookie", "HX-Request", "HX-Boosted", "HX-Target")
+
+
+def permission_signature(user):
+    """Stable hash of everything that decides what `user` may see."""
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.is_superuser:
+        return "superuser"
+    from netbox.authentication import ObjectPermissionBackend
+
+    # {permission name: [constraints]}, cached on the user by NetBox
+    permissions = ObjectPermissionBackend().get_all_permissions(user)
+    return hashlib.sha256(json.dumps(permissions, sort_keys=True, default=str).encode()).hexdigest()
+
+
+def _m2m_version_key(custom_object_type_id):
+    return f"netbox_custom_objects_tab:m2m_version:{custom_object_type_id}"
+
+
+def bump_m2m_version(custom_object_type_id):
+    """Invalidate the ETags of every tab listing custom objects of this type."""
+    cache.set(_m2m_version_key(custom_object_type_id), uuid.uuid4().hex, None)
+
+
+def m2m_versions(custom_object_type_ids):
+    """{custom_object_type_id: token} for the types whose tags or MULTIOBJECT values changed."""
+    keys = {_m2m_version_key(cot_id): cot_id for cot_id in custom_object_type_ids}
+    return {keys[key]: token for key, token in cache.get_many(list(keys)).items()}
+
+
+def schema_version(custom_object_type):
+    """Changes whenever the Custom Object Type's fields are edited."""
+    return str(getattr(custom_object_type, "cache_timestamp", None) or custom_object_type.last_updated)
+
+
+def is_enabled(request):
+    """
+    True when the response to `request` may be answered with a 304.
+
+    Requests with queued flash messages are always rendered, otherwise the messages
+    would be consumed by a later request instead of being shown.
+    """
+    if request.method not in ("GET", "HEAD"):
+        return False
+    if not get_plugin_config("netbox_custom_objects_tab", "conditional_get"):
+        return False
+    return not len(get_messages(request))
+
+
+def combined_state(instance, fields):
+    """
+    Per Custom Object Type (schema version, m2m version, MAX(last_updated), COUNT) of
+    the custom objects referencing `instance` through `fields` — one aggregate query
+    per type, or a single grouped query against the reference index.
+    """
+    fields_by_type = defaultdict(list)
+    for field in fields:
+        fields_by_type[field.custom_object_type].append(field)
+
+    versions = m2m_versions(custom_object_type.pk for custom_object_type in fields_by_type)
+    state = {
+        custom_object_type.pk: {
+            "schema": schema_version(custom_object_type),
+            "m2m": versions.get(custom_object_type.pk),
+            "fields": sorted((field.pk, field.name, field.type) for field in type_fields),
+        }
+        for custom_object_type, type_fields in fields_by_type.items()
+    }
+
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        rows = (
+            reference_index.parent_entries(instance._meta.model, instance.pk)
+            .order_by()
+            .values("cot_id")
+            .annotate(latest=Max("last_updated"), n=Count("pk"))
+            .values_list("cot_id", "latest", "n")
+        )
+        for cot_id, latest, n in rows:
+            state.setdefault(cot_id, {}).update(latest=latest, n=n)
+        return state
+
+    for custom_object_type, type_fields in fields_by_type.items():
+        try:
+            model = custom_object_type.get_model()
+        except Exception:
+            # The view logs the failure; an unreadable type simply has no data state.
+            continue
+        q_filter = Q()
+        for field in type_fields:
+            q_filter |= Q(**{reference_lookup(field): instance.pk})
+        state[custom_object_type.pk].update(typed_state(using(model.objects, read_alias()).filter(q_filter)))
+    return state
+
+
+def typed_state(queryset):
+    """MAX(last_updated) and COUNT of the custom objects in `queryset`, in one query."""
+    return queryset.order_by().aggregate(latest=Max("last_updated"), n=Count("pk", distinct=True))
+
+
+def make_etag(request, instance, state):
+    """Return a quoted ETag for rendering `instance`'s tab to `request`, given its data `state`."""
+    user = request.user
+    userconfig = getattr(user, "config", None)
+    parts = {
+        "version": VERSION,
+        "parent": [instance._meta.label_lower, instance.pk, getattr(instance, "last_updated", None)],
+        "user": [user.pk, permission_signature(user), getattr(userconfig, "data", None)],
+        "query": sorted(request.GET.lists()),
+        "headers": [request.headers.get(header) for header in _VARY_HEADERS[1:]],
+        "state": state,
+    }
+    digest = hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+    return f'"{digest}"'
+
+
+def not_modified(request, etag):
+    """Return a 304 response when the request's If-None-Match matches `etag`, else None."""
+    response = get_conditional_response(request, etag=etag)
+    return add_etag(response, etag) if response is not None else None
+
+
+def add_etag(response, etag):
+    """Attach `etag` (if any) and force revalidation on every use of the cached copy."""
+    if etag:
+        response.headers["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, _VARY_HEADERS)
+    return response
@@ -0,0 +1,297 @@
+"""
+Denormalized per-parent reference counters (`reference_counters` setting).
+
+One ReferenceCounter row per (parent object, Custom Object Type) holds the badge
+number, so the combined badge is a single indexed SUM and a typed badge a single
+unique-key lookup. The signal handlers apply +/- deltas on custom object create,
+update (OBJECT fields re-pointed), delete and MULTIOBJECT m2m_changed; reconcile()
+recomputes the counts from the dynamic tables and repairs any drift.
+"""
+
+import logging
+from collections import Counter, defaultdict
+
+from django.contrib.contenttypes.models import ContentType
+from django.core.exceptions import FieldDoesNotExist
+from django.db import transaction
+from django.db.models import Count, F, Sum
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObjectTypeField
+
+from .reference_index import _REFERENCE_FIELD_TYPES, _fields_for_type, _iter_references
+from .routing import read_alias, using
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+# Instance attributes carrying references captured in pre_save / pre_delete
+_OLD_REFERENCES = "_custom_objects_tab_old_references"
+_DELETED_REFERENCES = "_custom_objects_tab_deleted_references"
+# Instance attribute carrying {through model: pks actually linked} captured in pre_remove / pre_clear
+_REMOVED_LINKS = "_custom_objects_tab_removed_links"
+
+
+def _counter_model():
+    from .models import ReferenceCounter
+
+    return ReferenceCounter
+
+
+def _object_references(obj, fields):
+    """Counter of (parent_ct_id, parent_pk) over `obj`'s OBJECT fields."""
+    object_fields = [field for field in fields if field.type == CustomFieldTypeChoices.TYPE_OBJECT]
+    return Counter(
+        (field.related_object_type_id, parent_pk) for field, parent_pk in _iter_references(obj, object_fields)
+    )
+
+
+def apply_deltas(custom_object_type_id, deltas):
+    """Add `deltas` ({(parent_ct_id, parent_pk): n}) to the counters of one Custom Object Type."""
+    ReferenceCounter = _counter_model()
+    for (parent_ct_id, parent_pk), delta in deltas.items():
+        if not delta:
+            continue
+        lookup = {"parent_ct_id": parent_ct_id, "parent_pk": parent_pk, "cot_id": custom_object_type_id}
+        if ReferenceCounter.objects.filter(**lookup).update(count=F("count") + delta):
+            continue
+        # First reference to this parent: create the row (get_or_create handles a concurrent insert)
+        counter, _created = ReferenceCounter.objects.get_or_create(**lookup, defaults={"count": 0})
+        ReferenceCounter.objects.filter(pk=counter.pk).update(count=F("count") + delta)
+
+
+def capture_old_references(obj):
+    """pre_save: remember where `obj`'s OBJECT fields pointed before this save."""
+    if obj._state.adding or obj.pk is None:
+        return
+    fields = [f for f in _fields_for_type(obj.custom_object_type_id) if f.type == CustomFieldTypeChoices.TYPE_OBJECT]
+    old = Counter()
+    if fields:
+        row = type(obj).objects.filter(pk=obj.pk).values(*(f"{f.name}_id" for f in fields)).first() or {}
+        old = Counter(
+            (field.related_object_type_id, row[f"{field.name}_id"])
+            for field in fields
+            if row.get(f"{field.name}_id") is not None
+        )
+    setattr(obj, _OLD_REFERENCES, old)
+
+
+def custom_object_saved(obj, created):
+    """post_save: move OBJECT-field counts from the old parents to the new ones."""
+    fields = _fields_for_type(obj.custom_object_type_id)
+    new = _object_references(obj, fields)
+    old = Counter() if created else getattr(obj, _OLD_REFERENCES, None)
+    if old is None:
+        # Saved without a pre_save capture (e.g. handlers connected mid-request); reconcile fixes it
+        return
+    deltas = Counter(new)
+    deltas.subtract(old)
+    apply_deltas(obj.custom_object_type_id, deltas)
+
+
+def capture_deleted_references(obj):
+    """pre_delete: collect every reference, MULTIOBJECT through rows vanish with the object."""
+    fields = _fields_for_type(obj.custom_object_type_id)
+    refs = Counter((field.related_object_type_id, parent_pk) for field, parent_pk in _iter_references(obj, fields))
+    setattr(obj, _DELETED_REFERENCES, refs)
+
+
+def custom_object_deleted(obj):
+    """post_delete: release the references captured in pre_delete."""
+    refs = getattr(obj, _DELETED_REFERENCES, None)
+    if refs:
+        apply_deltas(obj.custom_object_type_id, {key: -n for key, n in refs.items()})
+
+
+def multiobject_changed(sender, instance, action, reverse, model, pk_set):
+    """m2m_changed (post_add and pre/post_remove, pre/post_clear) on a MULTIOBJECT through table."""
+    try:
+        sender._meta.get_field("target")
+    except (AttributeError, FieldDoesNotExist):
+        # Not a MULTIOBJECT through table (e.g. tags)
+        return
+    if action in ("pre_remove", "pre_clear"):
+        # Django sends every pk asked to be removed, linked or not, and no pks at all for a
+        # clear: remember the links that actually exist for post_remove / post_clear
+        own, other = ("target_id", "source_id") if reverse else ("source_id", "target_id")
+        lookup = {own: instance.pk}
+        if action == "pre_remove":
+            lookup[f"{other}__in"] = pk_set or ()
+        links = sender.objects.filter(**lookup).values_list(other, flat=True)
+        instance.__dict__.setdefault(_REMOVED_LINKS, {})[sender] = set(links)
+        return
+    if action in ("post_remove", "post_clear"):
+        # Without a pre_* capture (handlers connected mid-request) fall back to pk_set
+        pk_set = instance.__dict__.get(_REMOVED_LINKS, {}).pop(sender, pk_set)
+    if not pk_set:
+        return
+    sign = 1 if action == "post_add" else -1
+    if reverse:
+        # instance is the parent object, pk_set the custom objects
+        parent_key = (ContentType.objects.get_for_model(instance).pk, instance.pk)
+        apply_deltas(model.custom_object_type_id, {parent_key: sign * len(pk_set)})
+    else:
+        parent_ct_id = ContentType.objects.get_for_model(model).pk
+        apply_deltas(instance.custom_object_type_id, {(parent_ct_id, pk): sign for pk in pk_set})
+
+
+def delete_parent(parent):
+    """Drop the counters of a deleted parent object."""
+    _counter_model().objects.filter(
+        parent_ct=ContentType.objects.get_for_model(parent),
+        parent_pk=parent.pk,
+    ).delete()
+
+
+def count_for_parent(instance, custom_object_type_id=None):
+    """Badge number for `instance`: one unique-key lookup per type, or an indexed SUM over all types."""
+    qs = using(_counter_model().objects, read_alias()).filter(
+        parent_ct=ContentType.objects.get_for_model(instance._meta.model),
+        parent_pk=instance.pk,
+    )
+    if custom_object_type_id is not None:
+        return qs.filter(cot_id=custom_object_type_id).values_list("count", flat=True).first() or 0
+    return qs.aggregate(total=Sum("count"))["total"] or 0
+
+
+def parent_counters(model_class, parent_pk):
+    """Non-zero counter rows of the model_class object `parent_pk` (a value or OuterRef)."""
+    return using(_counter_model().objects, read_alias()).filter(
+        parent_ct=ContentType.objects.get_for_model(model_class),
+        parent_pk=parent_pk,
+        count__gt=0,
+    )
+
+
+def count_for_parents(model_class, parent_filters, by_type=False):
+    """
+    Counter-backed equivalent of counts.count_linked_custom_objects(), for each value
+    of `parent_filters` (pk lists or a pk subquery).
+    """
+    content_type = ContentType.objects.get_for_model(model_class)
+    db = read_alias()
+    totals = defaultdict(dict) if by_type else defaultdict(int)
+    for parent_filter in parent_filters:
+        rows = (
+            using(_counter_model().objects, db)
+            .filter(parent_ct=content_type, parent_pk__in=parent_filter, count__gt=0)
+            .values_list("parent_pk", "cot__slug", "count")
+        )
+        for parent_pk, slug, n in rows:
+            if by_type:
+                totals[parent_pk][slug] = n
+            else:
+                totals[parent_pk] += n
+    return dict(totals)
+
+
+def top_parents(limit, content_type_ids=None, custom_object_type_ids=None):
+    """Counter-backed [(parent_ct_id, parent_pk, count)] of the `limit` most referenced parents."""
+    qs = using(_counter_model().objects, read_alias()).filter(count__gt=0)
+    if content_type_ids:
+        qs = qs.filter(parent_ct__in=content_type_ids)
+    if custom_object_type_ids:
+        qs = qs.filter(cot__in=custom_object_type_ids)
+    rows = (
+        qs.order_by()
+        .values("parent_ct_id", "parent_pk")
+        .annotate(total=Sum("count"))
+        .order_by("-total", "parent_ct_id", "parent_pk")
+        .values_list("parent_ct_id", "parent_pk", "total")
+    )
+    return list(rows[:limit])
+
+
+def _expected_counts(fields, batch_size):
+    """{(parent_ct_id, parent_pk): count} for one Custom Object Type, from grouped queries per field."""
+    expected = Counter()
+    for field in fields:
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception("Could not get model for CustomObjectType %s", field.custom_object_type_id)
+            continue
+        lookup = f"{field.name}_id" if field.type == CustomFieldTypeChoices.TYPE_OBJECT else field.name
+        rows = (
+            model.objects.filter(**{f"{lookup}__isnull": False})
+            .order_by()
+            .values(lookup)
+            .annotate(n=Count("pk"))
+            .values_list(lookup, "n")
+        )
+        for parent_pk, n in rows.iterator(chunk_size=batch_size):
+            expected[field.related_object_type_id, parent_pk] += n
+    return expected
+
+
+def reconcile(batch_size=1000, fix=True, log=None):
+    """
+    Recompute every counter from the dynamic tables, one Custom Object Type at a time,
+    and (unless fix is false) repair the rows that drifted.
+
+    Returns {"checked", "missing", "wrong", "stale"} totals; `log` receives one line
+    per drifted Custom Object Type.
+    """
+    ReferenceCounter = _counter_model()
+    fields_by_type = defaultdict(list)
+    for field in CustomObjectTypeField.objects.filter(
+        type__in=_REFERENCE_FIELD_TYPES,
+        related_object_type__isnull=False,
+    ).select_related("custom_object_type"):
+        fields_by_type[field.custom_object_type].append(field)
+
+    totals = Counter(checked=0, missing=0, wrong=0, stale=0)
+    for custom_object_type, fields in fields_by_type.items():
+        expected = _expected_counts(fields, batch_size)
+        upserts, stale_pks = [], []
+        drift = Counter()
+
+        current = ReferenceCounter.objects.filter(cot=custom_object_type).values_list(
+            "pk", "parent_ct_id", "parent_pk", "count"
+        )
+        seen = set()
+        for pk, parent_ct_id, parent_pk, count in current.iterator(chunk_size=batch_size):
+            key = (parent_ct_id, parent_pk)
+            seen.add(key)
+            n = expected.get(key, 0)
+            if n == count:
+                continue
+            if n:
+                drift["wrong"] += 1
+                upserts.append(
+                    ReferenceCounter(parent_ct_id=parent_ct_id, parent_pk=parent_pk, cot=custom_object_type, count=n)
+                )
+            elif count:
+                drift["stale"] += 1
+                stale_pks.append(pk)
+        for (parent_ct_id, parent_pk), n in expected.items():
+            if (parent_ct_id, parent_pk) not in seen:
+                drift["missing"] += 1
+                upserts.append(
+                    ReferenceCounter(parent_ct_id=parent_ct_id, parent_pk=parent_pk, cot=custom_object_type, count=n)
+                )
+
+        totals["checked"] += len(expected)
+        totals.update(drift)
+        if drift and log:
+            log(f"{custom_object_type}: {drift['missing']} missing, {drift['wrong']} wrong, {drift['stale']} stale")
+        if fix and (upserts or stale_pks):
+            with transaction.atomic():
+                ReferenceCounter.objects.bulk_create(
+                    upserts,
+                    batch_size=batch_size,
+                    update_conflicts=True,
+                    unique_fields=("parent_ct", "parent_pk", "cot"),
+                    update_fields=("count",),
+                )
+                for start in range(0, len(stale_pks), batch_size):
+                    ReferenceCounter.objects.filter(pk__in=stale_pks[start : start + batch_size]).delete()
+
+    # Counters of Custom Object Types that no longer reference anything
+    orphans = ReferenceCounter.objects.exclude(cot__in=[cot.pk for cot in fields_by_type]).filter(count__gt=0)
+    orphan_count = orphans.count()
+    totals["stale"] += orphan_count
+    if orphan_count and log:
+        log(f"{orphan_count} stale counters of Custom Object Types without reference fields")
+    if fix and orphan_count:
+        orphans.delete()
+
+    return dict(totals)
@@ -0,0 +1,232 @@
+"""
+Bulk reference counts for many parent objects at once.
+
+    from netbox_custom_objects_tab.counts import count_linked_custom_objects
+
+    count_linked_custom_objects(Device, Device.objects.filter(site__slug="prg1"))
+    # {12: 3, 57: 1}
+
+Counts match the combined tab badge (one per custom object and referencing field)
+and are computed with one grouped query per referencing field, or a single grouped
+query against the reference index when `reference_index` is enabled.
+
+top_referenced() ranks the most referenced parent objects of any model (the
+dashboard widget) with a single grouped query, and reference_exists_expression()
+backs the "has custom objects" list filters with EXISTS subqueries.
+"""
+
+import logging
+from collections import defaultdict
+from itertools import islice
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import Count, Exists, F, Func, IntegerField, OuterRef, Q, QuerySet, Subquery, Value
+from extras.choices import CustomFieldTypeChoices
+from netbox.plugins import get_plugin_config
+
+from . import counters, reference_index
+from .references import get_reference_fields, reference_lookup
+from .routing import read_alias, using
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+# Upper bound on parent pks bound into a single IN (...) clause.
+_PK_CHUNK_SIZE = 10000
+
+
+def _parent_filters(parents):
+    """Yield values usable in a `<lookup>__in` filter: the queryset itself, or chunks of pks."""
+    if isinstance(parents, QuerySet):
+        yield parents.order_by().values("pk")
+        return
+    parents = iter(parents)
+    while chunk := list(islice(parents, _PK_CHUNK_SIZE)):
+        yield chunk
+
+
+def count_linked_custom_objects(model_class, parents, by_type=False):
+    """
+    Count the custom objects referencing each of `parents` (a QuerySet of model_class
+    or an iterable of pks).
+
+    Returns {parent_pk: count}, or {parent_pk: {custom_object_type_slug: count}} when
+    by_type is true. Parents without any reference are omitted.
+    """
+    if not isinstance(parents, QuerySet):
+        # Materialize once: the pks are re-read for every referencing field
+        parents = list(parents)
+
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        return counters.count_for_parents(model_class, _parent_filters(parents), by_type=by_type)
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        return reference_index.count_for_parents(model_class, _parent_filters(parents), by_type=by_type)
+
+    db = read_alias()
+    totals = defaultdict(lambda: defaultdict(int)) if by_type else defaultdict(int)
+    for field in get_reference_fields(model_class):
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+
+        lookup = reference_lookup(field)
+        for parent_filter in _parent_filters(parents):
+            rows = (
+                using(model.objects, db)
+                .filter(**{f"{lookup}__in": parent_filter})
+                .order_by()
+                .values(lookup)
+                .annotate(n=Count("pk"))
+                .values_list(lookup, "n")
+            )
+            for parent_pk, n in rows:
+                if by_type:
+                    totals[parent_pk][field.custom_object_type.slug] += n
+                else:
+                    totals[parent_pk] += n
+
+    if by_type:
+        return {pk: dict(per_type) for pk, per_type in totals.items()}
+    return dict(totals)
+
+
+def _subquery_count(queryset):
+    """
+    Wrap `queryset` (already correlated via OuterRef) as a scalar COUNT subquery.
+    COUNT is applied as a plain Func so Django adds no GROUP BY clause.
+    """
+    return Subquery(
+        queryset.order_by().annotate(n=Func(F("pk"), function="COUNT")).values("n"),
+        output_field=IntegerField(),
+    )
+
+
+def reference_count_expression(model_class, outer_ref="pk"):
+    """
+    Return a SQL expression counting the custom objects that reference the row of
+    model_class identified by OuterRef(outer_ref): the sum of one correlated COUNT
+    subquery per referencing field (a single subquery with the reference index).
+
+    Suitable for .annotate() and .order_by() on model_class querysets.
+    """
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        return _subquery_count(reference_index.parent_entries(model_class, OuterRef(outer_ref)))
+
+    expression = None
+    for field in get_reference_fields(model_class):
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+        subquery = _subquery_count(model.objects.filter(**{reference_lookup(field): OuterRef(outer_ref)}))
+        expression = subquery if expression is None else expression + subquery
+
+    return expression if expression is not None else Value(0, output_field=IntegerField())
+
+
+def reference_exists_expression(model_class, custom_object_type_slugs=None, outer_ref="pk"):
+    """
+    Return a Q that is true for the rows of model_class (identified by OuterRef(outer_ref))
+    referenced by at least one custom object, optionally only by custom objects of the
+    Custom Object Types with `custom_object_type_slugs`.
+
+    Each referencing FK column or MULTIOBJECT through table gets its own EXISTS
+    subquery on its indexed reference column (a single one with the counters or the
+    reference index), so the database stops at the first match. Negate it with ~ for
+    "has no custom objects".
+    """
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        qs = counters.parent_counters(model_class, OuterRef(outer_ref))
+        if custom_object_type_slugs:
+            qs = qs.filter(cot__slug__in=custom_object_type_slugs)
+        return Q(Exists(qs))
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        qs = reference_index.parent_entries(model_class, OuterRef(outer_ref))
+        if custom_object_type_slugs:
+            qs = qs.filter(cot__slug__in=custom_object_type_slugs)
+        return Q(Exists(qs))
+
+    condition = None
+    for field in get_reference_fields(model_class):
+        if custom_object_type_slugs and field.custom_object_type.slug not in custom_object_type_slugs:
+            continue
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+        if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            qs = model.objects.filter(**{f"{field.name}_id": OuterRef(outer_ref)})
+        else:
+            # Probe the through table directly, without joining the custom object table
+            through = model._meta.get_field(field.name).remote_field.through
+            qs = through.objects.filter(target_id=OuterRef(outer_ref))
+        exists = Q(Exists(qs))
+        condition = exists if condition is None else condition | exists
+
+    # No referencing field: matches nothing (and its negation everything)
+    return condition if condition is not None else Q(pk__in=[])
+
+
+def _top_referenced_sql(limit, content_type_ids=None, custom_object_type_ids=None):
+    """
+    [(parent_ct_id, parent_pk, count)] of the `limit` most referenced parents, from one
+    statement: a GROUP BY per reference column (FK column or MULTIOBJECT through table
+    `target_id`), combined with UNION ALL and summed per parent.
+    """
+    from .index_audit import reference_columns
+
+    connection = connections[read_alias() or DEFAULT_DB_ALIAS]
+    quote = connection.ops.quote_name
+    parts, params = [], []
+    for column in reference_columns():
+        field = column["field"]
+        if content_type_ids and field.related_object_type_id not in content_type_ids:
+            continue
+        if custom_object_type_ids and field.custom_object_type_id not in custom_object_type_ids:
+            continue
+        name = quote(column["column"])
+        parts.append(
+            f"SELECT %s AS parent_ct, {name} AS parent_pk, COUNT(*) AS n FROM {quote(column['table'])} "
+            f"WHERE {name} IS NOT NULL GROUP BY {name}"
+        )
+        params.append(field.related_object_type_id)
+    if not parts:
+        return []
+
+    sql = (
+        f"SELECT parent_ct, parent_pk, SUM(n) AS total FROM ({' UNION ALL '.join(parts)}) AS refs "
+        "GROUP BY parent_ct, parent_pk ORDER BY total DESC, parent_ct, parent_pk LIMIT %s"
+    )
+    with connection.cursor() as cursor:
+        cursor.execute(sql, [*params, limit])
+        return [(ct_id, pk, int(total)) for ct_id, pk, total in cursor.fetchall()]
+
+
+def top_referenced(limit=10, content_type_ids=None, custom_object_type_ids=None):
+    """
+    Return [(parent_ct_id, parent_pk, count)] for the `limit` parent objects referenced
+    by the most custom objects, optionally only parents of `content_type_ids` and
+    references from `custom_object_type_ids`.
+
+    One grouped query answers it (counters, index, or UNION ALL over the reference
+    columns). The result is not permission-restricted; see widgets.visible_ranking().
+    """
+    content_type_ids = sorted(content_type_ids or ())
+    custom_object_type_ids = sorted(custom_object_type_ids or ())
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        return counters.top_parents(limit, content_type_ids, custom_object_type_ids)
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        return reference_index.top_parents(limit, content_type_ids, custom_object_type_ids)
+    return _top_referenced_sql(limit, content_type_ids, custom_object_type_ids)
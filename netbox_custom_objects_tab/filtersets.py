@@ -0,0 +1,68 @@
+import logging
+
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from netbox.plugins import get_plugin_config
+
+from . import counts
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+_FILTER_NAMES = ("has_custom_objects", "has_custom_object_type")
+
+
+def filter_has_custom_objects(queryset, name, value):
+    """?has_custom_objects=true / false: parents with / without any custom object referencing them."""
+    if value is None:
+        return queryset
+    condition = counts.reference_exists_expression(queryset.model)
+    return queryset.filter(condition if value else ~condition)
+
+
+def filter_has_custom_object_type(queryset, name, value):
+    """?has_custom_object_type=<slug> (repeatable): parents referenced by a custom object of one of the types."""
+    slugs = [slug for slug in value or () if slug]
+    if not slugs:
+        return queryset
+    return queryset.filter(counts.reference_exists_expression(queryset.model, custom_object_type_slugs=slugs))
+
+
+def _get_filterset_class(model_class):
+    """Return the NetBox filterset for model_class (e.g. dcim.filtersets.DeviceFilterSet), or None."""
+    try:
+        return import_string(f"{model_class._meta.app_label}.filtersets.{model_class.__name__}FilterSet")
+    except ImportError:
+        return None
+
+
+def register_filters(model_classes):
+    """
+    Add the has_custom_objects and has_custom_object_type filters to the filterset of
+    every model in model_classes that has one: the list views and the REST API then
+    accept them, e.g. /dcim/devices/?has_custom_object_type=circuit-link.
+    """
+    if not get_plugin_config("netbox_custom_objects_tab", "list_filters"):
+        return
+
+    import django_filters
+    from utilities.filters import MultiValueCharFilter
+
+    for model_class in model_classes:
+        filterset_class = _get_filterset_class(model_class)
+        if filterset_class is None:
+            continue
+        if any(name in filterset_class.base_filters for name in _FILTER_NAMES):
+            logger.warning(
+                "netbox_custom_objects_tab: %s already has a custom objects filter — skipping",
+                filterset_class.__name__,
+            )
+            continue
+        filterset_class.base_filters["has_custom_objects"] = django_filters.BooleanFilter(
+            method=filter_has_custom_objects,
+            label=_("Has custom objects"),
+        )
+        filterset_class.base_filters["has_custom_object_type"] = MultiValueCharFilter(
+            method=filter_has_custom_object_type,
+            label=_("Has custom object of type (slug)"),
+        )
+        logger.debug("netbox_custom_objects_tab: registered custom objects filters on %s", filterset_class.__name__)
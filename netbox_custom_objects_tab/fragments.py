@@ -0,0 +1,88 @@
+"""
+Rendered-row fragment cache for the combined tab (`row_cache_timeout` setting).
+
+Each row of combined/tab_partial.html is rendered from combined/row.html and
+cached under a hash of everything the markup depends on: the custom object (type,
+pk, last_updated, display string, tags), its field and Value column, the visible
+columns and the user's permission signature. Saving a custom object or changing
+its tags changes the key, so repeat views only render rows that changed.
+"""
+
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.template.defaultfilters import urlencode
+from django.template.loader import get_template
+from django.utils.safestring import mark_safe
+from netbox.plugins import get_plugin_config
+
+from .conditional import VERSION, permission_signature
+
+ROW_TEMPLATE = "netbox_custom_objects_tab/combined/row.html"
+
+# Rendered in place of return_url, so one fragment serves every page and filter.
+_RETURN_URL_PLACEHOLDER = "__netbox_custom_objects_tab_return_url__"
+
+
+def _value_signature(value):
+    if value is None:
+        return None
+    related = value if isinstance(value, list) else [value]
+    return [(obj.pk, str(obj)) for obj in related]
+
+
+def _row_key(obj, field, value, display, columns, permissions):
+    custom_object_type = field.custom_object_type
+    parts = [
+        VERSION,
+        obj.custom_object_type_id,
+        obj.pk,
+        getattr(obj, "last_updated", None),
+        display,
+        [(t.pk, t.name, t.color) for t in obj.tags.all()],
+        [field.pk, str(field), custom_object_type.slug, str(custom_object_type)],
+        _value_signature(value),
+        columns,
+        permissions,
+    ]
+    digest = hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+    return f"netbox_custom_objects_tab:row:{digest}"
+
+
+def render_rows(request, page_rows, selected_columns, return_url):
+    """
+    Return the HTML of every (obj, field, value, display) row in `page_rows`,
+    reading cached fragments in one round trip and rendering only the misses.
+    """
+    timeout = get_plugin_config("netbox_custom_objects_tab", "row_cache_timeout")
+    template = get_template(ROW_TEMPLATE)
+    base_context = {
+        "request": request,
+        "selected_columns": selected_columns,
+        "return_url": _RETURN_URL_PLACEHOLDER,
+    }
+
+    keys = []
+    cached = {}
+    if timeout:
+        columns = sorted(selected_columns)
+        permissions = permission_signature(request.user)
+        keys = [_row_key(*row, columns, permissions) for row in page_rows]
+        cached = cache.get_many(keys)
+
+    fragments = []
+    to_cache = {}
+    for i, (obj, field, value, display) in enumerate(page_rows):
+        key = keys[i] if keys else None
+        html = cached.get(key) if key else None
+        if html is None:
+            html = template.render({**base_context, "obj": obj, "field": field, "value": value, "display": display})
+            if key:
+                to_cache[key] = html
+        fragments.append(html)
+    if to_cache:
+        cache.set_many(to_cache, timeout)
+
+    quoted_return_url = urlencode(return_url)
+    return [mark_safe(html.replace(_RETURN_URL_PLACEHOLDER, quoted_return_url)) for html in fragments]
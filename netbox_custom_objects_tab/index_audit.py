@@ -0,0 +1,113 @@
+"""
+Index audit for the reference columns the tabs and badges filter on.
+
+Every OBJECT field is queried as `<field>_id = parent_pk` on the custom object's
+dynamic table, and every MULTIOBJECT field as `target_id = parent_pk` on its
+generated through table. audit() maps each of those columns to the index covering
+it (an index whose first column it is), with usage statistics and table sizes on
+PostgreSQL, and create_missing() adds the missing ones.
+"""
+
+import hashlib
+import logging
+
+from django.db import DEFAULT_DB_ALIAS, connections
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObjectTypeField
+
+from .reference_index import _REFERENCE_FIELD_TYPES
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+
+def reference_columns():
+    """Yield {"field", "table", "column"} for every OBJECT/MULTIOBJECT field the plugin filters on."""
+    fields = CustomObjectTypeField.objects.filter(
+        type__in=_REFERENCE_FIELD_TYPES,
+        related_object_type__isnull=False,
+    ).select_related("custom_object_type")
+    for field in fields:
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception("Could not get model for CustomObjectType %s", field.custom_object_type_id)
+            continue
+        model_field = model._meta.get_field(field.name)
+        if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            yield {"field": field, "table": model._meta.db_table, "column": model_field.column}
+        else:
+            through = model_field.remote_field.through
+            yield {"field": field, "table": through._meta.db_table, "column": through._meta.get_field("target").column}
+
+
+def covering_index(constraints, column):
+    """Name of the first index (or unique/primary key constraint) leading with `column`, else None."""
+    for name, info in sorted(constraints.items()):
+        if (info.get("index") or info.get("unique") or info.get("primary_key")) and info["columns"][:1] == [column]:
+            return name
+    return None
+
+
+def _postgres_stats(cursor, tables):
+    """({table: total size in bytes}, {index name: idx_scan}) for `tables`."""
+    cursor.execute(
+        "SELECT relname, pg_total_relation_size(relid) FROM pg_stat_user_tables WHERE relname = ANY(%s)",
+        [tables],
+    )
+    sizes = dict(cursor.fetchall())
+    cursor.execute(
+        "SELECT indexrelname, idx_scan FROM pg_stat_user_indexes WHERE relname = ANY(%s)",
+        [tables],
+    )
+    return sizes, dict(cursor.fetchall())
+
+
+def audit(using=DEFAULT_DB_ALIAS):
+    """
+    Return reference_columns() with "index" (covering index name or None), "index_scans"
+    and "table_size" added; the statistics are None outside PostgreSQL.
+    """
+    connection = connections[using]
+    columns = list(reference_columns())
+    tables = sorted({column["table"] for column in columns})
+    with connection.cursor() as cursor:
+        constraints = {table: connection.introspection.get_constraints(cursor, table) for table in tables}
+        sizes, scans = _postgres_stats(cursor, tables) if connection.vendor == "postgresql" else ({}, {})
+    for column in columns:
+        column["index"] = covering_index(constraints[column["table"]], column["column"])
+        column["index_scans"] = scans.get(column["index"])
+        column["table_size"] = sizes.get(column["table"])
+    return columns
+
+
+def index_name(table, column):
+    """Deterministic index name within PostgreSQL's 63-character identifier limit."""
+    digest = hashlib.md5(f"{table}.{column}".encode(), usedforsecurity=False).hexdigest()[:8]
+    return f"{table[:30]}_{column[:15]}_{digest}_cot_idx"
+
+
+def create_index_sql(connection, table, column):
+    concurrently = " CONCURRENTLY" if connection.vendor == "postgresql" else ""
+    quote = connection.ops.quote_name
+    return (
+        f"CREATE INDEX{concurrently} IF NOT EXISTS {quote(index_name(table, column))} "
+        f"ON {quote(table)} ({quote(column)})"
+    )
+
+
+def create_missing(columns, using=DEFAULT_DB_ALIAS, log=None):
+    """
+    Create an index for every column in `columns` without one. On PostgreSQL the
+    statements use CONCURRENTLY, so they must run outside a transaction.
+    Returns the names of the indexes created.
+    """
+    connection = connections[using]
+    created = []
+    for table, column in sorted({(c["table"], c["column"]) for c in columns if c["index"] is None}):
+        sql = create_index_sql(connection, table, column)
+        if log:
+            log(sql)
+        with connection.cursor() as cursor:
+            cursor.execute(sql)
+        created.append(index_name(table, column))
+    return created
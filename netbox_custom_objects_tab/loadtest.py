@@ -0,0 +1,258 @@
+"""
+Load-test harness for the loadtest_custom_objects_tab management command.
+
+seed() creates dedicated Custom Object Types (slug prefix "loadtest-") with an OBJECT
+and a MULTIOBJECT field pointing at a parent model, and bulk-inserts custom objects
+spread over existing parent objects with a skewed, reproducible distribution: a few
+parents get most of the references, as in real inventories.
+
+plan() builds a request mix per parent — detail page (badges), combined tab, typed
+tabs, and HTMX partial requests with sort/filter/page/layout permutations — and run()
+replays it from concurrent client threads through the full Django stack in this
+process, as a threaded NetBox worker would serve it, recording latency and the
+number of database queries of every request. summarize() turns the results into
+throughput and p50/p95/p99 latency per endpoint.
+
+Queries are captured per client thread, so per-field queries run on the
+`fetch_concurrency` pool would be missed: run() serializes them while measuring.
+"""
+
+import math
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack, contextmanager
+from urllib.parse import urlencode
+
+from django.conf import settings
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections, transaction
+from django.test.utils import CaptureQueriesContext
+from django.urls import NoReverseMatch, reverse
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObjectTypeField
+
+SLUG_PREFIX = "loadtest-"
+
+# HTMX permutations requested against the combined tab of every parent
+_COMBINED_PARTIALS = (
+    ("sort", {"sort": "object"}),
+    ("sort_desc", {"sort": "type", "dir": "desc"}),
+    ("filter", {"q": "1"}),
+    ("page", {"page": "2"}),
+    ("per_page", {"per_page": "100", "sort": "field"}),
+    ("grouped", {"layout": "grouped"}),
+)
+_TYPED_PARTIALS = (
+    ("sort", {"sort": "-name"}),
+    ("page", {"page": "2"}),
+)
+
+
+def _skewed_parent(rng, parent_pks):
+    """A parent pk, the first parents drawn far more often (Pareto-like)."""
+    index = min(int(rng.paretovariate(1.2)) - 1, len(parent_pks) - 1)
+    return parent_pks[index]
+
+
+def seed_types():
+    from netbox_custom_objects.models import CustomObjectType
+
+    return CustomObjectType.objects.filter(slug__startswith=SLUG_PREFIX).order_by("slug")
+
+
+def seed(model_class, parent_pks, types=3, objects=2000, random_seed=1, batch_size=1000, log=None):
+    """
+    Create `types` load-test Custom Object Types referencing `model_class`, each with
+    `objects` custom objects over `parent_pks`. Returns the number of objects created.
+
+    Objects are bulk-inserted, so no signal handler runs: rebuild the reference index
+    and reconcile the counters afterwards when those settings are enabled.
+    """
+    from netbox_custom_objects.models import CustomObjectType
+
+    rng = random.Random(random_seed)
+    content_type = ContentType.objects.get_for_model(model_class)
+    created = 0
+    for n in range(1, types + 1):
+        slug = f"{SLUG_PREFIX}{n}"
+        with transaction.atomic():
+            custom_object_type = CustomObjectType.objects.create(
+                name=f"Load test {n}",
+                slug=slug,
+                verbose_name_plural=f"Load test {n} objects",
+            )
+            CustomObjectTypeField.objects.create(
+                custom_object_type=custom_object_type,
+                name="name",
+                label="Name",
+                type=CustomFieldTypeChoices.TYPE_TEXT,
+                primary=True,
+            )
+            for name, field_type in (
+                ("parent", CustomFieldTypeChoices.TYPE_OBJECT),
+                ("related", CustomFieldTypeChoices.TYPE_MULTIOBJECT),
+            ):
+                CustomObjectTypeField.objects.create(
+                    custom_object_type=custom_object_type,
+                    name=name,
+                    label=name.title(),
+                    type=field_type,
+                    related_object_type=content_type,
+                )
+
+        model = custom_object_type.get_model()
+        through = model._meta.get_field("related").remote_field.through
+        for start in range(0, objects, batch_size):
+            rows = [
+                model(name=f"{slug}-{i}", parent_id=_skewed_parent(rng, parent_pks))
+                for i in range(start, min(start + batch_size, objects))
+            ]
+            with transaction.atomic():
+                rows = model.objects.bulk_create(rows)
+                links = {(row.pk, _skewed_parent(rng, parent_pks)) for row in rows for _i in range(rng.randint(0, 3))}
+                through.objects.bulk_create(through(source_id=source, target_id=target) for source, target in links)
+            created += len(rows)
+        if log:
+            log(f"{custom_object_type}: {objects} custom objects")
+    return created
+
+
+def cleanup():
+    """Delete the load-test Custom Object Types (and with them their tables)."""
+    deleted = 0
+    for custom_object_type in seed_types():
+        custom_object_type.delete()
+        deleted += 1
+    return deleted
+
+
+def _url(path, params=None):
+    return f"{path}?{urlencode(params)}" if params else path
+
+
+def plan(model_class, parent_pks, typed_slugs=()):
+    """
+    Return [(endpoint, url, htmx)] for every parent in `parent_pks`. Typed tabs are
+    included for the slugs whose tab is registered (i.e. existed at startup).
+    """
+    app_label, model_name = model_class._meta.app_label, model_class._meta.model_name
+    requests = []
+    for instance in model_class.objects.filter(pk__in=parent_pks):
+        requests.append(("detail", instance.get_absolute_url(), False))
+        try:
+            combined = reverse(f"{app_label}:{model_name}_custom_objects", kwargs={"pk": instance.pk})
+        except NoReverseMatch:
+            combined = None
+        if combined:
+            requests.append(("combined", combined, False))
+            requests.extend((f"combined_{name}", _url(combined, params), True) for name, params in _COMBINED_PARTIALS)
+        for slug in typed_slugs:
+            try:
+                typed = reverse(f"{app_label}:{model_name}_custom_objects_{slug}", kwargs={"pk": instance.pk})
+            except NoReverseMatch:
+                continue
+            requests.append(("typed", typed, False))
+            requests.extend((f"typed_{name}", _url(typed, params), True) for name, params in _TYPED_PARTIALS)
+    return requests
+
+
+def _client(user, host):
+    from django.test import Client
+
+    client = Client(HTTP_HOST=host) if host else Client()
+    client.force_login(user)
+    return client
+
+
+@contextmanager
+def serial_fetches():
+    """Run the tabs with `fetch_concurrency` 1, so every query runs on the measured client thread."""
+    plugin_config = settings.PLUGINS_CONFIG.setdefault("netbox_custom_objects_tab", {})
+    missing = object()
+    previous = plugin_config.get("fetch_concurrency", missing)
+    plugin_config["fetch_concurrency"] = 1
+    try:
+        yield
+    finally:
+        if previous is missing:
+            del plugin_config["fetch_concurrency"]
+        else:
+            plugin_config["fetch_concurrency"] = previous
+
+
+def run(requests, user, concurrency=8, total=500, host=None, random_seed=1):
+    """
+    Send `total` requests drawn from `requests` from `concurrency` client threads, with
+    per-field fetches serialized (see serial_fetches()). Returns (results, elapsed
+    seconds) with results [(endpoint, status, seconds, queries)].
+    """
+    rng = random.Random(random_seed)
+    schedule = iter([rng.choice(requests) for _i in range(total)])
+    lock = threading.Lock()
+    results = []
+
+    def _worker(_n):
+        client = _client(user, host)
+        try:
+            while True:
+                with lock:
+                    request = next(schedule, None)
+                if request is None:
+                    return
+                endpoint, url, htmx = request
+                headers = {"HTTP_HX_REQUEST": "true"} if htmx else {}
+                # Queries are counted on every alias, read replicas included
+                with ExitStack() as stack:
+                    captures = [stack.enter_context(CaptureQueriesContext(c)) for c in connections.all()]
+                    started = time.perf_counter()
+                    response = client.get(url, **headers)
+                    seconds = time.perf_counter() - started
+                queries = sum(len(capture.captured_queries) for capture in captures)
+                with lock:
+                    results.append((endpoint, response.status_code, seconds, queries))
+        finally:
+            connections.close_all()
+
+    started = time.perf_counter()
+    with (
+        serial_fetches(),
+        ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="custom_objects_tab_loadtest") as executor,
+    ):
+        list(executor.map(_worker, range(concurrency)))
+    return results, time.perf_counter() - started
+
+
+def percentile(values, p):
+    """Nearest-rank percentile of the sorted list `values`."""
+    if not values:
+        return 0.0
+    rank = max(math.ceil(p / 100 * len(values)), 1)
+    return values[rank - 1]
+
+
+def summarize(results, elapsed):
+    """
+    Return {endpoint: stats} plus an "all" entry; stats are requests, errors (non-2xx),
+    rps, p50/p95/p99 latency in milliseconds and mean/max queries per request.
+    """
+    by_endpoint = {"all": results}
+    for result in results:
+        by_endpoint.setdefault(result[0], []).append(result)
+
+    summary = {}
+    for endpoint, rows in sorted(by_endpoint.items()):
+        latencies = sorted(seconds * 1000 for _endpoint, _status, seconds, _queries in rows)
+        queries = [n for _endpoint, _status, _seconds, n in rows]
+        summary[endpoint] = {
+            "requests": len(rows),
+            "errors": sum(1 for _endpoint, status, _seconds, _queries in rows if not 200 <= status < 300),
+            "rps": round(len(rows) / elapsed, 1) if elapsed else 0.0,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p95_ms": round(percentile(latencies, 95), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "queries_mean": round(sum(queries) / len(queries), 1) if queries else 0.0,
+            "queries_max": max(queries, default=0),
+        }
+    return summary
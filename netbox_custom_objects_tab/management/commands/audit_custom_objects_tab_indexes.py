@@ -0,0 +1,73 @@
+"""
+management command: audit_custom_objects_tab_indexes
+
+Lists every OBJECT/MULTIOBJECT reference column the tabs and badges filter on (the
+`<field>_id` column of a dynamic table, or `target_id` of a MULTIOBJECT through
+table) with the index covering it, its scan count and the table size (PostgreSQL),
+and reports missing and never-used indexes. With --create, missing indexes are
+created (CONCURRENTLY on PostgreSQL, so the tables stay writable).
+
+Usage examples
+--------------
+    manage.py audit_custom_objects_tab_indexes
+    manage.py audit_custom_objects_tab_indexes --create
+    manage.py audit_custom_objects_tab_indexes --database replica
+"""
+
+from django.core.management.base import BaseCommand
+from django.db import DEFAULT_DB_ALIAS
+
+
+def _size(n):
+    if n is None:
+        return "-"
+    for unit in ("B", "kB", "MB", "GB"):
+        if n < 1024:
+            return f"{n:.0f} {unit}"
+        n /= 1024
+    return f"{n:.0f} TB"
+
+
+class Command(BaseCommand):
+    help = "Report missing and unused indexes on custom object reference columns, optionally creating them."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--create",
+            action="store_true",
+            help="Create the missing indexes (CREATE INDEX CONCURRENTLY on PostgreSQL).",
+        )
+        parser.add_argument(
+            "--database",
+            default=DEFAULT_DB_ALIAS,
+            help="Database alias to inspect (default: default).",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects_tab import index_audit
+
+        columns = index_audit.audit(using=options["database"])
+        missing = [c for c in columns if c["index"] is None]
+        unused = [c for c in columns if c["index"] is not None and c["index_scans"] == 0]
+
+        for c in columns:
+            field = c["field"]
+            if c["index"] is None:
+                status = self.style.WARNING("MISSING")
+            elif c["index_scans"] == 0:
+                status = self.style.WARNING(f"unused ({c['index']})")
+            else:
+                scans = "-" if c["index_scans"] is None else c["index_scans"]
+                status = f"{c['index']} ({scans} scans)"
+            self.stdout.write(
+                f"{field.custom_object_type}.{field.name}: {c['table']}.{c['column']} "
+                f"[{_size(c['table_size'])}] {status}"
+            )
+
+        summary = f"{len(columns)} reference columns: {len(missing)} without index, {len(unused)} with unused index."
+        self.stdout.write((self.style.WARNING if missing else self.style.SUCCESS)(summary))
+
+        if options["create"] and missing:
+            log = self.stdout.write if options["verbosity"] > 1 else None
+            created = index_audit.create_missing(missing, using=options["database"], log=log)
+            self.stdout.write(self.style.SUCCESS(f"Created {len(created)} indexes."))
@@ -0,0 +1,197 @@
+"""
+management command: loadtest_custom_objects_tab
+
+Measures how the plugin's pages behave under concurrent load, for comparison across
+releases. Requests for the detail page (badges), the combined tab, the typed tabs
+and HTMX partial requests with sort/filter/page permutations are sent from
+`--concurrency` client threads through the full Django stack in this process, like
+a threaded NetBox worker serving them. The report gives throughput, p50/p95/p99
+latency and database queries per request, per endpoint.
+
+Run it against a disposable database: `--seed` creates "loadtest-*" Custom Object
+Types with bulk-inserted custom objects referencing existing `--model` objects, and
+`--cleanup` deletes them. Bulk inserts bypass the signal handlers, so rebuild the
+reference index / reconcile the counters after seeding when those are enabled.
+Typed tabs are registered at startup, so seed in one run and measure in the next to
+include them.
+
+Queries are counted on the client threads, so `fetch_concurrency` is forced to 1
+while measuring.
+
+Usage examples
+--------------
+    manage.py loadtest_custom_objects_tab --seed --objects 20000 --parents 200
+    manage.py loadtest_custom_objects_tab --username admin --concurrency 16 --requests 2000
+    manage.py loadtest_custom_objects_tab --username admin --json results/v2.1.json
+    manage.py loadtest_custom_objects_tab --cleanup
+"""
+
+import json
+
+from django.apps import apps
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from netbox.plugins import get_plugin_config
+
+_COLUMNS = ("requests", "errors", "rps", "p50_ms", "p95_ms", "p99_ms", "queries_mean", "queries_max")
+
+
+class Command(BaseCommand):
+    help = "Seed load-test custom objects and measure tab and detail page throughput, latency and queries."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model",
+            default="dcim.device",
+            help="Parent model the load-test custom objects reference (default: dcim.device).",
+        )
+        parser.add_argument(
+            "--parents",
+            type=int,
+            default=50,
+            help="Number of existing parent objects used, lowest pks first (default: 50).",
+        )
+        parser.add_argument(
+            "--seed",
+            action="store_true",
+            help="Create the load-test Custom Object Types and custom objects, then exit.",
+        )
+        parser.add_argument(
+            "--types",
+            type=int,
+            default=3,
+            help="Number of Custom Object Types created by --seed (default: 3).",
+        )
+        parser.add_argument(
+            "--objects",
+            type=int,
+            default=2000,
+            help="Number of custom objects per type created by --seed (default: 2000).",
+        )
+        parser.add_argument(
+            "--cleanup",
+            action="store_true",
+            help="Delete the load-test Custom Object Types, then exit.",
+        )
+        parser.add_argument(
+            "--username",
+            help="User the clients are logged in as (required to run the load test).",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=8,
+            help="Number of concurrent client threads (default: 8).",
+        )
+        parser.add_argument(
+            "--requests",
+            type=int,
+            default=500,
+            help="Total number of requests sent (default: 500).",
+        )
+        parser.add_argument(
+            "--host",
+            help="Host header of the requests; must be in ALLOWED_HOSTS (default: testserver).",
+        )
+        parser.add_argument(
+            "--random-seed",
+            type=int,
+            default=1,
+            help="Seed of the data distribution and request order, for reproducible runs (default: 1).",
+        )
+        parser.add_argument(
+            "--json",
+            dest="json_path",
+            help="Also write the report as JSON to this file.",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects_tab import loadtest
+
+        if options["cleanup"]:
+            deleted = loadtest.cleanup()
+            self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} load-test Custom Object Types."))
+            return
+
+        try:
+            model_class = apps.get_model(options["model"].lower())
+        except (ValueError, LookupError):
+            raise CommandError(f"Unknown model {options['model']!r}.")
+        parent_pks = list(model_class.objects.order_by("pk").values_list("pk", flat=True)[: options["parents"]])
+        if not parent_pks:
+            raise CommandError(f"No {model_class._meta.verbose_name_plural} to use as parents.")
+
+        if options["seed"]:
+            if loadtest.seed_types().exists():
+                raise CommandError("Load-test Custom Object Types already exist; run --cleanup first.")
+            created = loadtest.seed(
+                model_class,
+                parent_pks,
+                types=options["types"],
+                objects=options["objects"],
+                random_seed=options["random_seed"],
+                log=self.stdout.write,
+            )
+            self.stdout.write(self.style.SUCCESS(f"Seeded {created} custom objects over {len(parent_pks)} parents."))
+            # bulk_create bypassed the signal handlers maintaining the index and counters
+            if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+                self.stdout.write(
+                    self.style.WARNING("reference_index is enabled: run rebuild_custom_objects_tab_index now.")
+                )
+            if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+                self.stdout.write(
+                    self.style.WARNING("reference_counters is enabled: run reconcile_custom_objects_tab_counters now.")
+                )
+            return
+
+        if not options["username"]:
+            raise CommandError("--username is required to run the load test.")
+        if options["concurrency"] < 1 or options["requests"] < 1:
+            raise CommandError("--concurrency and --requests must be positive.")
+        try:
+            user = get_user_model().objects.get(username=options["username"])
+        except get_user_model().DoesNotExist:
+            raise CommandError(f"Unknown user {options['username']!r}.")
+
+        if (get_plugin_config("netbox_custom_objects_tab", "fetch_concurrency") or 1) > 1:
+            self.stdout.write(
+                self.style.WARNING(
+                    "fetch_concurrency > 1: its pool threads' queries could not be counted, "
+                    "so per-field fetches run serially during this load test."
+                )
+            )
+
+        typed_slugs = list(loadtest.seed_types().values_list("slug", flat=True))
+        requests = loadtest.plan(model_class, parent_pks, typed_slugs)
+        results, elapsed = loadtest.run(
+            requests,
+            user,
+            concurrency=options["concurrency"],
+            total=options["requests"],
+            host=options["host"],
+            random_seed=options["random_seed"],
+        )
+        summary = loadtest.summarize(results, elapsed)
+
+        self.stdout.write(f"{'endpoint':<20}" + "".join(f"{column:>14}" for column in _COLUMNS))
+        for endpoint, stats in summary.items():
+            self.stdout.write(f"{endpoint:<20}" + "".join(f"{stats[column]:>14}" for column in _COLUMNS))
+
+        if options["json_path"]:
+            report = {
+                "model": options["model"],
+                "parents": len(parent_pks),
+                "concurrency": options["concurrency"],
+                "elapsed_s": round(elapsed, 2),
+                "endpoints": summary,
+            }
+            with open(options["json_path"], "w") as f:
+                json.dump(report, f, indent=2)
+
+        style = self.style.WARNING if summary["all"]["errors"] else self.style.SUCCESS
+        self.stdout.write(
+            style(
+                f"{len(results)} requests in {elapsed:.1f}s with {options['concurrency']} clients: "
+                f"{summary['all']['rps']} req/s, {summary['all']['errors']} errors."
+            )
+        )
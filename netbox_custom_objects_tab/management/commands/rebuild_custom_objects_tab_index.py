@@ -0,0 +1,33 @@
+"""
+management command: rebuild_custom_objects_tab_index
+
+Truncates and repopulates the reference index used when the `reference_index`
+setting is enabled. Run it once after enabling the setting, and again whenever the
+index may have drifted (e.g. after bulk SQL changes that bypass Django signals).
+
+Usage examples
+--------------
+    manage.py rebuild_custom_objects_tab_index
+    manage.py rebuild_custom_objects_tab_index --chunk-size 5000
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Rebuild the netbox_custom_objects_tab reference index from all Custom Object Types."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of custom objects fetched and written per batch (default: 1000).",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects_tab import reference_index
+
+        log = self.stdout.write if options["verbosity"] > 1 else None
+        written = reference_index.rebuild(chunk_size=options["chunk_size"], log=log)
+        self.stdout.write(self.style.SUCCESS(f"Reference index rebuilt: {written} entries."))
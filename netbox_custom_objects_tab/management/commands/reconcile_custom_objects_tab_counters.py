@@ -0,0 +1,50 @@
+"""
+management command: reconcile_custom_objects_tab_counters
+
+Recomputes the per-parent reference counters used when the `reference_counters`
+setting is enabled, one Custom Object Type at a time, reports how many counters
+had drifted and repairs them. Run it once after enabling the setting (it then
+populates every counter) and periodically to verify the signal-maintained counts.
+
+Usage examples
+--------------
+    manage.py reconcile_custom_objects_tab_counters
+    manage.py reconcile_custom_objects_tab_counters --dry-run -v 2
+    manage.py reconcile_custom_objects_tab_counters --batch-size 5000
+"""
+
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Recompute netbox_custom_objects_tab reference counters, report drift and repair it."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of rows read and written per batch (default: 1000).",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report drift; do not modify any counter.",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects_tab import counters
+
+        log = self.stdout.write if options["verbosity"] > 1 else None
+        totals = counters.reconcile(batch_size=options["batch_size"], fix=not options["dry_run"], log=log)
+        drift = totals["missing"] + totals["wrong"] + totals["stale"]
+        summary = (
+            f"{totals['checked']} counters checked: {totals['missing']} missing, "
+            f"{totals['wrong']} wrong, {totals['stale']} stale"
+        )
+        if not drift:
+            self.stdout.write(self.style.SUCCESS(f"{summary}."))
+        elif options["dry_run"]:
+            self.stdout.write(self.style.WARNING(f"{summary} (dry run, nothing changed)."))
+        else:
+            self.stdout.write(self.style.WARNING(f"{summary}; repaired."))
@@ -0,0 +1,111 @@
+"""
+management command: warm_custom_objects_tab
+
+Precomputes the plugin's cross-process caches after a deploy or cache flush: the
+display strings of every custom object whose type references a model in
+`combined_models`/`typed_models` (requires `display_cache_timeout`), and optionally
+the reference counters (`--counters`, requires `reference_counters`). Objects are
+processed in pk-ordered batches on a process pool; with `--state-file` progress is
+checkpointed after each batch and a rerun resumes where the previous one stopped.
+
+Usage examples
+--------------
+    manage.py warm_custom_objects_tab
+    manage.py warm_custom_objects_tab --workers 8 --batch-size 2000
+    manage.py warm_custom_objects_tab --rate 5000 --state-file /tmp/warm.json -v 2
+    manage.py warm_custom_objects_tab --state-file /tmp/warm.json --reset --counters
+"""
+
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from netbox.plugins import get_plugin_config
+
+
+class Command(BaseCommand):
+    help = "Warm the netbox_custom_objects_tab display cache (and optionally counters) in parallel batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of custom objects warmed per batch (default: 1000).",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=4,
+            help="Number of worker processes, each with its own database connection (default: 4).",
+        )
+        parser.add_argument(
+            "--rate",
+            type=int,
+            default=0,
+            help="Maximum number of custom objects dispatched per second; 0 disables the limit (default: 0).",
+        )
+        parser.add_argument(
+            "--state-file",
+            help="JSON file recording the last warmed pk per Custom Object Type, used to resume interrupted runs.",
+        )
+        parser.add_argument(
+            "--reset",
+            action="store_true",
+            help="Ignore the state file and start from the beginning.",
+        )
+        parser.add_argument(
+            "--counters",
+            action="store_true",
+            help="Also reconcile the reference counters (requires the reference_counters setting).",
+        )
+
+    def handle(self, *args, **options):
+        from netbox_custom_objects_tab import counters, warmup
+
+        if options["batch_size"] < 1 or options["workers"] < 1:
+            raise CommandError("--batch-size and --workers must be positive.")
+
+        if get_plugin_config("netbox_custom_objects_tab", "display_cache_timeout"):
+            self._warm_display(warmup, options)
+        else:
+            self.stdout.write(self.style.WARNING("display_cache_timeout is 0; skipping display strings."))
+
+        if options["counters"]:
+            if not get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+                raise CommandError("--counters requires the reference_counters setting.")
+            totals = counters.reconcile(batch_size=options["batch_size"])
+            self.stdout.write(self.style.SUCCESS(f"Reference counters reconciled: {totals['checked']} checked."))
+
+    def _warm_display(self, warmup, options):
+        state_file = options["state_file"]
+        state = {} if options["reset"] else warmup.load_state(state_file)
+        types = warmup.target_types(warmup.configured_models())
+
+        def batches():
+            for custom_object_type in types:
+                yield from warmup.iter_batches(
+                    custom_object_type, options["batch_size"], state.get(custom_object_type.pk)
+                )
+
+        started = time.monotonic()
+        warmed = 0
+
+        def on_done(batch):
+            nonlocal warmed
+            custom_object_type_id, _first_pk, last_pk, size = batch
+            warmed += size
+            state[custom_object_type_id] = last_pk
+            warmup.save_state(state_file, state)
+            if options["verbosity"] > 1:
+                rate = warmed / max(time.monotonic() - started, 1e-6)
+                self.stdout.write(
+                    f"Custom Object Type {custom_object_type_id}: up to pk {last_pk} ({warmed} objects, {rate:.0f}/s)"
+                )
+
+        warmup.run(warmup.throttle(batches(), options["rate"]), workers=options["workers"], on_done=on_done)
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Display strings warmed: {warmed} objects of {len(types)} Custom Object Types in {elapsed:.1f}s."
+            )
+        )
@@ -0,0 +1,62 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    initial = True
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_custom_objects", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceIndexEntry",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("parent_pk", models.BigIntegerField()),
+                ("custom_object_pk", models.BigIntegerField()),
+                ("display_text", models.TextField(blank=True)),
+                ("tags", models.JSONField(blank=True, default=list)),
+                ("last_updated", models.DateTimeField(blank=True, null=True)),
+                (
+                    "cot",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_custom_objects.customobjecttype",
+                    ),
+                ),
+                (
+                    "field",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_custom_objects.customobjecttypefield",
+                    ),
+                ),
+                (
+                    "parent_ct",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("field", "custom_object_pk"),
+                "indexes": [
+                    models.Index(fields=["parent_ct", "parent_pk"], name="netbox_cotab_refidx_parent"),
+                    models.Index(fields=["cot", "custom_object_pk"], name="netbox_cotab_refidx_object"),
+                ],
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("parent_ct", "parent_pk", "field", "custom_object_pk"),
+                        name="netbox_custom_objects_tab_referenceindexentry_unique_reference",
+                    ),
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,46 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_custom_objects", "0001_initial"),
+        ("netbox_custom_objects_tab", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ReferenceCounter",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False)),
+                ("parent_pk", models.BigIntegerField()),
+                ("count", models.BigIntegerField(default=0)),
+                (
+                    "cot",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_custom_objects.customobjecttype",
+                    ),
+                ),
+                (
+                    "parent_ct",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("parent_ct", "parent_pk", "cot"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("parent_ct", "parent_pk", "cot"),
+                        name="netbox_custom_objects_tab_referencecounter_unique_parent_type",
+                    ),
+                ],
+            },
+        ),
+    ]
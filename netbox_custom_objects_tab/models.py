@@ -0,0 +1,86 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db import models
+
+
+class ReferenceIndexEntry(models.Model):
+    """
+    Denormalized copy of one OBJECT/MULTIOBJECT reference: custom object
+    `custom_object_pk` (of type `cot`) points at the parent object identified by
+    (`parent_ct`, `parent_pk`) through `field`.
+
+    Maintained by the signal handlers in `signals.py` when the `reference_index`
+    setting is enabled; rebuilt from scratch by `manage.py rebuild_custom_objects_tab_index`.
+    """
+
+    parent_ct = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    parent_pk = models.BigIntegerField()
+    cot = models.ForeignKey(
+        to="netbox_custom_objects.CustomObjectType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    field = models.ForeignKey(
+        to="netbox_custom_objects.CustomObjectTypeField",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    custom_object_pk = models.BigIntegerField()
+    display_text = models.TextField(blank=True)
+    tags = models.JSONField(default=list, blank=True)
+    last_updated = models.DateTimeField(blank=True, null=True)
+
+    class Meta:
+        ordering = ("field", "custom_object_pk")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("parent_ct", "parent_pk", "field", "custom_object_pk"),
+                name="%(app_label)s_%(class)s_unique_reference",
+            ),
+        )
+        indexes = (
+            models.Index(fields=("parent_ct", "parent_pk"), name="netbox_cotab_refidx_parent"),
+            models.Index(fields=("cot", "custom_object_pk"), name="netbox_cotab_refidx_object"),
+        )
+
+    def __str__(self):
+        return f"{self.display_text} → {self.parent_ct_id}:{self.parent_pk}"
+
+
+class ReferenceCounter(models.Model):
+    """
+    Number of (custom object, field) references from Custom Object Type `cot` to the
+    parent object identified by (`parent_ct`, `parent_pk`) — the number shown on the
+    badges.
+
+    Kept exact by the signal handlers in `signals.py` when the `reference_counters`
+    setting is enabled; checked and repaired by `manage.py reconcile_custom_objects_tab_counters`.
+    """
+
+    parent_ct = models.ForeignKey(
+        to=ContentType,
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    parent_pk = models.BigIntegerField()
+    cot = models.ForeignKey(
+        to="netbox_custom_objects.CustomObjectType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    count = models.BigIntegerField(default=0)
+
+    class Meta:
+        ordering = ("parent_ct", "parent_pk", "cot")
+        constraints = (
+            models.UniqueConstraint(
+                fields=("parent_ct", "parent_pk", "cot"),
+                name="%(app_label)s_%(class)s_unique_parent_type",
+            ),
+        )
+
+    def __str__(self):
+        return f"{self.parent_ct_id}:{self.parent_pk} ← {self.cot_id}: {self.count}"
@@ -0,0 +1,93 @@
+"""
+On-demand profiling of the tab views (`profile_requests` setting).
+
+With the setting enabled, a user holding the profile permission (see
+_PROFILE_PERMISSION) can append `?_profile=1` to a combined, typed or rollup tab URL:
+the view (queries, display strings, filtering, sorting and template rendering, badges
+included) then runs under a profiler and the response is the profile report instead
+of the page. pyinstrument's sampling profiler is used
+when installed (an HTML flame view), cProfile otherwise (`?_profile=cprofile` forces
+it); cProfile reports list the slowest call paths and the plugin's hot spots. With
+`profile_directory` set, the raw cProfile stats are also saved there for snakeviz or
+pstats.
+
+Requests without `_profile` only pay one dict lookup.
+"""
+
+import cProfile
+import functools
+import io
+import os
+import pstats
+import time
+
+from django.http import HttpResponse
+from netbox.plugins import get_plugin_config
+
+# Functions listed in the "hot spots" section of cProfile reports
+_HOT_SPOTS = r"_filter_linked_objects|_iter_source|display_strings|<lambda>|__str__|render"
+_REPORT_LIMIT = 40
+
+# NetBox names object permissions <app_label>.<action>_<model>: granted by an object
+# permission with the custom action "profile" on Reference index entry; superusers have it.
+_PROFILE_PERMISSION = "netbox_custom_objects_tab.profile_referenceindexentry"
+
+
+def _allowed(request):
+    return bool(
+        get_plugin_config("netbox_custom_objects_tab", "profile_requests")
+        and request.user.has_perm(_PROFILE_PERMISSION)
+    )
+
+
+def profiled(get):
+    """Decorate a tab view's get() so `?_profile=...` runs it under a profiler."""
+
+    @functools.wraps(get)
+    def wrapper(self, request, *args, **kwargs):
+        if "_profile" not in request.GET or not _allowed(request):
+            return get(self, request, *args, **kwargs)
+        return _profile(get, self, request, *args, **kwargs)
+
+    return wrapper
+
+
+def _sampling_profiler():
+    try:
+        from pyinstrument import Profiler
+    except ImportError:
+        return None
+    return Profiler
+
+
+def _profile(get, view, request, *args, **kwargs):
+    Profiler = _sampling_profiler() if request.GET["_profile"] != "cprofile" else None
+    if Profiler is not None:
+        profiler = Profiler()
+        profiler.start()
+        try:
+            get(view, request, *args, **kwargs)
+        finally:
+            profiler.stop()
+        return HttpResponse(profiler.output_html())
+
+    profile = cProfile.Profile()
+    started = time.perf_counter()
+    response = profile.runcall(get, view, request, *args, **kwargs)
+    elapsed = time.perf_counter() - started
+
+    out = io.StringIO()
+    out.write(f"{request.method} {request.path}: HTTP {response.status_code} in {elapsed * 1000:.1f} ms\n")
+    if directory := get_plugin_config("netbox_custom_objects_tab", "profile_directory"):
+        path = os.path.join(
+            directory, f"custom_objects_tab-{type(view).__name__}-{time.strftime('%Y%m%d-%H%M%S')}.prof"
+        )
+        profile.dump_stats(path)
+        out.write(f"Saved to {path}\n")
+
+    stats = pstats.Stats(profile, stream=out).strip_dirs().sort_stats(pstats.SortKey.CUMULATIVE)
+    out.write("\n=== Slowest call paths (cumulative) ===\n")
+    stats.print_stats(_REPORT_LIMIT)
+    out.write("=== Hot spots: filtering, sort keys, __str__, rendering (by own time) ===\n")
+    stats.sort_stats(pstats.SortKey.TIME).print_stats(_HOT_SPOTS, _REPORT_LIMIT)
+    return HttpResponse(out.getvalue(), content_type="text/plain; charset=utf-8")
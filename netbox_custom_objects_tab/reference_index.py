@@ -0,0 +1,211 @@
+"""
+Optional denormalized reference index (`reference_index` setting).
+
+Every OBJECT/MULTIOBJECT reference from a custom object to a parent object is
+mirrored as one ReferenceIndexEntry row, so the badges and the combined tab's
+text search can answer "what points at this object" with a single indexed query
+instead of fanning out to every dynamic table and M2M through table.
+"""
+
+import logging
+from collections import defaultdict
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models import Count
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObjectTypeField
+
+from .routing import read_alias, using
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+_REFERENCE_FIELD_TYPES = (
+    CustomFieldTypeChoices.TYPE_OBJECT,
+    CustomFieldTypeChoices.TYPE_MULTIOBJECT,
+)
+
+
+def _entry_model():
+    from .models import ReferenceIndexEntry
+
+    return ReferenceIndexEntry
+
+
+def _iter_references(obj, fields):
+    """
+    Yield (field, parent_pk) for every parent object that `obj` references
+    through one of `fields`.
+    """
+    for field in fields:
+        if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+            parent_pk = getattr(obj, f"{field.name}_id", None)
+            if parent_pk is not None:
+                yield field, parent_pk
+        elif field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+            manager = getattr(obj, field.name, None)
+            if manager is None:
+                continue
+            for related in manager.all():
+                yield field, related.pk
+
+
+def _build_entries(obj, fields):
+    """Return unsaved ReferenceIndexEntry instances describing `obj`'s references."""
+    ReferenceIndexEntry = _entry_model()
+    display_text = str(obj)
+    tags = sorted(tag.slug for tag in obj.tags.all())
+    return [
+        ReferenceIndexEntry(
+            parent_ct_id=field.related_object_type_id,
+            parent_pk=parent_pk,
+            cot_id=field.custom_object_type_id,
+            field_id=field.pk,
+            custom_object_pk=obj.pk,
+            display_text=display_text,
+            tags=tags,
+            last_updated=getattr(obj, "last_updated", None),
+        )
+        for field, parent_pk in _iter_references(obj, fields)
+    ]
+
+
+def _fields_for_type(custom_object_type_id):
+    return list(
+        CustomObjectTypeField.objects.filter(
+            custom_object_type_id=custom_object_type_id,
+            type__in=_REFERENCE_FIELD_TYPES,
+            related_object_type__isnull=False,
+        )
+    )
+
+
+def sync_custom_object(obj):
+    """Replace the index rows of a single custom object with its current references."""
+    ReferenceIndexEntry = _entry_model()
+    entries = _build_entries(obj, _fields_for_type(obj.custom_object_type_id))
+    with transaction.atomic():
+        ReferenceIndexEntry.objects.filter(
+            cot_id=obj.custom_object_type_id,
+            custom_object_pk=obj.pk,
+        ).delete()
+        ReferenceIndexEntry.objects.bulk_create(entries)
+
+
+def delete_custom_object(custom_object_type_id, custom_object_pk):
+    """Drop every index row owned by a deleted custom object."""
+    _entry_model().objects.filter(
+        cot_id=custom_object_type_id,
+        custom_object_pk=custom_object_pk,
+    ).delete()
+
+
+def delete_parent(parent):
+    """Drop every index row pointing at a deleted parent object."""
+    _entry_model().objects.filter(
+        parent_ct=ContentType.objects.get_for_model(parent),
+        parent_pk=parent.pk,
+    ).delete()
+
+
+def rebuild(chunk_size=1000, log=None):
+    """
+    Truncate the index and repopulate it from every Custom Object Type.
+    Returns the number of entries written.
+    """
+    ReferenceIndexEntry = _entry_model()
+    fields_by_type = defaultdict(list)
+    for field in CustomObjectTypeField.objects.filter(
+        type__in=_REFERENCE_FIELD_TYPES,
+        related_object_type__isnull=False,
+    ).select_related("custom_object_type"):
+        fields_by_type[field.custom_object_type].append(field)
+
+    written = 0
+    with transaction.atomic():
+        ReferenceIndexEntry.objects.all().delete()
+        for custom_object_type, fields in fields_by_type.items():
+            try:
+                model = custom_object_type.get_model()
+            except Exception:
+                logger.exception("Could not get model for CustomObjectType %s", custom_object_type.pk)
+                continue
+
+            multi_names = [f.name for f in fields if f.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT]
+            objects = model.objects.prefetch_related("tags", *multi_names).iterator(chunk_size=chunk_size)
+            type_written = 0
+            while chunk := list(islice(objects, chunk_size)):
+                entries = [entry for obj in chunk for entry in _build_entries(obj, fields)]
+                ReferenceIndexEntry.objects.bulk_create(entries, batch_size=chunk_size)
+                type_written += len(entries)
+            written += type_written
+            if log:
+                log(f"{custom_object_type}: {type_written} references")
+
+    return written
+
+
+def parent_entries(model_class, parent_pk):
+    """Index rows pointing at the model_class object `parent_pk` (a value or OuterRef)."""
+    return using(_entry_model().objects, read_alias()).filter(
+        parent_ct=ContentType.objects.get_for_model(model_class),
+        parent_pk=parent_pk,
+    )
+
+
+def matching_custom_objects(instance, field, q):
+    """Subquery of the pks of custom objects referencing `instance` through `field` whose display text contains `q`."""
+    return (
+        parent_entries(instance._meta.model, instance.pk)
+        .filter(field_id=field.pk, display_text__icontains=q)
+        .values("custom_object_pk")
+    )
+
+
+def count_for_parent(instance, custom_object_type_id=None, cap=None):
+    """
+    COUNT(*) of index rows pointing at `instance`, optionally limited to one type.
+    With a cap, counting stops after cap + 1 rows (LIMIT subquery).
+    """
+    qs = parent_entries(instance._meta.model, instance.pk)
+    if custom_object_type_id is not None:
+        qs = qs.filter(cot_id=custom_object_type_id)
+    return qs[: cap + 1].count() if cap else qs.count()
+
+
+def count_for_parents(model_class, parent_filters, by_type=False):
+    """
+    Grouped COUNT(*) of index rows per parent pk, for each value of `parent_filters`
+    (pk lists or a pk subquery). Same return shape as counts.count_linked_custom_objects().
+    """
+    content_type = ContentType.objects.get_for_model(model_class)
+    db = read_alias()
+    totals = defaultdict(dict) if by_type else {}
+    for parent_filter in parent_filters:
+        qs = using(_entry_model().objects, db).filter(parent_ct=content_type, parent_pk__in=parent_filter).order_by()
+        if by_type:
+            for parent_pk, slug, n in (
+                qs.values("parent_pk", "cot__slug").annotate(n=Count("pk")).values_list("parent_pk", "cot__slug", "n")
+            ):
+                totals[parent_pk][slug] = n
+        else:
+            totals.update(qs.values("parent_pk").annotate(n=Count("pk")).values_list("parent_pk", "n"))
+    return dict(totals)
+
+
+def top_parents(limit, content_type_ids=None, custom_object_type_ids=None):
+    """Index-backed [(parent_ct_id, parent_pk, count)] of the `limit` most referenced parents."""
+    qs = using(_entry_model().objects, read_alias()).all()
+    if content_type_ids:
+        qs = qs.filter(parent_ct__in=content_type_ids)
+    if custom_object_type_ids:
+        qs = qs.filter(cot__in=custom_object_type_ids)
+    rows = (
+        qs.order_by()
+        .values("parent_ct_id", "parent_pk")
+        .annotate(total=Count("pk"))
+        .order_by("-total", "parent_ct_id", "parent_pk")
+        .values_list("parent_ct_id", "parent_pk", "total")
+    )
+    return list(rows[:limit])
@@ -0,0 +1,31 @@
+"""
+Discovery of the custom object fields that reference a model.
+
+Shared by the tabs, bulk counts, conditional GET, bulk actions and the REST API.
+"""
+
+from django.contrib.contenttypes.models import ContentType
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObjectTypeField
+
+
+def get_reference_fields(model_class):
+    """
+    Return the OBJECT and MULTIOBJECT CustomObjectTypeFields that point at model_class,
+    with their Custom Object Type pre-loaded.
+    """
+    content_type = ContentType.objects.get_for_model(model_class)
+    return CustomObjectTypeField.objects.filter(
+        related_object_type=content_type,
+        type__in=[
+            CustomFieldTypeChoices.TYPE_OBJECT,
+            CustomFieldTypeChoices.TYPE_MULTIOBJECT,
+        ],
+    ).select_related("custom_object_type")
+
+
+def reference_lookup(field):
+    """ORM lookup that filters a custom object queryset by the object `field` points at."""
+    if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+        return f"{field.name}_id"
+    return field.name
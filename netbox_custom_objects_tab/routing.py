@@ -0,0 +1,73 @@
+"""
+Read-replica routing for the plugin's read-only queries (`read_database_alias` setting).
+
+Tab, badge, count and facet queries run with .using(read_alias()), i.e. on the
+configured replica. Right after a user writes a custom object, their session is
+pinned to the primary database for `read_pin_seconds`, so the tab they return to
+already shows the change even if the replica lags behind.
+
+ReadReplicaPinMiddleware tracks the pin: badges are computed from templates that
+have no access to the request, so the per-request state lives in a context variable.
+"""
+
+import time
+from contextvars import ContextVar
+
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import DEFAULT_DB_ALIAS
+from netbox.plugins import get_plugin_config
+
+_SESSION_KEY = "netbox_custom_objects_tab_pinned_until"
+
+# {"pinned": bool, "wrote": bool} for the request being handled, None outside requests
+_request_state = ContextVar("netbox_custom_objects_tab_request_state", default=None)
+
+
+def read_alias():
+    """
+    Database alias for read-only plugin queries in the current request: the replica,
+    the primary while the session is pinned, or None when routing is disabled.
+    """
+    alias = get_plugin_config("netbox_custom_objects_tab", "read_database_alias")
+    if not alias:
+        return None
+    state = _request_state.get()
+    if state is not None and (state["pinned"] or state["wrote"]):
+        return DEFAULT_DB_ALIAS
+    return alias
+
+
+def using(manager, alias):
+    """`manager.using(alias)`, or `manager` untouched when routing is disabled (alias None)."""
+    return manager if alias is None else manager.using(alias)
+
+
+def note_write():
+    """Record that the current request wrote a custom object (called from signal handlers)."""
+    state = _request_state.get()
+    if state is not None:
+        state["wrote"] = True
+
+
+class ReadReplicaPinMiddleware:
+    """Pin a session to the primary database for `read_pin_seconds` after it writes a custom object."""
+
+    def __init__(self, get_response):
+        if not get_plugin_config("netbox_custom_objects_tab", "read_database_alias"):
+            raise MiddlewareNotUsed()
+        self.get_response = get_response
+
+    def __call__(self, request):
+        session = getattr(request, "session", None)
+        pinned_until = session.get(_SESSION_KEY, 0) if session is not None else 0
+        state = {"pinned": pinned_until > time.time(), "wrote": False}
+        token = _request_state.set(state)
+        try:
+            response = self.get_response(request)
+        finally:
+            _request_state.reset(token)
+
+        if state["wrote"] and session is not None:
+            pin_seconds = get_plugin_config("netbox_custom_objects_tab", "read_pin_seconds") or 0
+            session[_SESSION_KEY] = time.time() + pin_seconds
+        return response
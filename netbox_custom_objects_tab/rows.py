@@ -0,0 +1,110 @@
+"""
+Compact rows for the combined tab.
+
+The combined tab filters, sorts and paginates every custom object referencing the
+parent, but renders only one page of them. Loading full dynamic-model instances
+(every column, plus a prefetched tags queryset per object) for all of them is the
+bulk of the tab's memory, so the full list is built from one projected
+values_list() query per field into LinkedRow objects holding only what filtering,
+sorting and display-string lookups read. load_page() then fetches full instances
+for the current page alone.
+"""
+
+from collections import defaultdict
+
+from .routing import read_alias, using
+
+
+class RowTag:
+    """Tag of a LinkedRow: what the tag filter and dropdown read. Shared across rows."""
+
+    __slots__ = ("pk", "slug", "name")
+
+    def __init__(self, pk, slug, name):
+        self.pk = pk
+        self.slug = slug
+        self.name = name
+
+    def __str__(self):
+        return self.name
+
+
+class LinkedRow:
+    """
+    Projected custom object: type, pk, last_updated (display cache key) and tags.
+    `model` is the dynamic model class, shared by every row of the type.
+    """
+
+    __slots__ = ("model", "custom_object_type_id", "pk", "last_updated", "tags")
+
+    def __init__(self, model, custom_object_type_id, pk, last_updated, tags=()):
+        self.model = model
+        self.custom_object_type_id = custom_object_type_id
+        self.pk = pk
+        self.last_updated = last_updated
+        self.tags = tags
+
+    def __str__(self):
+        # Only shown for an object deleted between the list query and its display lookup
+        return str(self.pk)
+
+    def __repr__(self):
+        return f"<LinkedRow {self.custom_object_type_id}:{self.pk}>"
+
+
+def fetch_rows(model, custom_object_type_id, queryset, rows=None, tags=None):
+    """
+    Return the LinkedRows of `queryset` (a queryset of `model`), in pk order, with one
+    query: tags are LEFT JOINed, giving one result row per (object, tag).
+
+    `rows` ({(custom_object_type_id, pk): LinkedRow}) and `tags` ({tag pk: RowTag}) are
+    shared between calls so an object referencing the parent through several fields,
+    and every tag, is held once.
+    """
+    rows = {} if rows is None else rows
+    tags = {} if tags is None else tags
+    result = []
+    row_tags = {}
+    values = queryset.order_by("pk").values_list("pk", "last_updated", "tags__pk", "tags__slug", "tags__name")
+    for pk, last_updated, tag_pk, tag_slug, tag_name in values:
+        if pk not in row_tags:
+            row = rows.get((custom_object_type_id, pk))
+            if row is None:
+                row = rows[custom_object_type_id, pk] = LinkedRow(model, custom_object_type_id, pk, last_updated)
+            result.append(row)
+            row_tags[pk] = []
+        if tag_pk is not None:
+            tag = tags.get(tag_pk)
+            if tag is None:
+                tag = tags[tag_pk] = RowTag(tag_pk, tag_slug, tag_name)
+            row_tags[pk].append(tag)
+    for row in result:
+        row.tags = tuple(sorted(row_tags[row.pk], key=lambda t: t.name.lower()))
+    return result
+
+
+def load_page(pairs):
+    """
+    Replace the LinkedRows in `pairs` ([(row, field)]) with full instances, tags
+    prefetched, with one query per Custom Object Type. Rows whose object vanished
+    meanwhile are dropped; full instances pass through unchanged.
+    """
+    pks_by_model = defaultdict(set)
+    for row, _field in pairs:
+        if isinstance(row, LinkedRow):
+            pks_by_model[row.model].add(row.pk)
+
+    db = read_alias()
+    instances = {}
+    for model, pks in pks_by_model.items():
+        for pk, obj in using(model.objects, db).prefetch_related("tags").in_bulk(pks).items():
+            instances[model, pk] = obj
+
+    result = []
+    for row, field in pairs:
+        if isinstance(row, LinkedRow):
+            row = instances.get((row.model, row.pk))
+            if row is None:
+                continue
+        result.append((row, field))
+    return result
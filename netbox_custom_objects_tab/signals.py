@@ -0,0 +1,187 @@
+"""
+Signal handlers keeping the optional reference index and reference counters in
+sync, invalidating tab ETags on tag and MULTIOBJECT changes, and pinning writers to
+the primary database when read-replica routing is enabled.
+
+Custom object models are generated at runtime, so the save and m2m handlers are
+connected without a sender and filter on the CustomObject base class. Delete
+handlers are connected per sender instead — to every custom object model as it is
+prepared, and to the combined_models / typed_models parent models — because any
+pre/post_delete receiver for a model makes Django load and delete its rows one by
+one instead of fast-deleting them. Parents of other models referenced by custom
+objects keep stale index rows or counters until the next rebuild or reconcile.
+Handlers are only connected when the corresponding setting is enabled (see
+connect_signals()), so installations that do not use these features pay nothing
+on save/delete.
+"""
+
+import logging
+
+from django.apps import apps
+from django.core.exceptions import FieldDoesNotExist
+from django.db.models.signals import class_prepared, m2m_changed, post_delete, post_save, pre_delete, pre_save
+from netbox.plugins import get_plugin_config
+from netbox_custom_objects.models import CustomObject
+
+from . import conditional, counters, reference_index, routing
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+# Parent instance attribute carrying {through model: custom object pks} captured in pre_clear
+_CLEARED_OBJECTS = "_custom_objects_tab_cleared_objects"
+
+# (signal, receiver, dispatch_uid, also for parent models) connected per sender
+_delete_receivers = []
+
+
+def handle_custom_object_saved(sender, instance, raw=False, **kwargs):
+    if raw or not isinstance(instance, CustomObject):
+        return
+    reference_index.sync_custom_object(instance)
+
+
+def handle_object_deleted(sender, instance, **kwargs):
+    if isinstance(instance, CustomObject):
+        reference_index.delete_custom_object(instance.custom_object_type_id, instance.pk)
+    elif getattr(instance, "pk", None) is not None:
+        reference_index.delete_parent(instance)
+
+
+def _linked_custom_object_pks(through, parent_pk):
+    """Pks of the custom objects linked to `parent_pk` through a MULTIOBJECT through table."""
+    try:
+        through._meta.get_field("target")
+    except (AttributeError, FieldDoesNotExist):
+        return set()
+    return set(through.objects.filter(target_id=parent_pk).values_list("source_id", flat=True))
+
+
+def handle_m2m_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Re-index custom objects whose MULTIOBJECT values or tags changed.
+
+    Forward changes (custom_object.field.add(...), custom_object.tags.add(...)) carry
+    the custom object as `instance`; reverse changes carry the parent object as
+    `instance` and the affected custom object pks in `pk_set` — except reverse clears,
+    whose pks are captured in pre_clear since Django sends none.
+    """
+    reverse_custom = reverse and isinstance(model, type) and issubclass(model, CustomObject)
+    if action == "pre_clear":
+        if reverse_custom:
+            instance.__dict__.setdefault(_CLEARED_OBJECTS, {})[sender] = _linked_custom_object_pks(sender, instance.pk)
+        return
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, CustomObject):
+        reference_index.sync_custom_object(instance)
+    elif reverse_custom:
+        if action == "post_clear":
+            pk_set = instance.__dict__.get(_CLEARED_OBJECTS, {}).pop(sender, None)
+        if pk_set:
+            for obj in model.objects.filter(pk__in=pk_set).prefetch_related("tags"):
+                reference_index.sync_custom_object(obj)
+
+
+def handle_counter_pre_save(sender, instance, raw=False, **kwargs):
+    if raw or not isinstance(instance, CustomObject):
+        return
+    counters.capture_old_references(instance)
+
+
+def handle_counter_post_save(sender, instance, created=False, raw=False, **kwargs):
+    if raw or not isinstance(instance, CustomObject):
+        return
+    counters.custom_object_saved(instance, created)
+
+
+def handle_counter_pre_delete(sender, instance, **kwargs):
+    if isinstance(instance, CustomObject):
+        counters.capture_deleted_references(instance)
+
+
+def handle_counter_post_delete(sender, instance, **kwargs):
+    if isinstance(instance, CustomObject):
+        counters.custom_object_deleted(instance)
+    elif getattr(instance, "pk", None) is not None:
+        counters.delete_parent(instance)
+
+
+def handle_counter_m2m_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action in ("post_add", "pre_remove", "post_remove", "pre_clear", "post_clear"):
+        counters.multiobject_changed(sender, instance, action, reverse, model, pk_set)
+
+
+def handle_m2m_version(sender, instance, action, reverse, model, **kwargs):
+    """Tag and MULTIOBJECT changes leave last_updated alone: invalidate the tab ETags of the type."""
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, CustomObject):
+        conditional.bump_m2m_version(instance.custom_object_type_id)
+    elif reverse and isinstance(model, type) and issubclass(model, CustomObject):
+        conditional.bump_m2m_version(model.custom_object_type_id)
+
+
+def handle_custom_object_written(sender, instance, action=None, model=None, **kwargs):
+    """Pin the writing user's session to the primary database (see routing)."""
+    if action is not None and action not in ("post_add", "post_remove", "post_clear"):
+        return
+    if isinstance(instance, CustomObject) or (isinstance(model, type) and issubclass(model, CustomObject)):
+        routing.note_write()
+
+
+def _connect_delete_receivers(model_class, parent=False):
+    for signal, receiver, dispatch_uid, for_parents in _delete_receivers:
+        if for_parents or not parent:
+            signal.connect(receiver, sender=model_class, dispatch_uid=dispatch_uid)
+
+
+def handle_class_prepared(sender, **kwargs):
+    """Connect the delete handlers to custom object models generated after startup."""
+    if issubclass(sender, CustomObject):
+        _connect_delete_receivers(sender)
+
+
+def _parent_models():
+    from .views import _resolve_model_labels
+
+    labels = []
+    for key in ("combined_models", "typed_models"):
+        labels.extend(get_plugin_config("netbox_custom_objects_tab", key) or [])
+    return _resolve_model_labels(labels)
+
+
+def connect_signals():
+    """Connect the handlers required by the enabled settings. Called from AppConfig.ready()."""
+    _delete_receivers.clear()
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        post_save.connect(handle_custom_object_saved, dispatch_uid="netbox_custom_objects_tab_index_save")
+        _delete_receivers.append((post_delete, handle_object_deleted, "netbox_custom_objects_tab_index_delete", True))
+        m2m_changed.connect(handle_m2m_changed, dispatch_uid="netbox_custom_objects_tab_index_m2m")
+        logger.debug("netbox_custom_objects_tab: reference index signal handlers connected")
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        pre_save.connect(handle_counter_pre_save, dispatch_uid="netbox_custom_objects_tab_counter_pre_save")
+        post_save.connect(handle_counter_post_save, dispatch_uid="netbox_custom_objects_tab_counter_save")
+        _delete_receivers.append(
+            (pre_delete, handle_counter_pre_delete, "netbox_custom_objects_tab_counter_pre_delete", False)
+        )
+        _delete_receivers.append(
+            (post_delete, handle_counter_post_delete, "netbox_custom_objects_tab_counter_delete", True)
+        )
+        m2m_changed.connect(handle_counter_m2m_changed, dispatch_uid="netbox_custom_objects_tab_counter_m2m")
+        logger.debug("netbox_custom_objects_tab: reference counter signal handlers connected")
+    if get_plugin_config("netbox_custom_objects_tab", "conditional_get"):
+        m2m_changed.connect(handle_m2m_version, dispatch_uid="netbox_custom_objects_tab_conditional_m2m")
+    if get_plugin_config("netbox_custom_objects_tab", "read_database_alias"):
+        post_save.connect(handle_custom_object_written, dispatch_uid="netbox_custom_objects_tab_routing_save")
+        _delete_receivers.append(
+            (post_delete, handle_custom_object_written, "netbox_custom_objects_tab_routing_delete", False)
+        )
+        m2m_changed.connect(handle_custom_object_written, dispatch_uid="netbox_custom_objects_tab_routing_m2m")
+
+    if _delete_receivers:
+        class_prepared.connect(handle_class_prepared, dispatch_uid="netbox_custom_objects_tab_class_prepared")
+        for model_class in apps.get_models():
+            if issubclass(model_class, CustomObject):
+                _connect_delete_receivers(model_class)
+        for model_class in _parent_models():
+            _connect_delete_receivers(model_class, parent=True)
@@ -0,0 +1,96 @@
+import logging
+
+import django_tables2 as tables2
+from django.utils.module_loading import import_string
+from django.utils.translation import gettext_lazy as _
+from netbox.plugins import get_plugin_config
+from utilities.tables import register_table_column
+
+from . import counts
+from .routing import read_alias, using
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+# Annotation name used when the column sorts the list queryset.
+_ANNOTATION = "custom_objects_count"
+
+
+class CustomObjectsCountColumn(tables2.Column):
+    """
+    "Custom Objects" column for parent list views (DeviceTable, PrefixTable, ...).
+
+    Sorting annotates the list queryset with reference_count_expression(), so
+    ordering happens in SQL. Unsorted pages are counted with one query for all rows
+    on the page, issued when the first cell renders.
+    """
+
+    # Always call render(), even though records carry no value until annotated
+    empty_values = ()
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("verbose_name", _("Custom Objects"))
+        kwargs.setdefault("accessor", tables2.A(_ANNOTATION))
+        super().__init__(*args, **kwargs)
+
+    def order(self, queryset, is_descending):
+        queryset = queryset.annotate(**{_ANNOTATION: counts.reference_count_expression(queryset.model)})
+        return queryset.order_by(f"-{_ANNOTATION}" if is_descending else _ANNOTATION), True
+
+    def _page_counts(self, table):
+        """Return {pk: count} for the rows of the current page, cached on the table."""
+        page_counts = getattr(table, "_custom_objects_counts", None)
+        if page_counts is None:
+            rows = table.page.object_list if getattr(table, "page", None) else table.rows
+            records = [row.record for row in rows]
+            page_counts = {}
+            if records:
+                model = records[0]._meta.model
+                page_counts = dict(
+                    using(model.objects, read_alias())
+                    .filter(pk__in=[record.pk for record in records])
+                    .annotate(**{_ANNOTATION: counts.reference_count_expression(model)})
+                    .values_list("pk", _ANNOTATION)
+                )
+            table._custom_objects_counts = page_counts
+        return page_counts
+
+    def render(self, record, table):
+        count = getattr(record, _ANNOTATION, None)
+        if count is None:
+            count = self._page_counts(table).get(record.pk, 0)
+        return count or "—"
+
+    def value(self, record, table):
+        count = getattr(record, _ANNOTATION, None)
+        return count if count is not None else self._page_counts(table).get(record.pk, 0)
+
+
+def _get_table_class(model_class):
+    """Return the NetBox table for model_class (e.g. dcim.tables.DeviceTable), or None."""
+    try:
+        return import_string(f"{model_class._meta.app_label}.tables.{model_class.__name__}Table")
+    except ImportError:
+        return None
+
+
+def register_count_columns(model_classes):
+    """
+    Make the "Custom Objects" count column available (via Configure Table) on the list
+    table of every model in model_classes that has one.
+    """
+    if not get_plugin_config("netbox_custom_objects_tab", "count_column"):
+        return
+
+    for model_class in model_classes:
+        table_class = _get_table_class(model_class)
+        if table_class is None:
+            continue
+        try:
+            register_table_column(CustomObjectsCountColumn(), "custom_objects", table_class)
+        except ValueError:
+            logger.warning(
+                "netbox_custom_objects_tab: %s already has a custom_objects column — skipping",
+                table_class.__name__,
+            )
+            continue
+        logger.debug("netbox_custom_objects_tab: registered count column on %s", table_class.__name__)
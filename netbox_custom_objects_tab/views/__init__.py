@@ -3,7 +3,10 @@ import logging
 from django.apps import apps
 from netbox.plugins import get_plugin_config
 
+from ..filtersets import register_filters
+from ..tables import register_count_columns
 from .combined import register_combined_tabs
+from .rollup import register_rollup_tabs
 from .typed import register_typed_tabs
 
 logger = logging.getLogger("netbox_custom_objects_tab")
@@ -59,6 +62,9 @@ def register_tabs():
         combined_weight = get_plugin_config("netbox_custom_objects_tab", "combined_weight")
         typed_labels = get_plugin_config("netbox_custom_objects_tab", "typed_models")
         typed_weight = get_plugin_config("netbox_custom_objects_tab", "typed_weight")
+        rollup_config = get_plugin_config("netbox_custom_objects_tab", "rollup_models")
+        rollup_label = get_plugin_config("netbox_custom_objects_tab", "rollup_label")
+        rollup_weight = get_plugin_config("netbox_custom_objects_tab", "rollup_weight")
     except Exception:
         logger.exception("Could not read netbox_custom_objects_tab plugin config")
         return
@@ -66,7 +72,12 @@ def register_tabs():
     if combined_labels:
         combined_models = _resolve_model_labels(combined_labels)
         register_combined_tabs(combined_models, combined_label, combined_weight)
+        register_count_columns(combined_models)
+        register_filters(combined_models)
 
     if typed_labels:
         typed_models = _resolve_model_labels(typed_labels)
         register_typed_tabs(typed_models, typed_weight)
+
+    if rollup_config:
+        register_rollup_tabs(rollup_config, rollup_label, rollup_weight)
@@ -1,20 +1,37 @@
+import csv
+import heapq
+import json
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
 from types import SimpleNamespace
 from urllib.parse import urlencode
 
 import django_tables2 as tables2
-from django.contrib.contenttypes.models import ContentType
+from django.contrib import messages
 from django.core.paginator import InvalidPage
-from django.shortcuts import get_object_or_404, render
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404, redirect, render
+from django.utils.http import url_has_allowed_host_and_scheme
 from django.utils.translation import gettext_lazy as _
 from django.views.generic import View
 from extras.choices import CustomFieldTypeChoices
+from netbox.plugins import get_plugin_config
 from netbox.tables import BaseTable
-from netbox_custom_objects.models import CustomObjectTypeField
 from utilities.htmx import htmx_partial
 from utilities.paginator import EnhancedPaginator, get_paginate_count
 from utilities.views import ViewTab, register_model_view
 
+from .. import bulk, conditional, counters, reference_index
+from ..display import display_key, display_strings
+from ..fragments import render_rows
+from ..profiling import profiled
+from ..references import get_reference_fields, reference_lookup
+from ..routing import read_alias, using
+from ..rows import RowTag, fetch_rows, load_page
+
 logger = logging.getLogger("netbox_custom_objects_tab")
 
 
@@ -40,43 +57,67 @@ class CustomObjectsTabTable(BaseTable):
 _MAX_MULTIOBJECT_DISPLAY = 3
 
 
-def _get_linked_custom_objects(instance):
+def _map_queries(fn, jobs):
     """
-    Return list of (custom_object_instance, CustomObjectTypeField) tuples for all
-    custom objects that reference this instance via OBJECT or MULTIOBJECT fields.
+    Return [fn(job) for job in jobs], in job order.
 
-    Mirrors the query logic in:
-      netbox_custom_objects/template_content.py::CustomObjectLink.left_page()
+    With `fetch_concurrency` > 1 the jobs run on a bounded thread pool: each worker
+    takes jobs until none are left on its own database connection, opened once and
+    closed when the worker finishes, so N per-field round trips overlap instead of
+    adding up. Inside a transaction on the queried database the jobs run serially:
+    other connections would not see its uncommitted rows.
     """
+    jobs = list(jobs)
+    workers = min(get_plugin_config("netbox_custom_objects_tab", "fetch_concurrency") or 1, len(jobs))
+    if workers <= 1 or connections[read_alias() or DEFAULT_DB_ALIAS].in_atomic_block:
+        return [fn(job) for job in jobs]
 
-    content_type = ContentType.objects.get_for_model(instance._meta.model)
-    fields = CustomObjectTypeField.objects.filter(
-        related_object_type=content_type,
-        type__in=[
-            CustomFieldTypeChoices.TYPE_OBJECT,
-            CustomFieldTypeChoices.TYPE_MULTIOBJECT,
-        ],
-    ).select_related("custom_object_type")
+    results = [None] * len(jobs)
+    pending = iter(enumerate(jobs))
+    lock = threading.Lock()
 
-    results = []
-    for field in fields:
+    def _worker(_n):
         try:
-            model = field.custom_object_type.get_model()
-        except Exception:
-            logger.exception(
-                "Could not get model for CustomObjectType %s",
-                field.custom_object_type_id,
-            )
+            while True:
+                with lock:
+                    item = next(pending, None)
+                if item is None:
+                    return
+                index, job = item
+                results[index] = fn(job)
+        finally:
+            # Connections are per thread; release this worker's before the pool thread exits
+            connections.close_all()
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="custom_objects_tab") as executor:
+        list(executor.map(_worker, range(workers)))
+    return results
+
+
+def _capped_count(querysets, cap=None):
+    """
+    Sum the COUNT(*) of `querysets` (any iterable; consumed lazily).
+
+    With a cap, each count runs over a LIMIT subquery (qs[:n].count()) so the database
+    stops after cap + 1 rows in total, and no further querysets are counted once the
+    cap is exceeded.
+    """
+    total = 0
+    for qs in querysets:
+        if not cap:
+            total += qs.count()
             continue
+        total += qs[: cap + 1 - total].count()
+        if total > cap:
+            break
+    return total
 
-        if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
-            for obj in model.objects.filter(**{f"{field.name}_id": instance.pk}).prefetch_related("tags"):
-                results.append((obj, field))
-        elif field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-            for obj in model.objects.filter(**{field.name: instance.pk}).prefetch_related("tags"):
-                results.append((obj, field))
 
-    return results
+def _badge_value(total, cap=None):
+    """Badge text for `total`: None when zero (so hide_if_empty works), "<cap>+" above the cap."""
+    if cap and total > cap:
+        return f"{cap}+"
+    return total if total > 0 else None
 
 
 def _count_linked_custom_objects(instance):
@@ -84,40 +125,88 @@ def _count_linked_custom_objects(instance):
     Badge callable for ViewTab.
     Uses COUNT(*) per queryset — avoids fetching full object rows on every detail page.
     Returns None (not 0) when count is zero so hide_if_empty=True works correctly.
+    With `badge_count_cap` set, counting stops early and returns e.g. "1000+".
     """
+    cap = get_plugin_config("netbox_custom_objects_tab", "badge_count_cap")
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        return _badge_value(counters.count_for_parent(instance), cap)
+    if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        return _badge_value(reference_index.count_for_parent(instance, cap=cap), cap)
 
-    content_type = ContentType.objects.get_for_model(instance._meta.model)
-    fields = CustomObjectTypeField.objects.filter(
-        related_object_type=content_type,
-        type__in=[
-            CustomFieldTypeChoices.TYPE_OBJECT,
-            CustomFieldTypeChoices.TYPE_MULTIOBJECT,
-        ],
-    ).select_related("custom_object_type")
+    db = read_alias()
 
-    total = 0
-    for field in fields:
-        try:
-            model = field.custom_object_type.get_model()
-        except Exception:
-            logger.exception(
-                "Could not get model for CustomObjectType %s",
-                field.custom_object_type_id,
-            )
-            continue
+    def _querysets():
+        for field in get_reference_fields(instance._meta.model):
+            try:
+                model = field.custom_object_type.get_model()
+            except Exception:
+                logger.exception(
+                    "Could not get model for CustomObjectType %s",
+                    field.custom_object_type_id,
+                )
+                continue
 
-        if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
-            total += model.objects.filter(**{f"{field.name}_id": instance.pk}).count()
-        elif field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-            total += model.objects.filter(**{field.name: instance.pk}).count()
+            if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+                yield using(model.objects, db).filter(**{f"{field.name}_id": instance.pk})
+            elif field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+                yield using(model.objects, db).filter(**{field.name: instance.pk})
 
-    return total if total > 0 else None
+    return _badge_value(_capped_count(_querysets(), cap), cap)
 
 
-def _filter_linked_objects(linked, q):
+def _count_by_type(instance):
+    """
+    Return [(custom_object_type, count)] for every type referencing `instance`, by
+    label, without loading any custom object: from the counters or the index when
+    enabled, else one COUNT(*) per reference field.
+    """
+    model_class = instance._meta.model
+    types = {}
+    for field in get_reference_fields(model_class):
+        types.setdefault(field.custom_object_type_id, (field.custom_object_type, []))[1].append(field)
+
+    if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+        totals = counters.count_for_parents(model_class, [[instance.pk]], by_type=True).get(instance.pk, {})
+    elif get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+        totals = reference_index.count_for_parents(model_class, [[instance.pk]], by_type=True).get(instance.pk, {})
+    else:
+        db = read_alias()
+        jobs = []
+        for custom_object_type, fields in types.values():
+            try:
+                model = custom_object_type.get_model()
+            except Exception:
+                logger.exception("Could not get model for CustomObjectType %s", custom_object_type.pk)
+                continue
+            jobs.extend((custom_object_type.slug, model, field) for field in fields)
+
+        def _count(job):
+            slug, model, field = job
+            return slug, using(model.objects, db).filter(**{reference_lookup(field): instance.pk}).count()
+
+        totals = {}
+        for slug, n in _map_queries(_count, jobs):
+            totals[slug] = totals.get(slug, 0) + n
+
+    groups = [(cot, totals.get(cot.slug, 0)) for cot, _fields in types.values()]
+    return sorted(((cot, n) for cot, n in groups if n), key=lambda group: str(group[0]))
+
+
+def _display(obj, displays):
+    """Display string of `obj`: from the precomputed `displays` dict when present, else str(obj)."""
+    if displays:
+        text = displays.get(display_key(obj))
+        if text is not None:
+            return text
+    return str(obj)
+
+
+def _filter_linked_objects(linked, q, displays=None):
     """
     Case-insensitive substring search across the object display name,
     custom object type name, and field label.
+
+    `displays` is the dict returned by display_strings(); when omitted, str(obj) is used.
     """
     q = q.strip().lower()
     if not q:
@@ -125,7 +214,7 @@ def _filter_linked_objects(linked, q):
     return [
         (obj, field)
         for obj, field in linked
-        if q in str(obj).lower() or q in str(field.custom_object_type).lower() or q in str(field).lower()
+        if q in _display(obj, displays).lower() or q in str(field.custom_object_type).lower() or q in str(field).lower()
     ]
 
 
@@ -149,13 +238,174 @@ def _get_field_value(obj, field):
 
 
 # Sort key lambdas keyed by the ?sort= query parameter value.
+# Each takes an (obj, field) pair and the display_strings() dict.
 _SORT_KEYS = {
-    "type": lambda t: str(t[1].custom_object_type).lower(),
-    "object": lambda t: str(t[0]).lower(),
-    "field": lambda t: str(t[1]).lower(),
+    "type": lambda t, displays: str(t[1].custom_object_type).lower(),
+    "object": lambda t, displays: _display(t[0], displays).lower(),
+    "field": lambda t, displays: str(t[1]).lower(),
 }
 
 
+_STREAM_CHUNK_SIZE = 500
+
+
+def _linked_sources(instance, type_slug=""):
+    """
+    Return [(field, model, queryset)] for every reference field pointing at `instance`,
+    in field order, optionally only the fields of the Custom Object Type `type_slug`.
+    """
+    db = read_alias()
+    sources = []
+    for field in get_reference_fields(instance._meta.model):
+        if type_slug and field.custom_object_type.slug != type_slug:
+            continue
+        try:
+            model = field.custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+        sources.append((field, model, using(model.objects, db).filter(**{reference_lookup(field): instance.pk})))
+    return sources
+
+
+def _filter_sources(instance, sources, q="", type_slug="", tag_slug=""):
+    """
+    Apply the tab's filters to `sources`, returning [(field, model, queryset, match_all)].
+
+    Type and tag filters go to SQL. `match_all` is true when every row of the queryset
+    matches `q`: no query, a match on the type or field label, or (with the reference
+    index) a queryset already narrowed to the index rows whose display text matches.
+    Otherwise the display strings are matched while streaming (_iter_source()).
+    """
+    q = q.strip().lower()
+    use_index = bool(q) and get_plugin_config("netbox_custom_objects_tab", "reference_index")
+    result = []
+    for field, model, qs in sources:
+        if type_slug and field.custom_object_type.slug != type_slug:
+            continue
+        if tag_slug:
+            # As a subquery, so the tags join of fetch_rows() still returns every tag
+            qs = qs.filter(pk__in=model.objects.filter(tags__slug=tag_slug).values("pk"))
+        match_all = not q or q in str(field.custom_object_type).lower() or q in str(field).lower()
+        if not match_all and use_index:
+            qs = qs.filter(pk__in=reference_index.matching_custom_objects(instance, field, q))
+            match_all = True
+        result.append((field, model, qs, match_all))
+    return result
+
+
+def _available_tags(sources):
+    """Distinct tags of the custom objects in `sources`, by name, with one query per field."""
+
+    def _tags(source):
+        _field, _model, qs = source
+        return list(
+            qs.filter(tags__isnull=False).order_by().values_list("tags__pk", "tags__slug", "tags__name").distinct()
+        )
+
+    tags = {}
+    for rows in _map_queries(_tags, sources):
+        for pk, slug, name in rows:
+            tags.setdefault(pk, RowTag(pk, slug, name))
+    return sorted(tags.values(), key=lambda t: t.name.lower())
+
+
+def _iter_source(field, model, qs, q="", chunk_size=_STREAM_CHUNK_SIZE):
+    """
+    Yield (row, field, display) for the compact rows of one source in pk order, fetched
+    chunk by chunk (keyset on pk), keeping only rows matching `q` when given.
+    """
+    last_pk = None
+    while True:
+        remaining = qs if last_pk is None else qs.filter(pk__gt=last_pk)
+        chunk = fetch_rows(
+            model,
+            field.custom_object_type_id,
+            qs.filter(pk__in=remaining.order_by("pk").values("pk")[:chunk_size]),
+        )
+        if not chunk:
+            return
+        last_pk = chunk[-1].pk
+        displays = display_strings(chunk)
+        pairs = [(row, field) for row in chunk]
+        if q:
+            pairs = _filter_linked_objects(pairs, q, displays)
+        for row, _field in pairs:
+            yield row, field, _display(row, displays)
+
+
+class _LinkedRows:
+    """
+    Read-only sequence over the combined tab's filtered, sorted rows, for the paginator.
+
+    Nothing is materialized up front. Unsorted pages, and pages sorted by type or field
+    (constant per field, so the fields themselves are ordered), are sliced from the
+    concatenated per-field streams, with LIMIT/OFFSET where no display-string filter
+    applies. Pages sorted by object keep the first `stop` rows of all streams with
+    heapq, i.e. O(page size × page number) rows. The length is one COUNT(*) per
+    field, streaming only the fields filtered on display strings.
+    """
+
+    def __init__(self, sources, q="", sort_col="", sort_dir="asc"):
+        # [(field, model, queryset, match_all)], see _filter_sources()
+        self.q = q.strip().lower()
+        self.sort_col = sort_col
+        self.reverse = sort_dir == "desc"
+        if sort_col in ("type", "field"):
+            sort_key = _SORT_KEYS[sort_col]
+            sources = sorted(sources, key=lambda source: sort_key((None, source[0]), None), reverse=self.reverse)
+        self.sources = sources
+        self._counts = None
+
+    def _stream(self, source):
+        field, model, qs, match_all = source
+        return _iter_source(field, model, qs, "" if match_all else self.q)
+
+    def count(self):
+        if self._counts is None:
+            db_counts = iter(_map_queries(lambda source: source[2].count(), [s for s in self.sources if s[3]]))
+            # Display-string matches are counted serially: streaming reads the request's context
+            self._counts = [
+                next(db_counts) if source[3] else sum(1 for _row in self._stream(source)) for source in self.sources
+            ]
+        return sum(self._counts)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key : key + 1][0]
+        total = self.count()
+        start = key.start or 0
+        stop = total if key.stop is None else key.stop
+
+        if self.sort_col == "object":
+            rows = chain.from_iterable(self._stream(source) for source in self.sources)
+            select = heapq.nlargest if self.reverse else heapq.nsmallest
+            top = select(stop, rows, key=lambda row: row[2].lower())
+            return [(row, field) for row, field, _display in top[start:stop]]
+
+        result = []
+        offset = 0
+        for source, n in zip(self.sources, self._counts):
+            if offset >= stop:
+                break
+            low, high = max(start - offset, 0), min(stop - offset, n)
+            if low < high:
+                field, model, qs, match_all = source
+                if match_all:
+                    page_qs = qs.filter(pk__in=qs.order_by("pk").values("pk")[low:high])
+                    result.extend((row, field) for row in fetch_rows(model, field.custom_object_type_id, page_qs))
+                else:
+                    result.extend((row, field) for row, field, _display in islice(self._stream(source), low, high))
+            offset += n
+        return result
+
+
 def _sort_header(sort_base, col, current_sort, current_dir):
     """
     Build the URL and directional icon for a sortable column header.
@@ -176,6 +426,149 @@ def _sort_header(sort_base, col, current_sort, current_dir):
     return {"url": f"?{qs}", "icon": icon}
 
 
+# Rows fetched per database round trip when streaming an export.
+_EXPORT_CHUNK_SIZE = 2000
+
+_EXPORT_COLUMNS = ("type", "id", "object", "field", "value", "tags")
+
+_EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "json": "application/json",
+}
+
+
+def _resolve_values_bulk(model, field, objects):
+    """
+    Return {custom_object_pk: value} for `objects`, resolving the related objects
+    referenced by `field` with one query per chunk instead of one per row.
+
+    TYPE_OBJECT      → the related instance (or None)
+    TYPE_MULTIOBJECT → list of related instances
+    """
+    related_model = model._meta.get_field(field.name).related_model
+    db = read_alias()
+    if field.type == CustomFieldTypeChoices.TYPE_OBJECT:
+        related_ids = {obj.pk: getattr(obj, f"{field.name}_id", None) for obj in objects}
+        related = using(related_model.objects, db).in_bulk({pk for pk in related_ids.values() if pk is not None})
+        return {obj_pk: related.get(related_pk) for obj_pk, related_pk in related_ids.items()}
+
+    pairs = list(
+        using(model.objects, db)
+        .filter(pk__in=[obj.pk for obj in objects], **{f"{field.name}__isnull": False})
+        .values_list("pk", field.name)
+    )
+    related = using(related_model.objects, db).in_bulk({related_pk for _pk, related_pk in pairs})
+    values = {obj.pk: [] for obj in objects}
+    for obj_pk, related_pk in pairs:
+        if related_pk in related:
+            values[obj_pk].append(related[related_pk])
+    return values
+
+
+def _iter_export_rows(instance, q="", type_slug="", tag_slug="", chunk_size=_EXPORT_CHUNK_SIZE):
+    """
+    Yield one dict per (custom object, field) reference to `instance`, applying the
+    same q/type/tag filters as the tab.
+
+    Each referencing field is streamed with .iterator(chunk_size) and its values are
+    resolved per chunk, so memory stays bounded by chunk_size regardless of how many
+    custom objects reference the instance.
+    """
+    q = q.strip().lower()
+    for field in get_reference_fields(instance._meta.model):
+        custom_object_type = field.custom_object_type
+        if type_slug and custom_object_type.slug != type_slug:
+            continue
+        try:
+            model = custom_object_type.get_model()
+        except Exception:
+            logger.exception(
+                "Could not get model for CustomObjectType %s",
+                field.custom_object_type_id,
+            )
+            continue
+
+        qs = using(model.objects, read_alias()).filter(**{reference_lookup(field): instance.pk})
+        if tag_slug:
+            qs = qs.filter(tags__slug=tag_slug)
+        # A match on the type or field label keeps every row of this field.
+        match_all = not q or q in str(custom_object_type).lower() or q in str(field).lower()
+
+        objects = qs.prefetch_related("tags").iterator(chunk_size=chunk_size)
+        while chunk := list(islice(objects, chunk_size)):
+            displays = display_strings(chunk)
+            if not match_all:
+                chunk = [obj for obj in chunk if q in _display(obj, displays).lower()]
+                if not chunk:
+                    continue
+            values = _resolve_values_bulk(model, field, chunk)
+            for obj in chunk:
+                value = values.get(obj.pk)
+                if isinstance(value, list):
+                    value = ", ".join(str(v) for v in value)
+                yield {
+                    "type": str(custom_object_type),
+                    "id": obj.pk,
+                    "object": _display(obj, displays),
+                    "field": str(field),
+                    "value": "" if value is None else str(value),
+                    "tags": [t.slug for t in obj.tags.all()],
+                }
+
+
+class _Echo:
+    """File-like object whose write() returns the value, for streaming csv.writer output."""
+
+    def write(self, value):
+        return value
+
+
+def _stream_csv(rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow(_EXPORT_COLUMNS)
+    for row in rows:
+        yield writer.writerow([",".join(row[col]) if col == "tags" else row[col] for col in _EXPORT_COLUMNS])
+
+
+def _stream_json(rows):
+    yield "["
+    for i, row in enumerate(rows):
+        yield ("," if i else "") + json.dumps(row)
+    yield "]"
+
+
+def _export_response(instance, export_format, rows):
+    """Wrap a row iterator in a StreamingHttpResponse of the requested format."""
+    stream = _stream_csv(rows) if export_format == "csv" else _stream_json(rows)
+    response = StreamingHttpResponse(stream, content_type=_EXPORT_CONTENT_TYPES[export_format])
+    filename = f"{instance._meta.model_name}-{instance.pk}-custom-objects.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
+def _bulk_tag_choices():
+    """Tags offered by the bulk action toolbar; called by the template only when it renders."""
+    from extras.models import Tag
+
+    return Tag.objects.order_by("name")
+
+
+def _column_preferences(request):
+    """
+    Return (tab_table, selected_columns): an empty CustomObjectsTabTable for the
+    column-preference machinery (no data, just column config) and the column names to render.
+    """
+    tab_table = CustomObjectsTabTable([], empty_text="")
+    visible_cols = None
+    if request.user.is_authenticated and (userconfig := getattr(request.user, "config", None)):
+        visible_cols = userconfig.get(f"tables.{tab_table.name}.columns")
+    if visible_cols is None:
+        visible_cols = list(CustomObjectsTabTable.Meta.default_columns)
+    tab_table._set_columns(visible_cols)
+    selected_columns = {col for col, _ in tab_table.selected_columns} | set(tab_table.exempt_columns)
+    return tab_table, selected_columns
+
+
 def _make_tab_view(model_class, label="Custom Objects", weight=2000):
     """
     Factory that returns a unique View subclass for model_class.
@@ -191,6 +584,7 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
             hide_if_empty=True,
         )
 
+        @profiled
         def get(self, request, pk):
             try:
                 qs = model_class.objects.restrict(request.user, "view")
@@ -198,27 +592,30 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
                 qs = model_class.objects.all()
 
             instance = get_object_or_404(qs, pk=pk)
-            linked_all = _get_linked_custom_objects(instance)
-
-            # Build table object for column-preference machinery (no data, just column config)
-            tab_table = CustomObjectsTabTable([], empty_text="")
-            visible_cols = None
-            if request.user.is_authenticated and (userconfig := getattr(request.user, "config", None)):
-                visible_cols = userconfig.get(f"tables.{tab_table.name}.columns")
-            if visible_cols is None:
-                visible_cols = list(CustomObjectsTabTable.Meta.default_columns)
-            tab_table._set_columns(visible_cols)
-            selected_columns = {col for col, _ in tab_table.selected_columns} | set(tab_table.exempt_columns)
-
-            # Collect unique types for the dropdown (always from the unfiltered list)
-            seen_type_pks = set()
-            available_types = []
-            for _obj, field in linked_all:
-                cot = field.custom_object_type
-                if cot.pk not in seen_type_pks:
-                    seen_type_pks.add(cot.pk)
-                    available_types.append(cot)
-            available_types.sort(key=lambda t: str(t))
+
+            # ?export=csv|json streams every matching row, bypassing pagination and rendering
+            export_format = request.GET.get("export", "")
+            if export_format in _EXPORT_CONTENT_TYPES:
+                rows = _iter_export_rows(
+                    instance,
+                    q=request.GET.get("q", ""),
+                    type_slug=request.GET.get("type", ""),
+                    tag_slug=request.GET.get("tag", "").strip(),
+                )
+                return _export_response(instance, export_format, rows)
+
+            # Answer revalidations with 304 before any row is loaded
+            etag = None
+            if conditional.is_enabled(request):
+                state = conditional.combined_state(instance, get_reference_fields(model_class))
+                etag = conditional.make_etag(request, instance, state)
+                if (response := conditional.not_modified(request, etag)) is not None:
+                    return response
+
+            tab_table, selected_columns = _column_preferences(request)
+            if request.user.is_authenticated:
+                # Row checkboxes feeding the bulk action toolbar
+                selected_columns = selected_columns | {"select"}
 
             # Read filter/sort params
             q = request.GET.get("q", "")
@@ -227,27 +624,48 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
             sort_col = request.GET.get("sort", "")
             sort_dir = request.GET.get("dir", "asc")
             per_page = request.GET.get("per_page", "")
-
-            # Collect unique tags for the dropdown (always from the unfiltered list)
-            seen_tag_slugs = set()
-            available_tags = []
-            for _obj, _field in linked_all:
-                for t in _obj.tags.all():
-                    if t.slug not in seen_tag_slugs:
-                        seen_tag_slugs.add(t.slug)
-                        available_tags.append(t)
-            available_tags.sort(key=lambda t: t.name.lower())
-
-            # Apply filters
-            linked = _filter_linked_objects(linked_all, q)
-            if type_slug:
-                linked = [(obj, field) for obj, field in linked if field.custom_object_type.slug == type_slug]
-            if tag_slug:
-                linked = [(obj, field) for obj, field in linked if tag_slug in {t.slug for t in obj.tags.all()}]
-
-            # In-memory sort (applied after filters, before pagination)
-            if sort_col in _SORT_KEYS:
-                linked.sort(key=_SORT_KEYS[sort_col], reverse=(sort_dir == "desc"))
+            layout = request.GET.get("layout") or get_plugin_config("netbox_custom_objects_tab", "combined_layout")
+            # ?section=<slug>: one lazily loaded section of the grouped layout
+            section = request.GET.get("section", "")
+            if section and not htmx_partial(request):
+                # A section URL opened directly shows the flat list filtered to that type
+                type_slug, section = type_slug or section, ""
+
+            # Grouped layout: one count per type now, each section's rows on expansion
+            if layout == "grouped" and not (section or q or type_slug or tag_slug):
+                groups = _count_by_type(instance)
+                context = {
+                    "object": instance,
+                    "tab": self.tab,
+                    "base_template": (f"{instance._meta.app_label}/{instance._meta.model_name}.html"),
+                    "layout": layout,
+                    "groups": groups,
+                    "q": q,
+                    "available_types": [cot for cot, _count in groups],
+                    "available_tags": [],
+                    "per_page": per_page,
+                    "tab_table": tab_table,
+                    "selected_columns": selected_columns,
+                    "bulk_tags": _bulk_tag_choices,
+                    "return_url": request.get_full_path(),
+                }
+                template = "groups.html" if htmx_partial(request) else "tab.html"
+                response = render(request, f"netbox_custom_objects_tab/combined/{template}", context)
+                return conditional.add_etag(response, etag)
+
+            sources = _linked_sources(instance, type_slug=section)
+
+            # Dropdown choices always come from the unfiltered rows, without loading them
+            available_types = [cot for cot, _n in _count_by_type(instance) if not section or cot.slug == section]
+            available_tags = _available_tags(sources)
+
+            # Filters go to SQL where possible; rows are streamed, never materialized
+            linked = _LinkedRows(
+                _filter_sources(instance, sources, q, type_slug, tag_slug),
+                q=q,
+                sort_col=sort_col if sort_col in _SORT_KEYS else "",
+                sort_dir=sort_dir,
+            )
 
             # Pagination
             paginator = EnhancedPaginator(linked, get_paginate_count(request))
@@ -256,8 +674,12 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
             except (InvalidPage, ValueError):
                 page = paginator.page(1)
 
-            # Resolve field values for just the current page (avoids N+1 on full list)
-            page_rows = [(obj, field, _get_field_value(obj, field)) for obj, field in page.object_list]
+            # Full instances, display strings and field values for just the current page
+            page_objects = load_page(page.object_list)
+            displays = display_strings([obj for obj, _field in page_objects])
+            page_rows = [
+                (obj, field, _get_field_value(obj, field), _display(obj, displays)) for obj, field in page_objects
+            ]
 
             # Build the base query string (without sort/dir) for column sort links
             base_params = {}
@@ -269,6 +691,11 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
                 base_params["tag"] = tag_slug
             if per_page:
                 base_params["per_page"] = per_page
+            if section:
+                base_params["section"] = section
+            if request.GET.get("layout"):
+                # An explicit layout must survive sorting and paging, or the default one comes back
+                base_params["layout"] = layout
             sort_base = urlencode(base_params)
 
             sort_headers = {
@@ -284,6 +711,7 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
                 "page_obj": page,
                 "paginator": paginator,
                 "page_rows": page_rows,
+                "rendered_rows": render_rows(request, page_rows, selected_columns, request.get_full_path()),
                 "q": q,
                 "type_slug": type_slug,
                 "tag_slug": tag_slug,
@@ -292,23 +720,70 @@ def _make_tab_view(model_class, label="Custom Objects", weight=2000):
                 "sort": sort_col,
                 "sort_dir": sort_dir,
                 "sort_headers": sort_headers,
+                "export_base": sort_base,
                 "htmx_table": SimpleNamespace(htmx_url=request.path, embedded=False),
                 "return_url": request.get_full_path(),
                 "tab_table": tab_table,
                 "selected_columns": selected_columns,
+                "bulk_tags": _bulk_tag_choices,
+                "layout": layout,
+                "section": section,
+                # Sections of the grouped layout each swap their own container
+                "list_id": f"custom_objects_list_{section}" if section else "custom_objects_list",
             }
 
             if htmx_partial(request):
-                return render(
+                response = render(
                     request,
                     "netbox_custom_objects_tab/combined/tab_partial.html",
                     context,
                 )
-            return render(
-                request,
-                "netbox_custom_objects_tab/combined/tab.html",
-                context,
-            )
+            else:
+                response = render(
+                    request,
+                    "netbox_custom_objects_tab/combined/tab.html",
+                    context,
+                )
+            return conditional.add_etag(response, etag)
+
+        def post(self, request, pk):
+            try:
+                qs = model_class.objects.restrict(request.user, "view")
+            except AttributeError:
+                qs = model_class.objects.all()
+
+            instance = get_object_or_404(qs, pk=pk)
+            return_url = request.POST.get("return_url", "")
+            if not url_has_allowed_host_and_scheme(return_url, allowed_hosts={request.get_host()}):
+                return_url = request.path
+
+            action = request.POST.get("_action", "")
+            selection = bulk.parse_selection(request.POST.getlist("pk"))
+            if action not in bulk.ACTIONS or not selection:
+                messages.warning(request, _("No custom objects were selected."))
+                return redirect(return_url)
+
+            tags = []
+            if action in ("add_tags", "remove_tags"):
+                from extras.models import Tag
+
+                tags = list(Tag.objects.filter(pk__in=request.POST.getlist("tags")))
+                if not tags:
+                    messages.warning(request, _("No tags were selected."))
+                    return redirect(return_url)
+
+            reference_fields = list(get_reference_fields(model_class))
+            if action == "clear_reference":
+                for field in bulk.uncleared_fields(reference_fields, selection):
+                    messages.warning(
+                        request,
+                        _("{field} is required on {type}; its reference was not removed.").format(
+                            field=field, type=field.custom_object_type
+                        ),
+                    )
+            affected = bulk.apply(request, instance, reference_fields, action, selection, tags)
+            messages.success(request, _("Updated {count} custom objects.").format(count=affected))
+            return redirect(return_url)
 
     _TabView.__name__ = f"{model_class.__name__}CustomObjectsTabView"
     _TabView.__qualname__ = f"{model_class.__name__}CustomObjectsTabView"
@@ -0,0 +1,211 @@
+import logging
+
+from django.apps import apps
+from django.core.paginator import InvalidPage
+from django.shortcuts import get_object_or_404, render
+from django.views.generic import View
+from extras.choices import CustomFieldTypeChoices
+from utilities.paginator import EnhancedPaginator, get_paginate_count
+from utilities.views import ViewTab, register_model_view
+
+from ..display import display_strings
+from ..fragments import render_rows
+from ..profiling import profiled
+from ..references import get_reference_fields, reference_lookup
+from ..routing import read_alias, using
+from .combined import (
+    _column_preferences,
+    _display,
+    _get_field_value,
+    _map_queries,
+)
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+
+def _model_key(model_class):
+    return f"{model_class._meta.app_label}.{model_class._meta.model_name}"
+
+
+def _resolve_rollup_models(config):
+    """
+    Resolve the `rollup_models` setting ({"dcim.site": {"dcim.device": "site", ...}})
+    into [(parent_model, [(child_model, lookup), ...])], skipping unknown models.
+    """
+    result = []
+    for parent_label, children in (config or {}).items():
+        try:
+            parent_model = apps.get_model(parent_label.lower())
+        except (ValueError, LookupError):
+            logger.warning("netbox_custom_objects_tab: could not find rollup model %r — skipping", parent_label)
+            continue
+        child_models = []
+        for child_label, lookup in children.items():
+            try:
+                child_models.append((apps.get_model(child_label.lower()), lookup))
+            except (ValueError, LookupError):
+                logger.warning("netbox_custom_objects_tab: could not find rollup child %r — skipping", child_label)
+        result.append((parent_model, child_models))
+    return result
+
+
+def _rollup_querysets(instance, children):
+    """
+    Return [(field, source_model, queryset)]: one queryset per reference field that
+    points at `instance` itself or at one of its `children` models.
+
+    Child references are matched with `<field> IN (SELECT pk FROM child WHERE <lookup> = instance)`,
+    so the number of statements depends on the number of fields, never on the number of children.
+    """
+    db = read_alias()
+    sources = [(instance._meta.model, None)]
+    sources += [
+        (child_model, using(child_model.objects, db).filter(**{lookup: instance.pk}).values("pk"))
+        for child_model, lookup in children
+    ]
+
+    result = []
+    for source_model, child_pks in sources:
+        fields = sorted(
+            get_reference_fields(source_model),
+            key=lambda f: (str(f.custom_object_type).lower(), str(f).lower()),
+        )
+        for field in fields:
+            try:
+                model = field.custom_object_type.get_model()
+            except Exception:
+                logger.exception("Could not get model for CustomObjectType %s", field.custom_object_type_id)
+                continue
+            lookup = reference_lookup(field)
+            if child_pks is None:
+                qs = using(model.objects, db).filter(**{lookup: instance.pk})
+            else:
+                qs = using(model.objects, db).filter(**{f"{lookup}__in": child_pks})
+            if field.type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+                # One row per custom object even when it references several children
+                qs = qs.distinct()
+            result.append((field, source_model, qs.order_by("pk")))
+    return result
+
+
+class _RollupRows:
+    """
+    Read-only sequence over the concatenated per-field querysets, for the paginator.
+
+    The length is the sum of the precomputed counts; slicing queries only the fields
+    overlapping the requested range, with LIMIT/OFFSET, and yields (obj, field) pairs.
+    """
+
+    def __init__(self, parts):
+        # [(field, queryset, count)], empty fields dropped
+        self.parts = [part for part in parts if part[2]]
+
+    def count(self):
+        return sum(n for _field, _qs, n in self.parts)
+
+    def __len__(self):
+        return self.count()
+
+    def __getitem__(self, key):
+        if not isinstance(key, slice):
+            return self[key : key + 1][0]
+        start = key.start or 0
+        stop = self.count() if key.stop is None else key.stop
+        rows = []
+        offset = 0
+        for field, qs, n in self.parts:
+            if offset >= stop:
+                break
+            low, high = max(start - offset, 0), min(stop - offset, n)
+            if low < high:
+                rows.extend((obj, field) for obj in qs.prefetch_related("tags")[low:high])
+            offset += n
+        return rows
+
+
+def _make_rollup_view(model_class, children, label, weight):
+    """Factory returning the rollup tab View subclass for `model_class`."""
+
+    class _RollupTabView(View):
+        tab = ViewTab(
+            label=label,
+            weight=weight,
+        )
+
+        @profiled
+        def get(self, request, pk):
+            try:
+                qs = model_class.objects.restrict(request.user, "view")
+            except AttributeError:
+                qs = model_class.objects.all()
+
+            instance = get_object_or_404(qs, pk=pk)
+
+            querysets = _rollup_querysets(instance, children)
+            # One COUNT per field: feeds both the facets and the paginator
+            counts = _map_queries(lambda item: item[2].count(), querysets)
+
+            facets = {}
+            for (_field, source_model, _qs), n in zip(querysets, counts):
+                key = _model_key(source_model)
+                facet = facets.setdefault(
+                    key, {"key": key, "label": source_model._meta.verbose_name_plural, "count": 0}
+                )
+                facet["count"] += n
+
+            child = request.GET.get("child", "")
+            if child not in facets:
+                child = ""
+            rows = _RollupRows(
+                (field, qs, n)
+                for (field, source_model, qs), n in zip(querysets, counts)
+                if not child or _model_key(source_model) == child
+            )
+
+            paginator = EnhancedPaginator(rows, get_paginate_count(request))
+            try:
+                page = paginator.page(int(request.GET.get("page", 1)))
+            except (InvalidPage, ValueError):
+                page = paginator.page(1)
+
+            page_objects = list(page.object_list)
+            displays = display_strings([obj for obj, _field in page_objects])
+            page_rows = [
+                (obj, field, _get_field_value(obj, field), _display(obj, displays)) for obj, field in page_objects
+            ]
+            tab_table, selected_columns = _column_preferences(request)
+
+            context = {
+                "object": instance,
+                "tab": self.tab,
+                "base_template": f"{instance._meta.app_label}/{instance._meta.model_name}.html",
+                "page_obj": page,
+                "paginator": paginator,
+                "page_rows": page_rows,
+                "rendered_rows": render_rows(request, page_rows, selected_columns, request.get_full_path()),
+                "facets": [facet for facet in facets.values() if facet["count"]],
+                "total": sum(counts),
+                "child": child,
+                "tab_table": tab_table,
+                "selected_columns": selected_columns,
+            }
+            return render(request, "netbox_custom_objects_tab/rollup/tab.html", context)
+
+    _RollupTabView.__name__ = f"{model_class.__name__}CustomObjectsRollupTabView"
+    _RollupTabView.__qualname__ = f"{model_class.__name__}CustomObjectsRollupTabView"
+    return _RollupTabView
+
+
+def register_rollup_tabs(config, label, weight):
+    """Register a rollup tab for each parent model in the `rollup_models` setting."""
+    for model_class, children in _resolve_rollup_models(config):
+        register_model_view(
+            model_class,
+            name="custom_objects_rollup",
+            path="custom-objects-rollup",
+        )(_make_rollup_view(model_class, children, label, weight))
+        logger.debug(
+            "netbox_custom_objects_tab: registered rollup tab for %s with %d child models",
+            _model_key(model_class),
+            len(children),
+        )
@@ -1,12 +1,17 @@
+import csv
 import logging
 
+import yaml
 from django.contrib.contenttypes.models import ContentType
 from django.db.models import Q
 from django.db.utils import OperationalError, ProgrammingError
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404, render
 from django.views.generic import View
+from django_tables2.rows import BoundRow
 from extras.choices import CustomFieldTypeChoices, CustomFieldUIVisibleChoices
 from netbox.forms import NetBoxModelFilterSetForm
+from netbox.plugins import get_plugin_config
 from netbox_custom_objects import field_types
 from netbox_custom_objects.filtersets import get_filterset_class
 from netbox_custom_objects.models import CustomObjectTypeField
@@ -14,6 +19,11 @@ from netbox_custom_objects.tables import CustomObjectTable
 from utilities.forms.fields import TagFilterField
 from utilities.views import ViewTab, register_model_view
 
+from .. import conditional, counters, reference_index
+from ..profiling import profiled
+from ..routing import read_alias, using
+from .combined import _EXPORT_CHUNK_SIZE, _badge_value, _capped_count, _Echo
+
 logger = logging.getLogger("netbox_custom_objects_tab")
 
 
@@ -99,10 +109,16 @@ def _count_for_type(custom_object_type, field_infos):
     """
     Return a badge callable for one Custom Object Type.
     field_infos = list of (field_name, field_type) for fields referencing the parent model.
-    Uses COUNT(*) only. Returns None when 0.
+    Uses COUNT(*) only (capped by `badge_count_cap`). Returns None when 0.
     """
 
     def _badge(instance):
+        cap = get_plugin_config("netbox_custom_objects_tab", "badge_count_cap")
+        if get_plugin_config("netbox_custom_objects_tab", "reference_counters"):
+            return _badge_value(counters.count_for_parent(instance, custom_object_type.pk), cap)
+        if get_plugin_config("netbox_custom_objects_tab", "reference_index"):
+            return _badge_value(reference_index.count_for_parent(instance, custom_object_type.pk, cap=cap), cap)
+
         try:
             dynamic_model = custom_object_type.get_model()
         except Exception:
@@ -112,18 +128,115 @@ def _count_for_type(custom_object_type, field_infos):
             )
             return None
 
-        total = 0
-        for field_name, field_type in field_infos:
-            if field_type == CustomFieldTypeChoices.TYPE_OBJECT:
-                total += dynamic_model.objects.filter(**{f"{field_name}_id": instance.pk}).count()
-            elif field_type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
-                total += dynamic_model.objects.filter(**{field_name: instance.pk}).count()
-
-        return total if total > 0 else None
+        db = read_alias()
+        querysets = (
+            using(dynamic_model.objects, db).filter(
+                **{f"{field_name}_id" if field_type == CustomFieldTypeChoices.TYPE_OBJECT else field_name: instance.pk}
+            )
+            for field_name, field_type in field_infos
+            if field_type in (CustomFieldTypeChoices.TYPE_OBJECT, CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        )
+        return _badge_value(_capped_count(querysets, cap), cap)
 
     return _badge
 
 
+def _visible_related_lookups(table, custom_object_type):
+    """
+    (select_related, prefetch_related) lookups for the columns still visible after
+    table.configure(): OBJECT fields are joined, MULTIOBJECT fields and tags prefetched.
+    """
+    field_types = {field.name: field.type for field in custom_object_type.fields.all()}
+    select, prefetch = [], []
+    for name, column in table.columns.iteritems():
+        if not column.visible:
+            continue
+        if name == "tags":
+            prefetch.append(name)
+        elif field_types.get(name) == CustomFieldTypeChoices.TYPE_OBJECT:
+            select.append(name)
+        elif field_types.get(name) == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
+            prefetch.append(name)
+    return select, prefetch
+
+
+def _load_related(table, select, prefetch):
+    """
+    Apply the lookups to the rows about to be rendered. configure() has already sliced
+    the current page, but the sliced queryset is not evaluated until rendering.
+    """
+    if not select and not prefetch:
+        return
+    rows = table.paginated_rows
+    # Paginated rows hold the sliced QuerySet itself, unpaginated ones a TableQuerysetData
+    owner = rows.data if hasattr(rows.data, "data") else rows
+    owner.data = owner.data.select_related(*select).prefetch_related(*prefetch)
+
+
+_TYPED_EXPORT_CONTENT_TYPES = {
+    "csv": "text/csv",
+    "yaml": "application/yaml",
+}
+
+# Selection checkbox and action buttons carry no data
+_NON_EXPORT_COLUMNS = ("pk", "actions")
+
+
+def _export_columns(table):
+    """(name, header) of the visible data columns, in the user's configured order."""
+    return [
+        (name, str(column.header))
+        for name, column in table.columns.iteritems()
+        if column.visible and name not in _NON_EXPORT_COLUMNS
+    ]
+
+
+def _export_value(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, tuple, set)):
+        return ", ".join(str(v) for v in value)
+    return str(value)
+
+
+def _iter_typed_export_rows(table, columns, select, prefetch, chunk_size=_EXPORT_CHUNK_SIZE):
+    """
+    Yield one list of cell values per row of the table's filtered and ordered queryset.
+
+    Rows are streamed with .iterator(chunk_size); the related objects of the visible
+    columns are joined or prefetched per chunk, so memory stays bounded by chunk_size.
+    """
+    queryset = table.data.data.select_related(*select).prefetch_related(*prefetch)
+    for obj in queryset.iterator(chunk_size=chunk_size):
+        row = BoundRow(obj, table=table)
+        yield [_export_value(row.get_cell_value(name)) for name, _header in columns]
+
+
+def _stream_typed_csv(columns, rows):
+    writer = csv.writer(_Echo())
+    yield writer.writerow([header for _name, header in columns])
+    for values in rows:
+        yield writer.writerow(values)
+
+
+def _stream_typed_yaml(columns, rows):
+    names = [name for name, _header in columns]
+    for values in rows:
+        # Each document fragment is one item of a top-level YAML list
+        yield yaml.safe_dump([dict(zip(names, values))], sort_keys=False, allow_unicode=True)
+
+
+def _typed_export_response(instance, custom_object_type, table, export_format, select, prefetch):
+    """Stream the configured columns of every filtered row as CSV or YAML."""
+    columns = _export_columns(table)
+    rows = _iter_typed_export_rows(table, columns, select, prefetch)
+    stream = _stream_typed_csv(columns, rows) if export_format == "csv" else _stream_typed_yaml(columns, rows)
+    response = StreamingHttpResponse(stream, content_type=_TYPED_EXPORT_CONTENT_TYPES[export_format])
+    filename = f"{instance._meta.model_name}-{instance.pk}-{custom_object_type.slug}.{export_format}"
+    response["Content-Disposition"] = f'attachment; filename="{filename}"'
+    return response
+
+
 def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
     """
     Factory returning a View subclass for a per-type tab.
@@ -142,6 +255,7 @@ def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
             hide_if_empty=True,
         )
 
+        @profiled
         def get(self, request, pk):
             try:
                 qs = model_class.objects.restrict(request.user, "view")
@@ -190,7 +304,23 @@ def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
                 elif field_type == CustomFieldTypeChoices.TYPE_MULTIOBJECT:
                     q_filter |= Q(**{field_name: instance.pk})
 
-            base_qs = dynamic_model.objects.filter(q_filter).distinct()
+            db = read_alias()
+            export_format = request.GET.get("export", "")
+
+            # Answer revalidations with 304 before the table is built
+            etag = None
+            if conditional.is_enabled(request) and export_format not in _TYPED_EXPORT_CONTENT_TYPES:
+                state = {
+                    "schema": conditional.schema_version(cot),
+                    "m2m": conditional.m2m_versions([cot.pk]).get(cot.pk),
+                    "fields": field_infos,
+                    **conditional.typed_state(using(dynamic_model.objects, db).filter(q_filter)),
+                }
+                etag = conditional.make_etag(request, instance, state)
+                if (response := conditional.not_modified(request, etag)) is not None:
+                    return response
+
+            base_qs = using(dynamic_model.objects, db).filter(q_filter).distinct()
 
             # Apply filterset
             filterset_class = get_filterset_class(dynamic_model)
@@ -211,6 +341,13 @@ def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
             table.embedded = False
 
             table.configure(request)
+            select, prefetch = _visible_related_lookups(table, cot)
+
+            # ?export=csv|yaml streams every filtered row with the configured columns
+            if export_format in _TYPED_EXPORT_CONTENT_TYPES:
+                return _typed_export_response(instance, cot, table, export_format, select, prefetch)
+
+            _load_related(table, select, prefetch)
 
             # User preferences for paginator placement
             preferences = {}
@@ -220,6 +357,9 @@ def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
                 preferences = {"pagination.placement": "bottom"}
 
             return_url = request.get_full_path()
+            export_params = request.GET.copy()
+            for param in ("export", "page"):
+                export_params.pop(param, None)
 
             context = {
                 "object": instance,
@@ -231,11 +371,14 @@ def _make_typed_tab_view(model_class, custom_object_type, field_infos, weight):
                 "custom_object_type": cot,
                 "model": dynamic_model,
                 "preferences": preferences,
+                "export_base": export_params.urlencode(),
             }
 
             if request.htmx and not request.htmx.boosted:
-                return render(request, "htmx/table.html", context)
-            return render(request, "netbox_custom_objects_tab/typed/tab.html", context)
+                response = render(request, "htmx/table.html", context)
+            else:
+                response = render(request, "netbox_custom_objects_tab/typed/tab.html", context)
+            return conditional.add_etag(response, etag)
 
     _TypedTabView.__name__ = f"{model_class.__name__}_{custom_object_type.slug}_TypedTabView"
     _TypedTabView.__qualname__ = f"{model_class.__name__}_{custom_object_type.slug}_TypedTabView"
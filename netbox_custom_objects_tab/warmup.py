@@ -0,0 +1,145 @@
+"""
+Cache warm-up for the warm_custom_objects_tab management command.
+
+Custom objects of every Custom Object Type that references a model in
+`combined_models`/`typed_models` are walked in pk-ordered batches and their display
+strings written to the shared cache (see display.py), so the first visitors after a
+deploy or cache flush do not compute them row by row. Batches run on a process pool
+whose workers open their own database connections; a JSON state file records the
+last pk warmed per type so an interrupted run resumes where it stopped.
+
+Field metadata, generated dynamic models and typed table classes are cached inside
+each NetBox worker process and cannot be warmed from another process.
+"""
+
+import json
+import logging
+import multiprocessing
+import os
+import time
+from itertools import islice
+
+from django.contrib.contenttypes.models import ContentType
+from django.db import connections
+from netbox.plugins import get_plugin_config
+from netbox_custom_objects.models import CustomObjectTypeField
+
+from .display import display_strings
+from .reference_index import _REFERENCE_FIELD_TYPES
+
+logger = logging.getLogger("netbox_custom_objects_tab")
+
+
+def configured_models():
+    """Model classes listed in `combined_models` and `typed_models`."""
+    from .views import _resolve_model_labels
+
+    labels = list(get_plugin_config("netbox_custom_objects_tab", "combined_models") or [])
+    labels += get_plugin_config("netbox_custom_objects_tab", "typed_models") or []
+    return _resolve_model_labels(labels)
+
+
+def target_types(model_classes):
+    """Custom Object Types with a reference field pointing at one of `model_classes`, by pk."""
+    from netbox_custom_objects.models import CustomObjectType
+
+    content_types = ContentType.objects.get_for_models(*model_classes).values()
+    type_ids = (
+        CustomObjectTypeField.objects.filter(
+            type__in=_REFERENCE_FIELD_TYPES,
+            related_object_type__in=content_types,
+        )
+        .values_list("custom_object_type_id", flat=True)
+        .distinct()
+    )
+    return list(CustomObjectType.objects.filter(pk__in=type_ids).order_by("pk"))
+
+
+def iter_batches(custom_object_type, batch_size, after_pk=None):
+    """Yield (custom_object_type_id, first_pk, last_pk, size) covering the type's objects after `after_pk`."""
+    try:
+        model = custom_object_type.get_model()
+    except Exception:
+        logger.exception("Could not get model for CustomObjectType %s", custom_object_type.pk)
+        return
+    qs = model.objects.order_by("pk")
+    if after_pk is not None:
+        qs = qs.filter(pk__gt=after_pk)
+    pks = qs.values_list("pk", flat=True).iterator(chunk_size=batch_size)
+    while chunk := list(islice(pks, batch_size)):
+        yield custom_object_type.pk, chunk[0], chunk[-1], len(chunk)
+
+
+def throttle(batches, rate):
+    """Pass `batches` through, sleeping so that at most `rate` objects per second are dispatched."""
+    started = time.monotonic()
+    dispatched = 0
+    for batch in batches:
+        if rate:
+            delay = started + dispatched / rate - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+        dispatched += batch[3]
+        yield batch
+
+
+def warm_batch(batch):
+    """Warm the display strings of one batch; returns the batch for checkpointing."""
+    from netbox_custom_objects.models import CustomObjectType
+
+    custom_object_type_id, first_pk, last_pk, _size = batch
+    model = CustomObjectType.objects.get(pk=custom_object_type_id).get_model()
+    display_strings(list(model.objects.filter(pk__gte=first_pk, pk__lte=last_pk)))
+    return batch
+
+
+def _init_worker():
+    # Forked workers must not reuse the parent's database sockets
+    connections.close_all()
+
+
+def load_state(path):
+    if not path or not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        return {int(cot_id): pk for cot_id, pk in json.load(f).items()}
+
+
+def save_state(path, state):
+    if not path:
+        return
+    tmp = f"{path}.tmp"
+    with open(tmp, "w") as f:
+        json.dump({str(cot_id): pk for cot_id, pk in state.items()}, f)
+    os.replace(tmp, path)
+
+
+def _closing_connections(batches):
+    """
+    Pass `batches` through, then close the database connections of the consuming thread.
+
+    Pool.imap() consumes its input in the pool's task-handler thread, so the queries
+    behind a lazy `batches` open a connection there that nothing else would close.
+    """
+    try:
+        yield from batches
+    finally:
+        connections.close_all()
+
+
+def run(batches, workers=1, on_done=None):
+    """
+    Warm `batches` in order, on a pool of `workers` processes when greater than one.
+    `on_done(batch)` is called as each batch completes, in dispatch order.
+    """
+    if workers <= 1:
+        for batch in map(warm_batch, batches):
+            if on_done:
+                on_done(batch)
+        return
+
+    connections.close_all()
+    with multiprocessing.get_context("fork").Pool(workers, initializer=_init_worker) as pool:
+        for batch in pool.imap(warm_batch, _closing_connections(batches)):
+            if on_done:
+                on_done(batch)
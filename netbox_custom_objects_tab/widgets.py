@@ -0,0 +1,163 @@
+"""
+Dashboard widget listing the objects referenced by the most custom objects.
+
+The ranking is one grouped query (see counts.top_referenced()), narrowed to the
+objects the user may view with one permission-restricted query per model. The
+visible ranking is cached for the widget's refresh interval, per permission
+signature, so users with the same permissions share it.
+"""
+
+import hashlib
+from collections import defaultdict
+
+from django import forms
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.template.loader import render_to_string
+from django.urls import NoReverseMatch, reverse
+from django.utils.translation import gettext_lazy as _
+from extras.dashboard.utils import register_widget
+from extras.dashboard.widgets import DashboardWidget, WidgetConfigForm
+from netbox_custom_objects.models import CustomObjectTypeField
+
+from .conditional import permission_signature
+from .counts import top_referenced
+from .reference_index import _REFERENCE_FIELD_TYPES
+
+# Most ranked objects inspected per ranking, bounding the work for users who may view
+# only few of the most referenced objects
+_MAX_RANKED = 1000
+
+
+def _model_choices():
+    """Models referenced by at least one OBJECT/MULTIOBJECT field."""
+    content_type_ids = (
+        CustomObjectTypeField.objects.filter(type__in=_REFERENCE_FIELD_TYPES, related_object_type__isnull=False)
+        .values_list("related_object_type", flat=True)
+        .distinct()
+    )
+    content_types = ContentType.objects.filter(pk__in=content_type_ids).order_by("app_label", "model")
+    return [(ct.pk, f"{ct.app_label} | {ct.name}") for ct in content_types]
+
+
+def _type_choices():
+    from netbox_custom_objects.models import CustomObjectType
+
+    return [(cot.pk, str(cot)) for cot in CustomObjectType.objects.order_by("name")]
+
+
+def _object_url(obj):
+    """The object's combined Custom Objects tab when it has one, else its detail page."""
+    try:
+        return reverse(f"{obj._meta.app_label}:{obj._meta.model_name}_custom_objects", kwargs={"pk": obj.pk})
+    except NoReverseMatch:
+        return obj.get_absolute_url()
+
+
+def _viewable_objects(user, ranking):
+    """{(parent_ct_id, parent_pk): object} for the ranked objects `user` may view."""
+    pks_by_type = defaultdict(set)
+    for content_type_id, pk, _count in ranking:
+        pks_by_type[content_type_id].add(pk)
+
+    objects = {}
+    for content_type_id, pks in pks_by_type.items():
+        model = ContentType.objects.get_for_id(content_type_id).model_class()
+        if model is None:
+            continue
+        try:
+            qs = model.objects.restrict(user, "view")
+        except AttributeError:
+            qs = model.objects.all()
+        for pk, obj in qs.in_bulk(pks).items():
+            objects[content_type_id, pk] = obj
+    return objects
+
+
+def visible_ranking(user, limit, content_type_ids=None, custom_object_type_ids=None):
+    """
+    Return ([(parent_ct_id, parent_pk, count)], objects) for the `limit` most referenced
+    objects `user` may view. The ranking is fetched in growing windows until enough of
+    its objects are visible, the ranking is exhausted, or _MAX_RANKED is reached.
+    """
+    window = limit
+    while True:
+        ranking = top_referenced(window, content_type_ids, custom_object_type_ids)
+        objects = _viewable_objects(user, ranking)
+        visible = [entry for entry in ranking if entry[:2] in objects]
+        if len(visible) >= limit or len(ranking) < window or window >= _MAX_RANKED:
+            return visible[:limit], objects
+        window = min(window * 4, _MAX_RANKED)
+
+
+def ranked_objects(user, limit, content_type_ids=None, custom_object_type_ids=None, cache_timeout=0):
+    """
+    Rows of the `limit` most referenced objects `user` may view, in rank order. With a
+    `cache_timeout` the visible ranking is cached per permission signature.
+    """
+    content_type_ids = sorted(content_type_ids or ())
+    custom_object_type_ids = sorted(custom_object_type_ids or ())
+    key = ranking = None
+    if cache_timeout:
+        signature = f"{permission_signature(user)}:{limit}:{content_type_ids}:{custom_object_type_ids}"
+        key = f"netbox_custom_objects_tab:top:{hashlib.sha256(signature.encode()).hexdigest()}"
+        ranking = cache.get(key)
+
+    if ranking is None:
+        ranking, objects = visible_ranking(user, limit, content_type_ids, custom_object_type_ids)
+        if key:
+            cache.set(key, ranking, cache_timeout)
+    else:
+        objects = _viewable_objects(user, ranking)
+
+    rows = []
+    for content_type_id, pk, count in ranking:
+        if (obj := objects.get((content_type_id, pk))) is not None:
+            rows.append({"object": obj, "model": obj._meta.verbose_name, "url": _object_url(obj), "count": count})
+    return rows
+
+
+@register_widget
+class MostReferencedObjectsWidget(DashboardWidget):
+    default_title = _("Most referenced objects")
+    description = _("Objects referenced by the most custom objects.")
+    default_config = {"limit": 10, "cache_timeout": 300}
+    template_name = "netbox_custom_objects_tab/widgets/most_referenced.html"
+
+    class ConfigForm(WidgetConfigForm):
+        limit = forms.IntegerField(
+            label=_("Number of objects"),
+            min_value=1,
+            max_value=100,
+            initial=10,
+        )
+        models = forms.TypedMultipleChoiceField(
+            label=_("Models"),
+            choices=_model_choices,
+            coerce=int,
+            required=False,
+            help_text=_("Only rank objects of these models (default: all)."),
+        )
+        custom_object_types = forms.TypedMultipleChoiceField(
+            label=_("Custom Object Types"),
+            choices=_type_choices,
+            coerce=int,
+            required=False,
+            help_text=_("Only count references from these types (default: all)."),
+        )
+        cache_timeout = forms.IntegerField(
+            label=_("Refresh interval"),
+            min_value=0,
+            initial=300,
+            help_text=_("Seconds the ranking is cached; 0 recomputes it on every render."),
+        )
+
+    def render(self, request):
+        rows = ranked_objects(
+            request.user,
+            limit=self.config.get("limit", 10),
+            content_type_ids=self.config.get("models"),
+            custom_object_type_ids=self.config.get("custom_object_types"),
+            cache_timeout=self.config.get("cache_timeout", 300),
+        )
+        return render_to_string(self.template_name, {"rows": rows})
@@ -77,6 +77,7 @@ _mock('utilities')
 _mock('utilities.views', ViewTab=MagicMock(), register_model_view=MagicMock())
 _mock('utilities.paginator', EnhancedPaginator=MagicMock(), get_paginate_count=MagicMock())
 _mock('utilities.htmx', htmx_partial=MagicMock())
+_mock('utilities.tables', register_table_column=MagicMock())
 _mock('utilities.forms')
 _mock('utilities.forms.fields', TagFilterField=MagicMock())
 
@@ -122,8 +123,24 @@ _mock('netbox.tables', BaseTable=_FakeBaseTable)
 
 # --- netbox_custom_objects.* ---
 _mock('netbox_custom_objects')
-_mock('netbox_custom_objects.models', CustomObjectTypeField=MagicMock())
+_CustomObject = type('CustomObject', (), {})
+_mock('netbox_custom_objects.models', CustomObjectTypeField=MagicMock(), CustomObject=_CustomObject)
 _mock('netbox_custom_objects.field_types', FIELD_TYPE_CLASS={})
 _mock('netbox_custom_objects.filtersets', get_filterset_class=MagicMock())
 _CustomObjectTable = type('CustomObjectTable', (), {})
 _mock('netbox_custom_objects.tables', CustomObjectTable=_CustomObjectTable)
+
+# --- rest_framework.* / netbox.api.* ---
+class _ValidationError(Exception):
+    pass
+
+
+class _NotFound(Exception):
+    pass
+
+
+_mock('rest_framework.views', APIView=type('APIView', (), {}))
+_mock('rest_framework.response', Response=MagicMock())
+_mock('rest_framework.exceptions', NotFound=_NotFound, ValidationError=_ValidationError)
+_mock('rest_framework.utils.urls', replace_query_param=MagicMock())
+_mock('netbox.api.authentication', IsAuthenticatedOrLoginNotRequired=MagicMock())
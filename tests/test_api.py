@@ -0,0 +1,114 @@
+"""
+Unit tests for netbox_custom_objects_tab.api helpers.
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from extras.choices import CustomFieldTypeChoices
+
+
+class TestCursor:
+    def test_round_trip(self):
+        from netbox_custom_objects_tab.api.views import _decode_cursor, _encode_cursor
+
+        assert _decode_cursor(_encode_cursor(12, 3456)) == (12, 3456)
+
+    def test_invalid_cursor_raises_validation_error(self):
+        from netbox_custom_objects_tab.api.views import ValidationError, _decode_cursor
+
+        with pytest.raises(ValidationError):
+            _decode_cursor("not-a-cursor")
+
+
+class TestParseFields:
+    def test_empty_selects_all(self):
+        from netbox_custom_objects_tab.api.views import ROW_FIELDS, _parse_fields
+
+        assert _parse_fields("") == set(ROW_FIELDS)
+
+    def test_subset(self):
+        from netbox_custom_objects_tab.api.views import _parse_fields
+
+        assert _parse_fields("type, object") == {"type", "object"}
+
+    def test_unknown_field_rejected(self):
+        from netbox_custom_objects_tab.api.views import ValidationError, _parse_fields
+
+        with pytest.raises(ValidationError):
+            _parse_fields("type,bogus")
+
+
+class TestIterLinked:
+    def _field(self, pk, objects):
+        """Field whose queryset returns `objects` (already pk-ordered) honouring pk__gt and slicing."""
+        field = MagicMock()
+        field.pk = pk
+        field.name = f"ref_{pk}"
+        field.type = CustomFieldTypeChoices.TYPE_OBJECT
+        field.custom_object_type.slug = "server"
+
+        def make_qs(items):
+            qs = MagicMock()
+            qs.filter.side_effect = lambda **kw: make_qs([o for o in items if o.pk > kw.get("pk__gt", -1)])
+            qs.prefetch_related.return_value = qs
+            qs.__getitem__ = lambda self, s: items[s]
+            return qs
+
+        model = field.custom_object_type.get_model.return_value
+        model.objects.filter.return_value.order_by.return_value = make_qs(objects)
+        return field
+
+    def _objs(self, *pks):
+        return [MagicMock(pk=pk) for pk in pks]
+
+    def test_orders_by_field_then_object(self):
+        from netbox_custom_objects_tab.api.views import _iter_linked
+
+        f2 = self._field(2, self._objs(5))
+        f1 = self._field(1, self._objs(7, 9))
+        rows = [(field.pk, obj.pk) for obj, field, _m in _iter_linked(MagicMock(), [f2, f1], chunk_size=2)]
+        assert rows == [(1, 7), (1, 9), (2, 5)]
+
+    def test_custom_objects_restricted_to_user(self):
+        from netbox_custom_objects_tab.api.views import _iter_linked
+
+        field = self._field(1, self._objs(7))
+        user = MagicMock()
+        list(_iter_linked(MagicMock(), [field], user=user))
+
+        qs = field.custom_object_type.get_model.return_value.objects.filter.return_value.order_by.return_value
+        qs.restrict.assert_called_once_with(user, "view")
+
+    def test_resumes_after_cursor(self):
+        from netbox_custom_objects_tab.api.views import _iter_linked
+
+        f1 = self._field(1, self._objs(7, 9))
+        f2 = self._field(2, self._objs(5))
+        rows = [(field.pk, obj.pk) for obj, field, _m in _iter_linked(MagicMock(), [f1, f2], after=(1, 7))]
+        assert rows == [(1, 9), (2, 5)]
+
+
+class TestPageSize:
+    @staticmethod
+    def _page_size(value, paginate_count=50, max_page_size=1000):
+        from netbox_custom_objects_tab.api.views import _page_size
+
+        config = MagicMock(PAGINATE_COUNT=paginate_count, MAX_PAGE_SIZE=max_page_size)
+        netbox_config = MagicMock(get_config=MagicMock(return_value=config))
+        with patch.dict(sys.modules, {"netbox.config": netbox_config}):
+            return _page_size(value)
+
+    def test_defaults_to_paginate_count_from_dynamic_config(self):
+        assert self._page_size(None) == 50
+
+    def test_capped_at_max_page_size(self):
+        assert self._page_size("5000") == 1000
+        assert self._page_size("5000", max_page_size=0) == 5000
+
+    def test_invalid_limit(self):
+        from netbox_custom_objects_tab.api.views import ValidationError
+
+        with pytest.raises(ValidationError):
+            self._page_size("many")
@@ -0,0 +1,182 @@
+"""
+Unit tests for netbox_custom_objects_tab.bulk (batched bulk actions of the combined tab).
+"""
+
+import sys
+from contextlib import nullcontext
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+
+
+def _field(pk, name="device", field_type=CustomFieldTypeChoices.TYPE_OBJECT, cot_id=3):
+    field = MagicMock()
+    field.pk = pk
+    field.name = name
+    field.type = field_type
+    field.custom_object_type_id = cot_id
+    field.required = False
+    return field
+
+
+def _obj(pk):
+    obj = MagicMock()
+    obj.pk = pk
+    obj._prechange_snapshot = None
+    obj.__str__.return_value = f"Object {pk}"
+
+    def _snapshot():
+        obj._prechange_snapshot = {"pk": pk}
+
+    def _to_objectchange(action):
+        # Like NetBox's ChangeLoggingMixin.to_objectchange()
+        return SimpleNamespace(action=action, object_repr="", prechange_data=obj._prechange_snapshot)
+
+    obj.snapshot.side_effect = _snapshot
+    obj.to_objectchange.side_effect = _to_objectchange
+    return obj
+
+
+class TestParseSelection:
+    def test_groups_pks_by_field(self):
+        from netbox_custom_objects_tab.bulk import parse_selection
+
+        assert parse_selection(["3:7:1", "3:7:2", "4:8:1"]) == {7: {1, 2}, 8: {1}}
+
+    def test_skips_malformed_values(self):
+        from netbox_custom_objects_tab.bulk import parse_selection
+
+        assert parse_selection(["", "3:7", "3:7:x", "3:7:1:9", "3:7:5"]) == {7: {5}}
+
+
+class TestApply:
+    def _apply(self, fields, action, selection, objects, tags=(), config=()):
+        from netbox_custom_objects_tab import bulk
+
+        model = MagicMock()
+        model.objects.restrict.return_value.filter.return_value.distinct.return_value.prefetch_related.return_value = (
+            objects
+        )
+        model.objects.filter.return_value.prefetch_related.return_value.in_bulk.return_value = {
+            obj.pk: obj for obj in objects
+        }
+        for field in fields:
+            field.custom_object_type.get_model.return_value = model
+
+        core_models = MagicMock()
+        extras_events = MagicMock()
+        modules = {
+            "core.choices": MagicMock(),
+            "core.events": MagicMock(),
+            "core.models": core_models,
+            "extras.events": extras_events,
+            "netbox.context": MagicMock(),
+        }
+        request = MagicMock()
+        request.user.username = "jdoe"
+        with (
+            patch.dict(sys.modules, modules),
+            patch.object(bulk.transaction, "atomic", return_value=nullcontext()),
+            patch.object(bulk, "get_plugin_config", side_effect=lambda _plugin, key: key in config),
+            patch.object(bulk, "_set_tags") as set_tags,
+            patch.object(bulk, "_clear_reference") as clear_reference,
+            patch.object(bulk.reference_index, "sync_custom_object") as sync,
+        ):
+            affected = bulk.apply(request, MagicMock(pk=42), fields, action, selection, tags)
+        return {
+            "affected": affected,
+            "model": model,
+            "changes": core_models.ObjectChange.objects.bulk_create.call_args.args[0],
+            "enqueue_event": extras_events.enqueue_event,
+            "set_tags": set_tags,
+            "clear_reference": clear_reference,
+            "sync": sync,
+        }
+
+    def test_delete_is_one_query_per_field(self):
+        objects = [_obj(1), _obj(2)]
+        result = self._apply([_field(7)], "delete", {7: {1, 2}}, objects)
+
+        assert result["affected"] == 2
+        result["model"].objects.restrict.assert_called_once()
+        result["model"].objects.filter.assert_called_once_with(pk__in=[1, 2])
+        result["model"].objects.filter.return_value.delete.assert_called_once_with()
+        assert len(result["changes"]) == 2
+        assert result["enqueue_event"].call_count == 2
+
+    def test_delete_changes_carry_snapshot_and_user_name(self):
+        result = self._apply([_field(7)], "delete", {7: {1}}, [_obj(1)])
+
+        [change] = result["changes"]
+        assert change.prechange_data == {"pk": 1}
+        assert change.user_name == "jdoe"
+        assert change.object_repr == "Object 1"
+
+    def test_selection_is_restricted_to_the_parent_and_permission(self):
+        result = self._apply([_field(7)], "delete", {7: {1}}, [_obj(1)])
+
+        result["model"].objects.restrict.assert_called_once()
+        assert result["model"].objects.restrict.call_args.args[1] == "delete"
+        result["model"].objects.restrict.return_value.filter.assert_called_once_with(pk__in={1}, device_id=42)
+
+    def test_unknown_field_is_ignored(self):
+        result = self._apply([_field(7)], "delete", {99: {1}}, [_obj(1)])
+
+        assert result["affected"] == 0
+        result["model"].objects.restrict.assert_not_called()
+        assert result["changes"] == []
+
+    def test_add_tags_records_updates(self):
+        objects = [_obj(1), _obj(2)]
+        tags = [MagicMock()]
+        result = self._apply([_field(7)], "add_tags", {7: {1, 2}}, objects, tags=tags)
+
+        assert result["affected"] == 2
+        result["set_tags"].assert_called_once_with(result["model"], objects, tags, add=True)
+        for obj in objects:
+            obj.snapshot.assert_called_once_with()
+        assert len(result["changes"]) == 2
+        result["sync"].assert_not_called()
+
+    def test_object_selected_through_two_fields_is_tagged_once(self):
+        objects = [_obj(1)]
+        fields = [_field(7), _field(8, name="site")]
+        result = self._apply(fields, "remove_tags", {7: {1}, 8: {1}}, objects, tags=[MagicMock()])
+
+        assert result["affected"] == 1
+        result["set_tags"].assert_called_once()
+
+    def test_clear_reference_resyncs_reference_index(self):
+        objects = [_obj(1)]
+        field = _field(7)
+        result = self._apply([field], "clear_reference", {7: {1}}, objects, config=("reference_index",))
+
+        result["clear_reference"].assert_called_once()
+        assert result["clear_reference"].call_args.args[2] is field
+        result["sync"].assert_called_once_with(objects[0])
+
+    def test_clear_reference_skips_required_fields(self):
+        objects = [_obj(1)]
+        required = _field(7)
+        required.required = True
+        required_multi = _field(8, name="related", field_type=CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        required_multi.required = True
+        optional_multi = _field(9, name="others", field_type=CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        result = self._apply(
+            [required, required_multi, optional_multi], "clear_reference", {7: {1}, 8: {1}, 9: {1}}, objects
+        )
+
+        result["clear_reference"].assert_called_once()
+        assert result["clear_reference"].call_args.args[2] is optional_multi
+        required.custom_object_type.get_model.assert_not_called()
+        required_multi.custom_object_type.get_model.assert_not_called()
+
+
+def test_uncleared_fields_are_selected_required_object_fields():
+    from netbox_custom_objects_tab.bulk import uncleared_fields
+
+    required, other_required, optional = _field(7), _field(8), _field(9)
+    required.required = other_required.required = True
+
+    assert uncleared_fields([required, other_required, optional], {7: {1}, 9: {1}}) == [required]
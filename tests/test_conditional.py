@@ -0,0 +1,165 @@
+"""
+Unit tests for netbox_custom_objects_tab.conditional (ETag / 304 handling).
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.http import HttpResponse
+from django.test import RequestFactory
+
+
+def _user(pk=1, superuser=False):
+    return MagicMock(pk=pk, is_authenticated=True, is_superuser=superuser, config=MagicMock(data={}))
+
+
+def _instance(pk=5):
+    instance = MagicMock(pk=pk, last_updated=None)
+    instance._meta.label_lower = "dcim.device"
+    return instance
+
+
+def _request(path="/dcim/devices/5/custom-objects/", user=None, **headers):
+    request = RequestFactory().get(path, headers=headers)
+    request.user = user or _user(superuser=True)
+    return request
+
+
+class TestMakeEtag:
+    @pytest.fixture(autouse=True)
+    def get_fn(self):
+        from netbox_custom_objects_tab.conditional import make_etag
+
+        self.fn = make_etag
+
+    def test_stable_for_same_inputs(self):
+        state = {3: {"latest": None, "n": 2}}
+        assert self.fn(_request(), _instance(), state) == self.fn(_request(), _instance(), state)
+
+    def test_changes_with_state(self):
+        assert self.fn(_request(), _instance(), {3: {"n": 2}}) != self.fn(_request(), _instance(), {3: {"n": 3}})
+
+    def test_changes_with_query_string(self):
+        assert self.fn(_request("/x/?q=a"), _instance(), {}) != self.fn(_request("/x/?q=b"), _instance(), {})
+
+    def test_partial_and_full_page_differ(self):
+        assert self.fn(_request(), _instance(), {}) != self.fn(_request(HX_Request="true"), _instance(), {})
+
+    def test_changes_with_user(self):
+        first = self.fn(_request(user=_user(pk=1, superuser=True)), _instance(), {})
+        second = self.fn(_request(user=_user(pk=2, superuser=True)), _instance(), {})
+        assert first != second
+
+
+class TestPermissionSignature:
+    def test_changes_with_constraints(self):
+        from netbox_custom_objects_tab.conditional import permission_signature
+
+        backend = MagicMock()
+        authentication = MagicMock(ObjectPermissionBackend=MagicMock(return_value=backend))
+        with patch.dict(sys.modules, {"netbox.authentication": authentication}):
+            backend.get_all_permissions.return_value = {"dcim.view_device": [{"site_id": 1}]}
+            first = permission_signature(_user())
+            backend.get_all_permissions.return_value = {"dcim.view_device": [{"site_id": 2}]}
+            second = permission_signature(_user())
+
+        assert first != second
+
+    def test_anonymous(self):
+        from netbox_custom_objects_tab.conditional import permission_signature
+
+        assert permission_signature(MagicMock(is_authenticated=False)) == "anonymous"
+
+
+class TestNotModified:
+    def test_matching_if_none_match_returns_304(self):
+        from netbox_custom_objects_tab.conditional import not_modified
+
+        response = not_modified(_request(If_None_Match='"abc"'), '"abc"')
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == '"abc"'
+
+    def test_mismatch_returns_none(self):
+        from netbox_custom_objects_tab.conditional import not_modified
+
+        assert not_modified(_request(If_None_Match='"old"'), '"abc"') is None
+
+    def test_add_etag_forces_revalidation(self):
+        from netbox_custom_objects_tab.conditional import add_etag
+
+        response = add_etag(HttpResponse(), '"abc"')
+
+        assert response.headers["ETag"] == '"abc"'
+        assert "no-cache" in response.headers["Cache-Control"]
+        assert "HX-Request" in response.headers["Vary"]
+
+    def test_add_etag_without_etag_is_noop(self):
+        from netbox_custom_objects_tab.conditional import add_etag
+
+        assert "ETag" not in add_etag(HttpResponse(), None).headers
+
+
+class TestIsEnabled:
+    def test_disabled_by_setting(self):
+        from netbox_custom_objects_tab import conditional
+
+        with patch.object(conditional, "get_plugin_config", return_value=False):
+            assert conditional.is_enabled(_request()) is False
+
+    def test_post_is_never_conditional(self):
+        from netbox_custom_objects_tab import conditional
+
+        request = RequestFactory().post("/x/")
+        with patch.object(conditional, "get_plugin_config", return_value=True):
+            assert conditional.is_enabled(request) is False
+
+    def test_pending_messages_disable(self):
+        from netbox_custom_objects_tab import conditional
+
+        request = _request()
+        request._messages = ["Saved"]
+        with patch.object(conditional, "get_plugin_config", return_value=True):
+            assert conditional.is_enabled(request) is False
+            del request._messages
+            assert conditional.is_enabled(request) is True
+
+
+class TestM2MVersion:
+    def test_bump_changes_the_version_of_that_type_only(self):
+        from netbox_custom_objects_tab import conditional
+
+        before = conditional.m2m_versions([3, 4])
+        conditional.bump_m2m_version(3)
+        after = conditional.m2m_versions([3, 4])
+
+        assert after[3] != before.get(3)
+        assert after.get(4) == before.get(4)
+
+    def test_combined_state_includes_the_version(self):
+        from netbox_custom_objects_tab import conditional
+
+        field = MagicMock(pk=1, type="object")
+        field.name = "device"
+        field.custom_object_type.pk = 3
+        field.custom_object_type.get_model.side_effect = Exception
+        with patch.object(conditional, "get_plugin_config", return_value=False):
+            before = conditional.combined_state(_instance(), [field])
+            conditional.bump_m2m_version(3)
+            after = conditional.combined_state(_instance(), [field])
+
+        assert before[3]["m2m"] != after[3]["m2m"]
+
+    def test_tag_change_on_custom_object_bumps_its_type(self):
+        from netbox_custom_objects.models import CustomObject
+
+        from netbox_custom_objects_tab import signals
+
+        obj = type("DynModel", (CustomObject,), {})()
+        obj.custom_object_type_id = 3
+        with patch.object(signals.conditional, "bump_m2m_version") as bump:
+            signals.handle_m2m_version(sender=None, instance=obj, action="post_add", reverse=False, model=None)
+            signals.handle_m2m_version(sender=None, instance=obj, action="pre_add", reverse=False, model=None)
+
+        bump.assert_called_once_with(3)
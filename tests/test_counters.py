@@ -0,0 +1,233 @@
+"""
+Unit tests for netbox_custom_objects_tab.counters (denormalized reference counters).
+"""
+
+from collections import Counter
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObject
+
+
+def _field(name, field_type, related_object_type_id=20):
+    field = MagicMock()
+    field.name = name
+    field.type = field_type
+    field.related_object_type_id = related_object_type_id
+    return field
+
+
+def _through(has_target=True):
+    through = MagicMock()
+    if not has_target:
+        from django.core.exceptions import FieldDoesNotExist
+
+        through._meta.get_field.side_effect = FieldDoesNotExist
+    return through
+
+
+class TestMultiobjectChanged:
+    def _call(self, sender, action, pk_set, reverse=False):
+        from netbox_custom_objects_tab import counters
+
+        instance = MagicMock(custom_object_type_id=3)
+        with (
+            patch.object(counters, "apply_deltas") as apply_deltas,
+            patch.object(counters, "ContentType") as content_type,
+        ):
+            content_type.objects.get_for_model.return_value.pk = 20
+            counters.multiobject_changed(sender, instance, action, reverse, MagicMock(), pk_set)
+        return apply_deltas
+
+    def test_add_increments_each_parent(self):
+        apply_deltas = self._call(_through(), "post_add", {5, 6})
+
+        apply_deltas.assert_called_once_with(3, {(20, 5): 1, (20, 6): 1})
+
+    def test_remove_decrements_each_parent(self):
+        apply_deltas = self._call(_through(), "post_remove", {5})
+
+        apply_deltas.assert_called_once_with(3, {(20, 5): -1})
+
+    def test_remove_only_counts_links_that_existed(self):
+        from netbox_custom_objects_tab import counters
+
+        sender = _through()
+        sender.objects.filter.return_value.values_list.return_value = [5]
+        instance = MagicMock(pk=1, custom_object_type_id=3)
+        with (
+            patch.object(counters, "apply_deltas") as apply_deltas,
+            patch.object(counters, "ContentType") as content_type,
+        ):
+            content_type.objects.get_for_model.return_value.pk = 20
+            counters.multiobject_changed(sender, instance, "pre_remove", False, MagicMock(), {5, 6})
+            counters.multiobject_changed(sender, instance, "post_remove", False, MagicMock(), {5, 6})
+
+        sender.objects.filter.assert_called_once_with(source_id=1, target_id__in={5, 6})
+        apply_deltas.assert_called_once_with(3, {(20, 5): -1})
+
+    def test_remove_of_unlinked_pks_changes_nothing(self):
+        from netbox_custom_objects_tab import counters
+
+        sender = _through()
+        sender.objects.filter.return_value.values_list.return_value = []
+        instance = MagicMock(pk=7)
+        with patch.object(counters, "apply_deltas") as apply_deltas:
+            counters.multiobject_changed(sender, instance, "pre_remove", True, MagicMock(), {1, 2})
+            counters.multiobject_changed(sender, instance, "post_remove", True, MagicMock(), {1, 2})
+
+        sender.objects.filter.assert_called_once_with(target_id=7, source_id__in={1, 2})
+        apply_deltas.assert_not_called()
+
+    def test_non_multiobject_through_table_is_ignored(self):
+        apply_deltas = self._call(_through(has_target=False), "post_add", {5})
+
+        apply_deltas.assert_not_called()
+
+    def test_clear_decrements_the_links_captured_before_it(self):
+        from netbox_custom_objects_tab import counters
+
+        sender = _through()
+        sender.objects.filter.return_value.values_list.return_value = [5, 6]
+        instance = MagicMock(pk=1, custom_object_type_id=3)
+        with (
+            patch.object(counters, "apply_deltas") as apply_deltas,
+            patch.object(counters, "ContentType") as content_type,
+        ):
+            content_type.objects.get_for_model.return_value.pk = 20
+            counters.multiobject_changed(sender, instance, "pre_clear", False, MagicMock(), None)
+            counters.multiobject_changed(sender, instance, "post_clear", False, MagicMock(), None)
+
+        sender.objects.filter.assert_called_once_with(source_id=1)
+        apply_deltas.assert_called_once_with(3, {(20, 5): -1, (20, 6): -1})
+
+    def test_reverse_clear_decrements_the_parent(self):
+        from netbox_custom_objects_tab import counters
+
+        sender = _through()
+        sender.objects.filter.return_value.values_list.return_value = [11, 12, 13]
+        parent, model = MagicMock(pk=7), MagicMock(custom_object_type_id=3)
+        with (
+            patch.object(counters, "apply_deltas") as apply_deltas,
+            patch.object(counters, "ContentType") as content_type,
+        ):
+            content_type.objects.get_for_model.return_value.pk = 20
+            counters.multiobject_changed(sender, parent, "pre_clear", True, model, None)
+            counters.multiobject_changed(sender, parent, "post_clear", True, model, None)
+
+        sender.objects.filter.assert_called_once_with(target_id=7)
+        apply_deltas.assert_called_once_with(3, {(20, 7): -3})
+
+
+class TestCustomObjectSaved:
+    def _call(self, obj, created, fields):
+        from netbox_custom_objects_tab import counters
+
+        with (
+            patch.object(counters, "_fields_for_type", return_value=fields),
+            patch.object(counters, "apply_deltas") as apply_deltas,
+        ):
+            counters.custom_object_saved(obj, created)
+        return apply_deltas
+
+    def test_create_counts_object_fields(self):
+        field = _field("device", CustomFieldTypeChoices.TYPE_OBJECT)
+        obj = MagicMock(custom_object_type_id=3, device_id=7)
+
+        apply_deltas = self._call(obj, True, [field])
+
+        apply_deltas.assert_called_once_with(3, Counter({(20, 7): 1}))
+
+    def test_repointed_object_field_moves_the_count(self):
+        from netbox_custom_objects_tab.counters import _OLD_REFERENCES
+
+        field = _field("device", CustomFieldTypeChoices.TYPE_OBJECT)
+        obj = MagicMock(custom_object_type_id=3, device_id=8)
+        setattr(obj, _OLD_REFERENCES, Counter({(20, 7): 1}))
+
+        apply_deltas = self._call(obj, False, [field])
+
+        (_cot, deltas), _ = apply_deltas.call_args
+        assert deltas[(20, 8)] == 1 and deltas[(20, 7)] == -1
+
+
+class TestApplyDeltas:
+    def test_creates_missing_counter(self):
+        from netbox_custom_objects_tab import counters
+
+        model = MagicMock()
+        model.objects.filter.return_value.update.return_value = 0
+        model.objects.get_or_create.return_value = (MagicMock(pk=99), True)
+        with patch.object(counters, "_counter_model", return_value=model):
+            counters.apply_deltas(3, {(20, 7): 1, (20, 8): 0})
+
+        model.objects.get_or_create.assert_called_once_with(
+            parent_ct_id=20, parent_pk=7, cot_id=3, defaults={"count": 0}
+        )
+        model.objects.filter.assert_any_call(pk=99)
+
+
+class TestSignalHandlers:
+    def test_counter_handlers_not_connected_when_disabled(self):
+        from netbox_custom_objects_tab import signals
+
+        with (
+            patch.object(signals, "get_plugin_config", return_value=False),
+            patch.object(signals, "pre_save") as pre_save,
+        ):
+            signals.connect_signals()
+
+        pre_save.connect.assert_not_called()
+
+    def test_raw_save_is_ignored(self):
+        from netbox_custom_objects_tab import signals
+
+        obj = type("DynModel", (CustomObject,), {})()
+        with patch.object(signals.counters, "custom_object_saved") as saved:
+            signals.handle_counter_post_save(sender=type(obj), instance=obj, created=True, raw=True)
+
+        saved.assert_not_called()
+
+    def test_counter_delete_handlers_connected_per_sender(self):
+        from netbox_custom_objects_tab import signals
+
+        dyn_model = type("DynModel", (CustomObject,), {})
+        device = MagicMock()
+        with (
+            patch.object(signals, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_counters"),
+            patch.object(signals, "pre_delete") as pre_delete,
+            patch.object(signals, "post_delete") as post_delete,
+            patch.object(signals, "pre_save"),
+            patch.object(signals, "post_save"),
+            patch.object(signals, "m2m_changed"),
+            patch.object(signals, "class_prepared"),
+            patch.object(signals, "apps") as mock_apps,
+            patch.object(signals, "_parent_models", return_value=[device]),
+        ):
+            mock_apps.get_models.return_value = [dyn_model]
+            signals.connect_signals()
+
+        assert [c.kwargs["sender"] for c in pre_delete.connect.call_args_list] == [dyn_model]
+        assert [c.kwargs["sender"] for c in post_delete.connect.call_args_list] == [dyn_model, device]
+
+    def test_delete_of_parent_drops_its_counters(self):
+        from netbox_custom_objects_tab import signals
+
+        parent = MagicMock(pk=5)
+        with patch.object(signals.counters, "delete_parent") as delete_parent:
+            signals.handle_counter_post_delete(sender=object, instance=parent)
+
+        delete_parent.assert_called_once_with(parent)
+
+
+def test_typed_badge_reads_counters_when_enabled():
+    from netbox_custom_objects_tab.views import typed
+
+    instance = MagicMock()
+    with (
+        patch.object(typed, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_counters"),
+        patch.object(typed.counters, "count_for_parent", return_value=4) as count_for_parent,
+    ):
+        assert typed._count_for_type(MagicMock(pk=3), [])(instance) == 4
+
+    count_for_parent.assert_called_once_with(instance, 3)
@@ -0,0 +1,203 @@
+"""
+Unit tests for netbox_custom_objects_tab.counts.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+
+
+def _field(name, field_type, slug, grouped_rows):
+    field = MagicMock()
+    field.name = name
+    field.type = field_type
+    field.custom_object_type.slug = slug
+    model = field.custom_object_type.get_model.return_value
+    qs = model.objects.filter.return_value.order_by.return_value.values.return_value
+    qs.annotate.return_value.values_list.return_value = grouped_rows
+    return field, model
+
+
+class TestCountLinkedCustomObjects:
+    def _count(self, fields, parents, by_type=False):
+        from netbox_custom_objects_tab import counts
+
+        with patch.object(counts, "get_reference_fields", return_value=fields):
+            return counts.count_linked_custom_objects(MagicMock(), parents, by_type=by_type)
+
+    def test_sums_per_parent_across_fields(self):
+        f1, _ = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [(1, 2), (2, 1)])
+        f2, _ = _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT, "link", [(1, 3)])
+
+        assert self._count([f1, f2], [1, 2, 3]) == {1: 5, 2: 1}
+
+    def test_by_type_groups_per_slug(self):
+        f1, _ = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [(1, 2)])
+        f2, _ = _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT, "link", [(1, 3)])
+
+        assert self._count([f1, f2], [1], by_type=True) == {1: {"server": 2, "link": 3}}
+
+    def test_one_grouped_query_per_field_using_in_lookup(self):
+        f1, model = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [])
+
+        self._count([f1], iter([4, 5]))
+
+        model.objects.filter.assert_called_once_with(device_id__in=[4, 5])
+
+    def test_pk_lists_are_chunked(self):
+        from netbox_custom_objects_tab import counts
+
+        f1, model = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [])
+        with patch.object(counts, "_PK_CHUNK_SIZE", 2):
+            self._count([f1], [1, 2, 3])
+
+        assert model.objects.filter.call_count == 2
+
+
+class TestReferenceCountExpression:
+    def test_no_fields_is_constant_zero(self):
+        from django.db.models import Value
+
+        from netbox_custom_objects_tab import counts
+
+        with patch.object(counts, "get_reference_fields", return_value=[]):
+            expression = counts.reference_count_expression(MagicMock())
+
+        assert isinstance(expression, Value)
+        assert expression.value == 0
+
+    def test_one_correlated_subquery_per_field(self):
+        from django.db.models import OuterRef
+
+        from netbox_custom_objects_tab import counts
+
+        f1, m1 = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [])
+        f2, m2 = _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT, "link", [])
+        with (
+            patch.object(counts, "get_reference_fields", return_value=[f1, f2]),
+            patch.object(counts, "_subquery_count", side_effect=lambda qs: 1),
+        ):
+            assert counts.reference_count_expression(MagicMock()) == 2
+
+        m1.objects.filter.assert_called_once_with(device_id=OuterRef("pk"))
+        m2.objects.filter.assert_called_once_with(devices=OuterRef("pk"))
+
+
+class TestReferenceExistsExpression:
+    def test_no_fields_matches_nothing(self):
+        from django.db.models import Q
+
+        from netbox_custom_objects_tab import counts
+
+        with patch.object(counts, "get_reference_fields", return_value=[]):
+            assert counts.reference_exists_expression(MagicMock()) == Q(pk__in=[])
+
+    def test_one_exists_per_fk_column_or_through_table(self):
+        from django.db.models import OuterRef
+
+        from netbox_custom_objects_tab import counts
+
+        f1, m1 = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [])
+        f2, m2 = _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT, "link", [])
+        through = m2._meta.get_field.return_value.remote_field.through
+        with (
+            patch.object(counts, "get_reference_fields", return_value=[f1, f2]),
+            patch.object(counts, "Exists", side_effect=lambda qs: qs) as exists,
+        ):
+            condition = counts.reference_exists_expression(MagicMock())
+
+        assert condition.connector == "OR"
+        assert exists.call_count == 2
+        m1.objects.filter.assert_called_once_with(device_id=OuterRef("pk"))
+        through.objects.filter.assert_called_once_with(target_id=OuterRef("pk"))
+        m2.objects.filter.assert_not_called()
+
+    def test_type_slugs_skip_other_fields(self):
+        from netbox_custom_objects_tab import counts
+
+        f1, m1 = _field("device", CustomFieldTypeChoices.TYPE_OBJECT, "server", [])
+        f2, m2 = _field("other", CustomFieldTypeChoices.TYPE_OBJECT, "link", [])
+        with (
+            patch.object(counts, "get_reference_fields", return_value=[f1, f2]),
+            patch.object(counts, "Exists", side_effect=lambda qs: qs),
+        ):
+            counts.reference_exists_expression(MagicMock(), custom_object_type_slugs=["link"])
+
+        f1.custom_object_type.get_model.assert_not_called()
+        m2.objects.filter.assert_called_once()
+
+    def test_reference_index_is_a_single_exists(self):
+        from netbox_custom_objects_tab import counts, reference_index
+
+        entries = MagicMock()
+        with (
+            patch.object(counts, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_index"),
+            patch.object(reference_index, "parent_entries", return_value=entries),
+            patch.object(counts, "Exists", side_effect=lambda qs: qs) as exists,
+            patch.object(counts, "get_reference_fields") as get_fields,
+        ):
+            counts.reference_exists_expression(MagicMock(), custom_object_type_slugs=["link"])
+
+        exists.assert_called_once_with(entries.filter.return_value)
+        entries.filter.assert_called_once_with(cot__slug__in=["link"])
+        get_fields.assert_not_called()
+
+
+class TestTopReferenced:
+    def _columns(self):
+        object_field = MagicMock(related_object_type_id=20, custom_object_type_id=3)
+        multi_field = MagicMock(related_object_type_id=21, custom_object_type_id=4)
+        return [
+            {"field": object_field, "table": "custom_objects_3", "column": "device_id"},
+            {"field": multi_field, "table": "custom_objects_4_links", "column": "target_id"},
+        ]
+
+    def _sql(self, **kwargs):
+        from netbox_custom_objects_tab import counts, index_audit
+
+        connection = MagicMock()
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        cursor = connection.cursor.return_value.__enter__.return_value
+        cursor.fetchall.return_value = [(20, 7, 5)]
+        with (
+            patch.object(index_audit, "reference_columns", return_value=self._columns()),
+            patch.object(counts, "connections", {"default": connection}),
+            patch.object(counts, "read_alias", return_value=None),
+        ):
+            rows = counts._top_referenced_sql(10, **kwargs)
+        return rows, cursor
+
+    def test_single_union_all_statement(self):
+        rows, cursor = self._sql()
+
+        assert rows == [(20, 7, 5)]
+        cursor.execute.assert_called_once()
+        sql, params = cursor.execute.call_args.args
+        assert sql.count("UNION ALL") == 1
+        assert 'FROM "custom_objects_4_links" WHERE "target_id" IS NOT NULL' in sql
+        assert params == [20, 21, 10]
+
+    def test_filters_drop_columns(self):
+        _rows, cursor = self._sql(custom_object_type_ids=[4])
+
+        sql, params = cursor.execute.call_args.args
+        assert "UNION ALL" not in sql
+        assert params == [21, 10]
+
+    def test_no_columns_runs_no_query(self):
+        rows, cursor = self._sql(content_type_ids=[99])
+
+        assert rows == []
+        cursor.execute.assert_not_called()
+
+    def test_counters_answer_when_enabled(self):
+        from netbox_custom_objects_tab import counts
+
+        with (
+            patch.object(counts, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_counters"),
+            patch.object(counts.counters, "top_parents", return_value=[(20, 7, 9)]) as top_parents,
+            patch.object(counts, "_top_referenced_sql") as sql,
+        ):
+            assert counts.top_referenced(5, content_type_ids=[20]) == [(20, 7, 9)]
+        top_parents.assert_called_once_with(5, [20], [])
+        sql.assert_not_called()
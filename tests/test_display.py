@@ -0,0 +1,112 @@
+"""
+Unit tests for netbox_custom_objects_tab.display.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+
+
+def _model(primary_type=CustomFieldTypeChoices.TYPE_TEXT, display_expression=""):
+    """Return a stand-in dynamic model class whose primary field has the given type."""
+    primary = MagicMock(type=primary_type)
+    return type(
+        "Server",
+        (),
+        {
+            "custom_object_type": MagicMock(display_expression=display_expression),
+            "_primary_field_id": 1,
+            "_field_objects": {1: {"field": primary, "name": "device"}},
+            "objects": MagicMock(),
+            "__str__": lambda self: self.text,
+        },
+    )
+
+
+def _obj(model, pk, text, cot_id=3):
+    obj = model()
+    obj.pk = pk
+    obj.text = text
+    obj.custom_object_type_id = cot_id
+    obj.last_updated = None
+    return obj
+
+
+class TestDisplayStrings:
+    def _call(self, objects, timeout=0, cached=None):
+        from netbox_custom_objects_tab import display
+
+        with (
+            patch.object(display, "get_plugin_config", return_value=timeout),
+            patch.object(display, "cache") as mock_cache,
+        ):
+            mock_cache.get_many.return_value = cached or {}
+            return display.display_strings(objects), mock_cache
+
+    def test_computes_str_without_cache(self):
+        model = _model()
+        a, b = _obj(model, 1, "alpha"), _obj(model, 2, "beta")
+        result, mock_cache = self._call([a, b])
+
+        assert result == {(3, 1): "alpha", (3, 2): "beta"}
+        mock_cache.get_many.assert_not_called()
+        mock_cache.set_many.assert_not_called()
+
+    def test_cache_hits_skip_computation(self):
+        from netbox_custom_objects_tab.display import _cache_key
+
+        model = _model()
+        a, b = _obj(model, 1, "alpha"), _obj(model, 2, "beta")
+        result, mock_cache = self._call([a, b], timeout=60, cached={_cache_key(a): "cached alpha"})
+
+        assert result == {(3, 1): "cached alpha", (3, 2): "beta"}
+        mock_cache.set_many.assert_called_once_with({_cache_key(b): "beta"}, 60)
+
+    def test_object_primary_field_loaded_in_one_query(self):
+        model = _model(primary_type=CustomFieldTypeChoices.TYPE_OBJECT)
+        a, b = _obj(model, 1, "stale"), _obj(model, 2, "beta")
+        fresh = _obj(model, 1, "alpha")
+        qs = model.objects.filter.return_value.select_related.return_value
+        qs.in_bulk.return_value = {1: fresh}
+
+        result, _ = self._call([a, b])
+
+        assert result == {(3, 1): "alpha", (3, 2): "beta"}
+        model.objects.filter.assert_called_once_with(pk__in=[1, 2])
+        model.objects.filter.return_value.select_related.assert_called_once_with("device")
+
+    def test_display_expression_uses_str(self):
+        model = _model(primary_type=CustomFieldTypeChoices.TYPE_OBJECT, display_expression="{name}")
+        result, _ = self._call([_obj(model, 1, "alpha")])
+
+        assert result == {(3, 1): "alpha"}
+        model.objects.filter.assert_not_called()
+
+
+def test_filter_linked_objects_prefers_precomputed_display():
+    from netbox_custom_objects_tab.views.combined import _filter_linked_objects
+
+    obj = MagicMock(pk=1, custom_object_type_id=3)
+    obj.__str__ = lambda self: "raw"
+    field = MagicMock()
+    field.__str__ = lambda self: "Device"
+    field.custom_object_type.__str__ = lambda self: "Server"
+
+    assert _filter_linked_objects([(obj, field)], "pretty", {(3, 1): "Pretty name"}) == [(obj, field)]
+    assert _filter_linked_objects([(obj, field)], "pretty") == []
+
+
+def test_compact_rows_are_loaded_for_display():
+    from netbox_custom_objects_tab import display
+    from netbox_custom_objects_tab.rows import LinkedRow
+
+    model = _model()
+    rows = [LinkedRow(model, 3, 1, None), LinkedRow(model, 3, 2, None)]
+    model.objects.filter.return_value.in_bulk.return_value = {1: _obj(model, 1, "alpha")}
+
+    with patch.object(display, "get_plugin_config", return_value=0):
+        result = display.display_strings(rows)
+
+    # Row 2 vanished after the list query and falls back to its pk
+    assert result == {(3, 1): "alpha", (3, 2): "2"}
+    model.objects.filter.assert_called_once_with(pk__in=[1, 2])
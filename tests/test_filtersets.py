@@ -0,0 +1,88 @@
+"""
+Unit tests for netbox_custom_objects_tab.filtersets.
+"""
+
+import sys
+from unittest.mock import MagicMock, patch
+
+
+class TestFilterMethods:
+    def test_has_custom_objects_true_and_false(self):
+        from django.db.models import Q
+
+        from netbox_custom_objects_tab import counts, filtersets
+
+        queryset = MagicMock()
+        condition = Q(pk=1)
+        with patch.object(counts, "reference_exists_expression", return_value=condition) as expression:
+            filtersets.filter_has_custom_objects(queryset, "has_custom_objects", True)
+            filtersets.filter_has_custom_objects(queryset, "has_custom_objects", False)
+
+        expression.assert_called_with(queryset.model)
+        assert [c.args[0] for c in queryset.filter.call_args_list] == [condition, ~condition]
+
+    def test_has_custom_objects_unset_is_a_noop(self):
+        from netbox_custom_objects_tab import filtersets
+
+        queryset = MagicMock()
+        assert filtersets.filter_has_custom_objects(queryset, "has_custom_objects", None) is queryset
+        queryset.filter.assert_not_called()
+
+    def test_has_custom_object_type_passes_slugs(self):
+        from netbox_custom_objects_tab import counts, filtersets
+
+        queryset = MagicMock()
+        with patch.object(counts, "reference_exists_expression", return_value="cond") as expression:
+            result = filtersets.filter_has_custom_object_type(queryset, "has_custom_object_type", ["link", ""])
+
+        expression.assert_called_once_with(queryset.model, custom_object_type_slugs=["link"])
+        queryset.filter.assert_called_once_with("cond")
+        assert result is queryset.filter.return_value
+
+    def test_has_custom_object_type_empty_is_a_noop(self):
+        from netbox_custom_objects_tab import filtersets
+
+        queryset = MagicMock()
+        assert filtersets.filter_has_custom_object_type(queryset, "has_custom_object_type", []) is queryset
+
+
+class TestRegisterFilters:
+    def test_adds_filters_to_resolved_filtersets_only(self):
+        from netbox_custom_objects_tab import filtersets
+
+        device_filterset = MagicMock(__name__="DeviceFilterSet", base_filters={"q": MagicMock()})
+        django_filters = MagicMock()
+        with (
+            patch.dict(sys.modules, {"django_filters": django_filters, "utilities.filters": MagicMock()}),
+            patch.object(filtersets, "get_plugin_config", return_value=True),
+            patch.object(filtersets, "_get_filterset_class", side_effect=[device_filterset, None]),
+        ):
+            filtersets.register_filters([MagicMock(), MagicMock()])
+
+        assert set(device_filterset.base_filters) == {"q", "has_custom_objects", "has_custom_object_type"}
+        assert django_filters.BooleanFilter.call_args.kwargs["method"] is filtersets.filter_has_custom_objects
+
+    def test_existing_filter_is_not_overwritten(self):
+        from netbox_custom_objects_tab import filtersets
+
+        existing = MagicMock()
+        filterset = MagicMock(__name__="DeviceFilterSet", base_filters={"has_custom_objects": existing})
+        with (
+            patch.dict(sys.modules, {"django_filters": MagicMock(), "utilities.filters": MagicMock()}),
+            patch.object(filtersets, "get_plugin_config", return_value=True),
+            patch.object(filtersets, "_get_filterset_class", return_value=filterset),
+        ):
+            filtersets.register_filters([MagicMock()])
+
+        assert filterset.base_filters == {"has_custom_objects": existing}
+
+    def test_disabled_setting_registers_nothing(self):
+        from netbox_custom_objects_tab import filtersets
+
+        with (
+            patch.object(filtersets, "get_plugin_config", return_value=False),
+            patch.object(filtersets, "_get_filterset_class") as get_filterset,
+        ):
+            filtersets.register_filters([MagicMock()])
+
+        get_filterset.assert_not_called()
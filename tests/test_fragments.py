@@ -0,0 +1,71 @@
+"""
+Unit tests for netbox_custom_objects_tab.fragments (combined-tab row cache).
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+def _row(pk=1, last_updated="2026-01-01", tags=()):
+    obj = MagicMock(pk=pk, custom_object_type_id=3, last_updated=last_updated)
+    obj.tags.all.return_value = [MagicMock(pk=t, color="aa1409") for t in tags]
+    for t in obj.tags.all.return_value:
+        t.name = f"tag{t.pk}"
+    field = MagicMock(pk=10)
+    field.__str__ = lambda self: "Device"
+    field.custom_object_type.slug = "server"
+    field.custom_object_type.__str__ = lambda self: "Server"
+    return (obj, field, None, f"Server {pk}")
+
+
+def _template():
+    template = MagicMock()
+    template.render.side_effect = lambda context: f"<tr>{context['display']} ?return_url={context['return_url']}</tr>"
+    return template
+
+
+class TestRenderRows:
+    def _call(self, rows, timeout=0, cached=None, return_url="/dcim/devices/5/custom-objects/?page=2"):
+        from netbox_custom_objects_tab import fragments
+
+        template = _template()
+        request = MagicMock()
+        request.user.is_superuser = True
+        with (
+            patch.object(fragments, "get_plugin_config", return_value=timeout),
+            patch.object(fragments, "get_template", return_value=template),
+            patch.object(fragments, "cache") as mock_cache,
+        ):
+            mock_cache.get_many.side_effect = lambda keys: cached(keys) if cached else {}
+            html = fragments.render_rows(request, rows, {"object", "tags"}, return_url)
+        return html, template, mock_cache
+
+    def test_renders_each_row_and_substitutes_return_url(self):
+        html, template, mock_cache = self._call([_row(1), _row(2)])
+
+        assert html == [
+            "<tr>Server 1 ?return_url=/dcim/devices/5/custom-objects/%3Fpage%3D2</tr>",
+            "<tr>Server 2 ?return_url=/dcim/devices/5/custom-objects/%3Fpage%3D2</tr>",
+        ]
+        assert template.render.call_count == 2
+        mock_cache.get_many.assert_not_called()
+
+    def test_cached_rows_are_not_rendered(self):
+        def cached(keys):
+            return {keys[0]: "<tr>cached ?return_url=__netbox_custom_objects_tab_return_url__</tr>"}
+
+        html, template, mock_cache = self._call([_row(1), _row(2)], timeout=60, cached=cached, return_url="/x/")
+
+        assert html[0] == "<tr>cached ?return_url=/x/</tr>"
+        assert template.render.call_count == 1
+        (stored, timeout), _ = mock_cache.set_many.call_args
+        assert len(stored) == 1 and timeout == 60
+
+    def test_key_changes_with_last_updated_and_tags(self):
+        from netbox_custom_objects_tab.fragments import _row_key
+
+        base = _row_key(*_row(), ["object"], "superuser")
+        assert base == _row_key(*_row(), ["object"], "superuser")
+        assert base != _row_key(*_row(last_updated="2026-02-01"), ["object"], "superuser")
+        assert base != _row_key(*_row(tags=[7]), ["object"], "superuser")
+        assert base != _row_key(*_row(), ["object", "tags"], "superuser")
+        assert base != _row_key(*_row(), ["object"], "anonymous")
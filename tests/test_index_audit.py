@@ -0,0 +1,71 @@
+"""
+Unit tests for netbox_custom_objects_tab.index_audit (reference column index audit).
+"""
+
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+
+
+def _field(name, field_type):
+    field = MagicMock()
+    field.name = name
+    field.type = field_type
+    model = field.custom_object_type.get_model.return_value
+    model._meta.db_table = "custom_objects_3"
+    model._meta.get_field.return_value.column = f"{name}_id"
+    through = model._meta.get_field.return_value.remote_field.through
+    through._meta.db_table = f"custom_objects_3_{name}"
+    through._meta.get_field.return_value.column = "target_id"
+    return field
+
+
+class TestReferenceColumns:
+    def test_object_and_multiobject_columns(self):
+        from netbox_custom_objects_tab import index_audit
+
+        fields = [
+            _field("device", CustomFieldTypeChoices.TYPE_OBJECT),
+            _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT),
+        ]
+        with patch.object(index_audit, "CustomObjectTypeField") as mock_cotf:
+            mock_cotf.objects.filter.return_value.select_related.return_value = fields
+            columns = [(c["table"], c["column"]) for c in index_audit.reference_columns()]
+
+        assert columns == [("custom_objects_3", "device_id"), ("custom_objects_3_devices", "target_id")]
+
+
+class TestCoveringIndex:
+    def test_leading_column_only(self):
+        from netbox_custom_objects_tab.index_audit import covering_index
+
+        constraints = {
+            "pair": {"columns": ["source_id", "target_id"], "unique": True, "index": False},
+            "fk": {"columns": ["target_id"], "index": True},
+            "check": {"columns": ["target_id"], "check": True},
+        }
+
+        assert covering_index(constraints, "target_id") == "fk"
+        assert covering_index(constraints, "source_id") == "pair"
+        assert covering_index(constraints, "device_id") is None
+
+
+class TestCreateIndexSql:
+    def _connection(self, vendor):
+        connection = MagicMock(vendor=vendor)
+        connection.ops.quote_name = lambda name: f'"{name}"'
+        return connection
+
+    def test_postgres_uses_concurrently(self):
+        from netbox_custom_objects_tab.index_audit import create_index_sql, index_name
+
+        sql = create_index_sql(self._connection("postgresql"), "custom_objects_3", "device_id")
+
+        name = index_name("custom_objects_3", "device_id")
+        assert sql == f'CREATE INDEX CONCURRENTLY IF NOT EXISTS "{name}" ON "custom_objects_3" ("device_id")'
+        assert len(index_name("x" * 63, "y" * 63)) <= 63
+
+    def test_other_backends_skip_concurrently(self):
+        from netbox_custom_objects_tab.index_audit import create_index_sql
+
+        assert "CONCURRENTLY" not in create_index_sql(self._connection("sqlite"), "t", "c")
@@ -0,0 +1,96 @@
+"""
+Unit tests for netbox_custom_objects_tab.loadtest (load-test harness).
+"""
+
+import random
+from unittest.mock import MagicMock, patch
+
+
+class TestPercentile:
+    def test_nearest_rank(self):
+        from netbox_custom_objects_tab.loadtest import percentile
+
+        values = list(range(1, 101))
+
+        assert percentile(values, 50) == 50
+        assert percentile(values, 95) == 95
+        assert percentile(values, 99) == 99
+        assert percentile([7], 99) == 7
+        assert percentile([], 50) == 0.0
+
+
+class TestSummarize:
+    def test_per_endpoint_and_overall_stats(self):
+        from netbox_custom_objects_tab.loadtest import summarize
+
+        results = [
+            ("detail", 200, 0.010, 12),
+            ("detail", 200, 0.030, 14),
+            ("combined", 500, 0.100, 40),
+        ]
+
+        summary = summarize(results, elapsed=2.0)
+
+        assert summary["all"]["requests"] == 3
+        assert summary["all"]["errors"] == 1
+        assert summary["all"]["rps"] == 1.5
+        assert summary["detail"]["p50_ms"] == 10.0
+        assert summary["detail"]["p99_ms"] == 30.0
+        assert summary["detail"]["queries_mean"] == 13.0
+        assert summary["combined"]["queries_max"] == 40
+
+
+class TestRun:
+    def test_sends_every_request_with_htmx_header(self):
+        from netbox_custom_objects_tab import loadtest
+
+        client = MagicMock()
+        client.get.return_value.status_code = 200
+        requests = [("combined_sort", "/dcim/devices/1/custom-objects/?sort=object", True)]
+
+        capture = MagicMock(captured_queries=["SELECT 1", "SELECT 2"])
+        with (
+            patch.object(loadtest, "_client", return_value=client),
+            patch.object(loadtest, "CaptureQueriesContext") as capture_queries,
+            patch.object(loadtest, "connections") as connections,
+            patch.object(loadtest, "serial_fetches") as serial_fetches,
+        ):
+            capture_queries.return_value.__enter__.return_value = capture
+            connections.all.return_value = [MagicMock()]
+            results, elapsed = loadtest.run(requests, MagicMock(), concurrency=3, total=7)
+
+        assert len(results) == 7
+        assert {(endpoint, status, queries) for endpoint, status, _seconds, queries in results} == {
+            ("combined_sort", 200, 2)
+        }
+        client.get.assert_called_with("/dcim/devices/1/custom-objects/?sort=object", HTTP_HX_REQUEST="true")
+        assert elapsed >= 0
+        serial_fetches.assert_called_once_with()
+
+
+class TestSerialFetches:
+    def test_forces_and_restores_fetch_concurrency(self, settings):
+        from netbox_custom_objects_tab.loadtest import serial_fetches
+
+        settings.PLUGINS_CONFIG = {"netbox_custom_objects_tab": {"fetch_concurrency": 8}}
+        with serial_fetches():
+            assert settings.PLUGINS_CONFIG["netbox_custom_objects_tab"]["fetch_concurrency"] == 1
+        assert settings.PLUGINS_CONFIG["netbox_custom_objects_tab"]["fetch_concurrency"] == 8
+
+    def test_unset_value_is_removed_again(self, settings):
+        from netbox_custom_objects_tab.loadtest import serial_fetches
+
+        settings.PLUGINS_CONFIG = {}
+        with serial_fetches():
+            assert settings.PLUGINS_CONFIG["netbox_custom_objects_tab"] == {"fetch_concurrency": 1}
+        assert settings.PLUGINS_CONFIG["netbox_custom_objects_tab"] == {}
+
+
+def test_skewed_parent_favours_first_parents():
+    from netbox_custom_objects_tab.loadtest import _skewed_parent
+
+    rng = random.Random(1)
+    picks = [_skewed_parent(rng, [1, 2, 3, 4, 5]) for _i in range(1000)]
+
+    assert picks.count(1) > picks.count(5)
+    assert set(picks) <= {1, 2, 3, 4, 5}
@@ -0,0 +1,74 @@
+"""
+Unit tests for netbox_custom_objects_tab.profiling (?_profile on tab views).
+"""
+
+from unittest.mock import MagicMock, patch
+
+from django.http import HttpResponse
+
+
+def _request(params, permitted=True):
+    request = MagicMock(method="GET", path="/dcim/devices/1/custom-objects/")
+    request.GET = params
+    request.user.has_perm.return_value = permitted
+    return request
+
+
+class _View:
+    def get(self, request, pk):
+        return HttpResponse(f"page {pk}")
+
+
+def _call(request, enabled=True, directory=None, sampling=None):
+    from netbox_custom_objects_tab import profiling
+
+    config = {"profile_requests": enabled, "profile_directory": directory}
+    get = profiling.profiled(_View.get)
+    with (
+        patch.object(profiling, "get_plugin_config", side_effect=lambda _plugin, key: config[key]),
+        patch.object(profiling, "_sampling_profiler", return_value=sampling),
+    ):
+        return get(_View(), request, 7)
+
+
+class TestProfiled:
+    def test_plain_request_is_untouched(self):
+        response = _call(_request({}))
+        assert response.content == b"page 7"
+
+    def test_disabled_setting_ignores_parameter(self):
+        response = _call(_request({"_profile": "1"}), enabled=False)
+        assert response.content == b"page 7"
+
+    def test_user_without_permission_ignores_parameter(self):
+        request = _request({"_profile": "1"}, permitted=False)
+        response = _call(request)
+        assert response.content == b"page 7"
+        request.user.has_perm.assert_called_once_with("netbox_custom_objects_tab.profile_referenceindexentry")
+
+    def test_cprofile_report_replaces_page(self):
+        response = _call(_request({"_profile": "1"}))
+        body = response.content.decode()
+        assert response["Content-Type"].startswith("text/plain")
+        assert "HTTP 200" in body
+        assert "Hot spots" in body
+
+    def test_stats_saved_to_directory(self, tmp_path):
+        response = _call(_request({"_profile": "1"}), directory=str(tmp_path))
+        saved = list(tmp_path.glob("*.prof"))
+        assert len(saved) == 1
+        assert str(saved[0]) in response.content.decode()
+
+    def test_sampling_profiler_when_installed(self):
+        profiler_class = MagicMock()
+        profiler_class.return_value.output_html.return_value = "<html>flame</html>"
+        response = _call(_request({"_profile": "1"}), sampling=profiler_class)
+        assert response.content == b"<html>flame</html>"
+        profiler_class.return_value.start.assert_called_once_with()
+        profiler_class.return_value.stop.assert_called_once_with()
+
+    def test_cprofile_can_be_forced(self):
+        profiler_class = MagicMock()
+        response = _call(_request({"_profile": "cprofile"}), sampling=profiler_class)
+        assert "Hot spots" in response.content.decode()
+        profiler_class.assert_not_called()
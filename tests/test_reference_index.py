@@ -0,0 +1,151 @@
+"""
+Unit tests for netbox_custom_objects_tab.reference_index and its signal handlers.
+"""
+
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+from netbox_custom_objects.models import CustomObject
+
+
+def _field(name, field_type, pk=1, label=None, type_label="Server"):
+    field = MagicMock()
+    field.pk = pk
+    field.name = name
+    field.type = field_type
+    field.__str__ = lambda self: label or name
+    field.custom_object_type.__str__ = lambda self: type_label
+    return field
+
+
+class TestIterReferences:
+    def test_object_field_yields_fk_value(self):
+        from netbox_custom_objects_tab.reference_index import _iter_references
+
+        field = _field("device", CustomFieldTypeChoices.TYPE_OBJECT)
+        obj = MagicMock(device_id=7)
+
+        assert list(_iter_references(obj, [field])) == [(field, 7)]
+
+    def test_object_field_unset_yields_nothing(self):
+        from netbox_custom_objects_tab.reference_index import _iter_references
+
+        field = _field("device", CustomFieldTypeChoices.TYPE_OBJECT)
+        obj = MagicMock(device_id=None)
+
+        assert list(_iter_references(obj, [field])) == []
+
+    def test_multiobject_field_yields_each_related_pk(self):
+        from netbox_custom_objects_tab.reference_index import _iter_references
+
+        field = _field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        obj = MagicMock()
+        obj.devices.all.return_value = [MagicMock(pk=1), MagicMock(pk=2)]
+
+        assert list(_iter_references(obj, [field])) == [(field, 1), (field, 2)]
+
+
+class TestSignalHandlers:
+    def test_save_of_custom_object_syncs_index(self):
+        from netbox_custom_objects_tab import signals
+
+        obj = type("DynModel", (CustomObject,), {})()
+        with patch.object(signals.reference_index, "sync_custom_object") as sync:
+            signals.handle_custom_object_saved(sender=type(obj), instance=obj)
+
+        sync.assert_called_once_with(obj)
+
+    def test_save_of_other_model_is_ignored(self):
+        from netbox_custom_objects_tab import signals
+
+        with patch.object(signals.reference_index, "sync_custom_object") as sync:
+            signals.handle_custom_object_saved(sender=object, instance=MagicMock())
+
+        sync.assert_not_called()
+
+    def test_delete_of_parent_drops_its_entries(self):
+        from netbox_custom_objects_tab import signals
+
+        parent = MagicMock(pk=5)
+        with patch.object(signals.reference_index, "delete_parent") as delete_parent:
+            signals.handle_object_deleted(sender=object, instance=parent)
+
+        delete_parent.assert_called_once_with(parent)
+
+    def test_reverse_clear_resyncs_the_previously_linked_objects(self):
+        from netbox_custom_objects_tab import signals
+
+        model = type("DynModel", (CustomObject,), {})
+        model.objects = MagicMock()
+        linked = [MagicMock(pk=11), MagicMock(pk=12)]
+        model.objects.filter.return_value.prefetch_related.return_value = linked
+        through = MagicMock()
+        through.objects.filter.return_value.values_list.return_value = [11, 12]
+        parent = MagicMock(pk=7)
+        with patch.object(signals.reference_index, "sync_custom_object") as sync:
+            for action in ("pre_clear", "post_clear"):
+                signals.handle_m2m_changed(
+                    sender=through, instance=parent, action=action, reverse=True, model=model, pk_set=None
+                )
+
+        through.objects.filter.assert_called_once_with(target_id=7)
+        model.objects.filter.assert_called_once_with(pk__in={11, 12})
+        assert [c.args[0] for c in sync.call_args_list] == linked
+
+    def test_signals_not_connected_when_disabled(self):
+        from netbox_custom_objects_tab import signals
+
+        with (
+            patch.object(signals, "get_plugin_config", return_value=False),
+            patch.object(signals, "post_save") as post_save,
+        ):
+            signals.connect_signals()
+
+        post_save.connect.assert_not_called()
+
+
+def test_combined_badge_reads_index_when_enabled():
+    from netbox_custom_objects_tab import references
+    from netbox_custom_objects_tab.views import combined
+
+    with (
+        patch.object(combined, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_index"),
+        patch.object(combined.reference_index, "count_for_parent", return_value=4),
+        patch.object(references, "CustomObjectTypeField") as mock_cotf,
+    ):
+        assert combined._count_linked_custom_objects(MagicMock()) == 4
+
+    mock_cotf.objects.filter.assert_not_called()
+
+
+class TestDeleteReceiverScoping:
+    def test_delete_handler_connected_per_sender(self):
+        from netbox_custom_objects_tab import signals
+
+        dyn_model = type("DynModel", (CustomObject,), {})
+        device = MagicMock()
+        with (
+            patch.object(signals, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_index"),
+            patch.object(signals, "post_delete") as post_delete,
+            patch.object(signals, "post_save"),
+            patch.object(signals, "m2m_changed"),
+            patch.object(signals, "class_prepared"),
+            patch.object(signals, "apps") as mock_apps,
+            patch.object(signals, "_parent_models", return_value=[device]),
+        ):
+            mock_apps.get_models.return_value = [dyn_model, MagicMock]
+            signals.connect_signals()
+
+        senders = [c.kwargs["sender"] for c in post_delete.connect.call_args_list]
+        assert senders == [dyn_model, device]
+
+    def test_custom_object_models_prepared_later_are_connected(self):
+        from netbox_custom_objects_tab import signals
+
+        dyn_model = type("DynModel", (CustomObject,), {})
+        post_delete = MagicMock()
+        with patch.object(signals, "_delete_receivers", [(post_delete, signals.handle_object_deleted, "uid", True)]):
+            signals.handle_class_prepared(sender=dyn_model)
+            signals.handle_class_prepared(sender=MagicMock)
+
+        post_delete.connect.assert_called_once_with(signals.handle_object_deleted, sender=dyn_model, dispatch_uid="uid")
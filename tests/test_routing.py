@@ -0,0 +1,85 @@
+"""
+Unit tests for netbox_custom_objects_tab.routing (read-replica routing).
+"""
+
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django.core.exceptions import MiddlewareNotUsed
+from netbox_custom_objects.models import CustomObject
+
+
+def _config(**settings):
+    return lambda _plugin, key: settings.get(key)
+
+
+class TestReadAlias:
+    def test_none_when_disabled(self):
+        from netbox_custom_objects_tab import routing
+
+        with patch.object(routing, "get_plugin_config", _config()):
+            assert routing.read_alias() is None
+
+    def test_replica_outside_requests(self):
+        from netbox_custom_objects_tab import routing
+
+        with patch.object(routing, "get_plugin_config", _config(read_database_alias="replica")):
+            assert routing.read_alias() == "replica"
+
+    def test_using_leaves_manager_untouched_when_disabled(self):
+        from netbox_custom_objects_tab.routing import using
+
+        manager = MagicMock()
+        assert using(manager, None) is manager
+        assert using(manager, "replica") is manager.using.return_value
+        manager.using.assert_called_once_with("replica")
+
+
+class TestReadReplicaPinMiddleware:
+    def _middleware(self, view, **settings):
+        from netbox_custom_objects_tab import routing
+
+        with patch.object(routing, "get_plugin_config", _config(**settings)):
+            return routing.ReadReplicaPinMiddleware(view)
+
+    def _request(self, session=None):
+        return MagicMock(session=session if session is not None else {})
+
+    def test_not_used_without_alias(self):
+        with pytest.raises(MiddlewareNotUsed):
+            self._middleware(lambda request: None)
+
+    def test_reads_replica_and_does_not_pin_without_writes(self):
+        from netbox_custom_objects_tab import routing
+
+        seen = []
+        middleware = self._middleware(lambda request: seen.append(routing.read_alias()), read_database_alias="replica")
+        request = self._request()
+        with patch.object(routing, "get_plugin_config", _config(read_database_alias="replica", read_pin_seconds=10)):
+            middleware(request)
+
+        assert seen == ["replica"]
+        assert routing._SESSION_KEY not in request.session
+
+    def test_write_pins_session_to_primary(self):
+        from netbox_custom_objects_tab import routing, signals
+
+        seen = []
+
+        def view(request):
+            signals.handle_custom_object_written(sender=None, instance=type("Dyn", (CustomObject,), {})())
+            seen.append(routing.read_alias())
+
+        middleware = self._middleware(view, read_database_alias="replica")
+        request = self._request()
+        with patch.object(routing, "get_plugin_config", _config(read_database_alias="replica", read_pin_seconds=10)):
+            middleware(request)
+            assert seen == ["default"]
+            assert request.session[routing._SESSION_KEY] > time.time()
+
+            # The next request of the same session still reads from the primary
+            middleware.get_response = lambda request: seen.append(routing.read_alias())
+            middleware(request)
+
+        assert seen == ["default", "default"]
@@ -0,0 +1,72 @@
+"""
+Unit tests for netbox_custom_objects_tab.rows (compact combined-tab rows).
+"""
+
+from unittest.mock import MagicMock, patch
+
+from netbox_custom_objects_tab.rows import LinkedRow, fetch_rows, load_page
+
+
+def _queryset(values):
+    qs = MagicMock()
+    qs.order_by.return_value.values_list.return_value = values
+    return qs
+
+
+class TestFetchRows:
+    def test_groups_joined_tag_rows_per_object(self):
+        model = MagicMock()
+        qs = _queryset(
+            [
+                (1, "t1", 10, "red", "Red"),
+                (1, "t1", 11, "blue", "Blue"),
+                (2, "t2", None, None, None),
+            ]
+        )
+
+        rows = fetch_rows(model, 3, qs)
+
+        assert [(row.custom_object_type_id, row.pk, row.last_updated) for row in rows] == [(3, 1, "t1"), (3, 2, "t2")]
+        assert [t.slug for t in rows[0].tags] == ["blue", "red"]
+        assert rows[1].tags == ()
+        assert rows[0].model is model
+        qs.order_by.return_value.values_list.assert_called_once_with(
+            "pk", "last_updated", "tags__pk", "tags__slug", "tags__name"
+        )
+
+    def test_rows_and_tags_are_shared_between_calls(self):
+        rows, tags = {}, {}
+        first = fetch_rows(MagicMock(), 3, _queryset([(1, "t1", 10, "red", "Red")]), rows, tags)
+        second = fetch_rows(MagicMock(), 3, _queryset([(1, "t1", 10, "red", "Red")]), rows, tags)
+
+        assert first[0] is second[0]
+        assert len(tags) == 1
+
+    def test_rows_have_no_instance_dict(self):
+        row = LinkedRow(MagicMock(), 3, 1, None)
+
+        assert not hasattr(row, "__dict__")
+
+
+class TestLoadPage:
+    def test_replaces_rows_with_instances_one_query_per_model(self):
+        from netbox_custom_objects_tab import rows as rows_module
+
+        model = MagicMock()
+        instance = MagicMock(pk=1)
+        model.objects.prefetch_related.return_value.in_bulk.return_value = {1: instance}
+        field = MagicMock()
+        pairs = [(LinkedRow(model, 3, 1, None), field), (LinkedRow(model, 3, 2, None), field)]
+
+        with patch.object(rows_module, "read_alias", return_value=None):
+            page = load_page(pairs)
+
+        # Row 2 vanished after the list query and is dropped
+        assert page == [(instance, field)]
+        model.objects.prefetch_related.assert_called_once_with("tags")
+        model.objects.prefetch_related.return_value.in_bulk.assert_called_once_with({1, 2})
+
+    def test_instances_pass_through(self):
+        obj, field = MagicMock(), MagicMock()
+
+        assert load_page([(obj, field)]) == [(obj, field)]
@@ -0,0 +1,76 @@
+"""
+Unit tests for netbox_custom_objects_tab.tables.
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+class TestCustomObjectsCountColumn:
+    @staticmethod
+    def _column():
+        from netbox_custom_objects_tab.tables import CustomObjectsCountColumn
+
+        return CustomObjectsCountColumn()
+
+    def test_order_annotates_and_sorts_in_sql(self):
+        column = self._column()
+        queryset = MagicMock()
+        with patch("netbox_custom_objects_tab.counts.reference_count_expression", return_value="expr"):
+            result, handled = column.order(queryset, is_descending=True)
+
+        assert handled is True
+        queryset.annotate.assert_called_once_with(custom_objects_count="expr")
+        queryset.annotate.return_value.order_by.assert_called_once_with("-custom_objects_count")
+        assert result is queryset.annotate.return_value.order_by.return_value
+
+    def test_annotated_record_needs_no_query(self):
+        column = self._column()
+        record = MagicMock(custom_objects_count=4)
+        table = MagicMock()
+
+        assert column.render(record, table) == 4
+        table.page.object_list.__iter__.assert_not_called()
+
+    def test_unannotated_page_counted_once(self):
+        column = self._column()
+        model = MagicMock()
+        records = [MagicMock(pk=1, custom_objects_count=None), MagicMock(pk=2, custom_objects_count=None)]
+        for record in records:
+            record._meta.model = model
+        model.objects.filter.return_value.annotate.return_value.values_list.return_value = [(1, 3), (2, 0)]
+        table = MagicMock(spec=["page"])
+        table.page.object_list = [MagicMock(record=r) for r in records]
+
+        with patch("netbox_custom_objects_tab.counts.reference_count_expression"):
+            assert column.render(records[0], table) == 3
+            assert column.render(records[1], table) == "—"
+
+        model.objects.filter.assert_called_once_with(pk__in=[1, 2])
+
+
+class TestRegisterCountColumns:
+    def test_registers_on_resolved_tables_only(self):
+        from netbox_custom_objects_tab import tables
+
+        device, widget = MagicMock(), MagicMock()
+        device_table = MagicMock(__name__="DeviceTable")
+        with (
+            patch.object(tables, "get_plugin_config", return_value=True),
+            patch.object(tables, "_get_table_class", side_effect=[device_table, None]),
+            patch.object(tables, "register_table_column") as register,
+        ):
+            tables.register_count_columns([device, widget])
+
+        register.assert_called_once()
+        assert register.call_args.args[1:] == ("custom_objects", device_table)
+
+    def test_disabled_setting_registers_nothing(self):
+        from netbox_custom_objects_tab import tables
+
+        with (
+            patch.object(tables, "get_plugin_config", return_value=False),
+            patch.object(tables, "register_table_column") as register,
+        ):
+            tables.register_count_columns([MagicMock()])
+
+        register.assert_not_called()
@@ -2,6 +2,7 @@
 Unit tests for netbox_custom_objects_tab.views.combined helpers.
 """
 
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -113,8 +114,8 @@ class TestCountLinkedCustomObjects:
         instance._meta.model = MagicMock()
 
         with (
-            patch("netbox_custom_objects_tab.views.combined.CustomObjectTypeField") as mock_cotf,
-            patch("netbox_custom_objects_tab.views.combined.ContentType") as mock_ct,
+            patch("netbox_custom_objects_tab.references.CustomObjectTypeField") as mock_cotf,
+            patch("netbox_custom_objects_tab.references.ContentType") as mock_ct,
         ):
             mock_ct.objects.get_for_model.return_value = MagicMock()
             mock_cotf.objects.filter.return_value.select_related.return_value = mock_fields
@@ -150,6 +151,89 @@ class TestCountLinkedCustomObjects:
         assert result is None
 
 
+class TestCountByType:
+    def _field(self, cot, name, field_type):
+        field = MagicMock()
+        field.name = name
+        field.type = field_type
+        field.custom_object_type = cot
+        field.custom_object_type_id = cot.pk
+        cot.get_model.return_value.objects.filter.side_effect = lambda **kw: MagicMock(
+            count=MagicMock(return_value=self.counts[next(iter(kw))])
+        )
+        return field
+
+    def _cot(self, pk, slug, label):
+        cot = MagicMock(pk=pk, slug=slug)
+        cot.__str__ = lambda self: label
+        return cot
+
+    def test_counts_per_type_without_loading_rows(self):
+        from netbox_custom_objects_tab.views import combined
+
+        server, cable = self._cot(1, "server", "Server"), self._cot(2, "cable", "Cable")
+        self.counts = {"device_id": 3, "devices": 2, "endpoint_id": 0}
+        fields = [
+            self._field(server, "device", CustomFieldTypeChoices.TYPE_OBJECT),
+            self._field(server, "devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT),
+            self._field(cable, "endpoint", CustomFieldTypeChoices.TYPE_OBJECT),
+        ]
+        with (
+            patch.object(combined, "get_plugin_config", return_value=None),
+            patch.object(combined, "get_reference_fields", return_value=fields),
+        ):
+            groups = combined._count_by_type(MagicMock(pk=5))
+
+        # Types without references are left out
+        assert groups == [(server, 5)]
+
+    def test_counters_answer_without_per_field_counts(self):
+        from netbox_custom_objects_tab.views import combined
+
+        server = self._cot(1, "server", "Server")
+        self.counts = {}
+        fields = [self._field(server, "device", CustomFieldTypeChoices.TYPE_OBJECT)]
+        with (
+            patch.object(combined, "get_plugin_config", side_effect=lambda _plugin, key: key == "reference_counters"),
+            patch.object(combined, "get_reference_fields", return_value=fields),
+            patch.object(combined.counters, "count_for_parents", return_value={5: {"server": 7}}),
+        ):
+            assert combined._count_by_type(MagicMock(pk=5)) == [(server, 7)]
+
+        server.get_model.assert_not_called()
+
+
+class TestCappedCount:
+    def _qs(self, n):
+        qs = MagicMock()
+        qs.count.return_value = n
+        qs.__getitem__.side_effect = lambda sl: MagicMock(count=MagicMock(return_value=min(n, sl.stop)))
+        return qs
+
+    def test_exact_without_cap(self):
+        from netbox_custom_objects_tab.views.combined import _capped_count
+
+        assert _capped_count([self._qs(3), self._qs(4)]) == 7
+
+    def test_limit_shrinks_and_stops_after_cap(self):
+        from netbox_custom_objects_tab.views.combined import _capped_count
+
+        first, second, third = self._qs(600), self._qs(600), self._qs(600)
+        assert _capped_count(iter([first, second, third]), cap=1000) == 1001
+
+        first.__getitem__.assert_called_once_with(slice(None, 1001))
+        second.__getitem__.assert_called_once_with(slice(None, 401))
+        third.__getitem__.assert_not_called()
+        first.count.assert_not_called()
+
+    def test_badge_value(self):
+        from netbox_custom_objects_tab.views.combined import _badge_value
+
+        assert _badge_value(0, 1000) is None
+        assert _badge_value(1000, 1000) == 1000
+        assert _badge_value(1001, 1000) == "1000+"
+
+
 class TestCustomObjectsTabTable:
     """Column-preference machinery on the lightweight table class."""
 
@@ -305,3 +389,190 @@ class TestRegisterCombinedTabs:
 
         view_cls = _make_tab_view(model)
         assert view_cls.__name__ == "DeviceCustomObjectsTabView"
+
+
+# ---------------------------------------------------------------------------
+# Streaming export
+# ---------------------------------------------------------------------------
+class TestExportStreams:
+    ROW = {"type": "Server", "id": 1, "object": "srv-1", "field": "Device", "value": "dev-1", "tags": ["a", "b"]}
+
+    def test_csv_has_header_and_joined_tags(self):
+        from netbox_custom_objects_tab.views.combined import _stream_csv
+
+        lines = list(_stream_csv(iter([self.ROW])))
+        assert lines[0].strip() == "type,id,object,field,value,tags"
+        assert lines[1].strip() == 'Server,1,srv-1,Device,dev-1,"a,b"'
+
+    def test_json_is_valid_array(self):
+        import json
+
+        from netbox_custom_objects_tab.views.combined import _stream_json
+
+        assert json.loads("".join(_stream_json(iter([self.ROW, self.ROW])))) == [self.ROW, self.ROW]
+
+    def test_json_empty(self):
+        from netbox_custom_objects_tab.views.combined import _stream_json
+
+        assert "".join(_stream_json(iter([]))) == "[]"
+
+
+class TestIterExportRows:
+    def _rows(self, objects, q="", type_slug=""):
+        field = MagicMock()
+        field.type = CustomFieldTypeChoices.TYPE_OBJECT
+        field.name = "device"
+        field.__str__ = lambda self: "Device"
+        field.custom_object_type.slug = "server"
+        field.custom_object_type.__str__ = lambda self: "Server"
+        model = field.custom_object_type.get_model.return_value
+        model.objects.filter.return_value.prefetch_related.return_value.iterator.return_value = iter(objects)
+
+        instance = MagicMock(pk=1)
+        with (
+            patch("netbox_custom_objects_tab.views.combined.get_reference_fields", return_value=[field]),
+            patch(
+                "netbox_custom_objects_tab.views.combined._resolve_values_bulk",
+                side_effect=lambda _m, _f, chunk: {obj.pk: None for obj in chunk},
+            ),
+        ):
+            from netbox_custom_objects_tab.views.combined import _iter_export_rows
+
+            return list(_iter_export_rows(instance, q=q, type_slug=type_slug, chunk_size=1))
+
+    def _obj(self, pk, name):
+        obj = MagicMock(pk=pk)
+        obj.__str__ = lambda self: name
+        obj.tags.all.return_value = []
+        return obj
+
+    def test_streams_every_row(self):
+        rows = self._rows([self._obj(1, "alpha"), self._obj(2, "beta")])
+        assert [r["object"] for r in rows] == ["alpha", "beta"]
+        assert rows[0]["value"] == ""
+
+    def test_q_filters_on_object_name(self):
+        rows = self._rows([self._obj(1, "alpha"), self._obj(2, "beta")], q="bet")
+        assert [r["id"] for r in rows] == [2]
+
+    def test_q_matching_type_keeps_all_rows(self):
+        rows = self._rows([self._obj(1, "alpha"), self._obj(2, "beta")], q="server")
+        assert len(rows) == 2
+
+    def test_type_filter_skips_other_types(self):
+        assert self._rows([self._obj(1, "alpha")], type_slug="other") == []
+
+
+class TestMapQueries:
+    def _call(self, concurrency, in_atomic_block=False, alias=None):
+        from netbox_custom_objects_tab.views import combined
+
+        threads = set()
+
+        def fn(job):
+            threads.add(threading.get_ident())
+            return job * 10
+
+        with (
+            patch.object(combined, "get_plugin_config", return_value=concurrency),
+            patch.object(combined, "read_alias", return_value=alias),
+            patch.object(combined, "connections") as mock_connections,
+        ):
+            mock_connections.__getitem__.return_value.in_atomic_block = in_atomic_block
+            result = combined._map_queries(fn, [1, 2, 3, 4])
+        return result, threads, mock_connections
+
+    def test_serial_by_default(self):
+        result, threads, mock_connections = self._call(None)
+        assert result == [10, 20, 30, 40]
+        assert threads == {threading.get_ident()}
+        mock_connections.close_all.assert_not_called()
+
+    def test_concurrent_keeps_job_order_and_closes_connections_once_per_worker(self):
+        result, _threads, mock_connections = self._call(3)
+        assert result == [10, 20, 30, 40]
+        assert mock_connections.close_all.call_count == 3
+
+    def test_serial_inside_transaction(self):
+        result, _threads, mock_connections = self._call(3, in_atomic_block=True)
+        assert result == [10, 20, 30, 40]
+        mock_connections.close_all.assert_not_called()
+
+    def test_transaction_checked_on_read_alias(self):
+        _result, _threads, mock_connections = self._call(3, in_atomic_block=True, alias="replica")
+        mock_connections.__getitem__.assert_called_once_with("replica")
+
+
+class TestLinkedRows:
+    """Lazy filtered/sorted sequence: streams per field, never the whole list."""
+
+    @pytest.fixture(autouse=True)
+    def fake_queries(self):
+        from netbox_custom_objects_tab.views import combined
+
+        self.names = {}
+        self.streamed = []
+
+        def fake_stream(field, model, qs, q="", chunk_size=500):
+            self.streamed.append(field)
+            for name in self.names[id(field)]:
+                if not q or q in name:
+                    yield f"{field}:{name}", field, name
+
+        with (
+            patch.object(combined, "_iter_source", side_effect=fake_stream),
+            patch.object(combined, "_map_queries", side_effect=lambda fn, jobs: [fn(job) for job in jobs]),
+            patch.object(combined, "fetch_rows", return_value=[MagicMock()]),
+        ):
+            yield
+
+    def _source(self, label, names, match_all=True):
+        field = MagicMock()
+        field.__str__ = lambda self: label
+        field.custom_object_type.__str__ = lambda self: "Server"
+        qs = MagicMock()
+        qs.count.return_value = len(names)
+        self.names[id(field)] = names
+        return (field, MagicMock(), qs, match_all)
+
+    def _rows(self, sources, q="", sort_col="", sort_dir="asc"):
+        from netbox_custom_objects_tab.views.combined import _LinkedRows
+
+        return _LinkedRows(sources, q=q, sort_col=sort_col, sort_dir=sort_dir)
+
+    def test_counts_come_from_the_database(self):
+        rows = self._rows([self._source("A", ["x", "y"]), self._source("B", ["z"])])
+        assert len(rows) == 3
+        assert self.streamed == []
+
+    def test_display_filtered_fields_are_counted_by_streaming(self):
+        source = self._source("A", ["alpha", "beta", "alpine"], match_all=False)
+        rows = self._rows([source], q="al")
+        assert rows.count() == 2
+        source[2].count.assert_not_called()
+
+    def test_object_sort_selects_top_k(self):
+        rows = self._rows(
+            [self._source("A", ["delta", "alpha"]), self._source("B", ["charlie", "bravo"])], sort_col="object"
+        )
+        assert [row for row, _field in rows[0:2]] == ["A:alpha", "B:bravo"]
+        assert [row for row, _field in rows[2:4]] == ["B:charlie", "A:delta"]
+
+    def test_object_sort_desc(self):
+        rows = self._rows(
+            [self._source("A", ["delta", "alpha"]), self._source("B", ["charlie"])], sort_col="object", sort_dir="desc"
+        )
+        assert [row for row, _field in rows[0:2]] == ["A:delta", "B:charlie"]
+
+    def test_unsorted_slice_queries_only_overlapping_fields(self):
+        first, second = self._source("A", ["x", "y"]), self._source("B", ["z"])
+        rows = self._rows([first, second])
+        assert len(rows[0:2]) == 1
+        first[2].filter.assert_called_once()
+        second[2].filter.assert_not_called()
+        assert self.streamed == []
+
+    def test_field_sort_orders_fields(self):
+        first, second = self._source("b-field", ["x"]), self._source("a-field", ["y"])
+        rows = self._rows([first, second], sort_col="field")
+        assert [str(source[0]) for source in rows.sources] == ["a-field", "b-field"]
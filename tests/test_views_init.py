@@ -66,6 +66,9 @@ class TestRegisterTabs:
             "combined_weight": 2000,
             "typed_models": ["ipam.prefix"],
             "typed_weight": 2100,
+            "rollup_models": {},
+            "rollup_label": "Related Custom Objects",
+            "rollup_weight": 2050,
         }
 
         with (
@@ -88,6 +91,9 @@ class TestRegisterTabs:
             "combined_weight": 2000,
             "typed_models": [],
             "typed_weight": 2100,
+            "rollup_models": {},
+            "rollup_label": "Related Custom Objects",
+            "rollup_weight": 2050,
         }
 
         with (
@@ -102,6 +108,29 @@ class TestRegisterTabs:
         register_combined.assert_not_called()
         register_typed.assert_not_called()
 
+    def test_dispatches_rollup_tabs(self):
+        from netbox_custom_objects_tab import views
+
+        rollup_models = {"dcim.site": {"dcim.device": "site"}}
+        config_map = {
+            "combined_models": [],
+            "combined_label": "Custom Objects",
+            "combined_weight": 2000,
+            "typed_models": [],
+            "typed_weight": 2100,
+            "rollup_models": rollup_models,
+            "rollup_label": "Related Custom Objects",
+            "rollup_weight": 2050,
+        }
+
+        with (
+            patch.object(views, "get_plugin_config", side_effect=lambda _plugin, key: config_map[key]),
+            patch.object(views, "register_rollup_tabs") as register_rollup,
+        ):
+            views.register_tabs()
+
+        register_rollup.assert_called_once_with(rollup_models, "Related Custom Objects", 2050)
+
     def test_config_exception_is_handled(self, caplog):
         from netbox_custom_objects_tab import views
 
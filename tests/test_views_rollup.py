@@ -0,0 +1,100 @@
+"""
+Unit tests for netbox_custom_objects_tab.views.rollup (hierarchical rollup tab).
+"""
+
+from unittest.mock import MagicMock, patch
+
+from extras.choices import CustomFieldTypeChoices
+
+
+def _queryset(pks):
+    qs = MagicMock()
+    qs.prefetch_related.return_value.__getitem__.side_effect = lambda key: [MagicMock(pk=pk) for pk in pks[key]]
+    return qs
+
+
+class TestRollupRows:
+    def _rows(self):
+        from netbox_custom_objects_tab.views.rollup import _RollupRows
+
+        self.fields = [MagicMock(name="a"), MagicMock(name="empty"), MagicMock(name="b")]
+        self.querysets = [_queryset([1, 2, 3]), _queryset([]), _queryset([10, 11, 12, 13])]
+        return _RollupRows(zip(self.fields, self.querysets, [3, 0, 4]))
+
+    def test_length_is_sum_of_counts(self):
+        rows = self._rows()
+
+        assert len(rows) == 7 and rows.count() == 7
+
+    def test_slice_spans_fields_and_queries_only_overlapping_ones(self):
+        rows = self._rows()
+
+        page = rows[2:5]
+
+        assert [(obj.pk, field) for obj, field in page] == [
+            (3, self.fields[0]),
+            (10, self.fields[2]),
+            (11, self.fields[2]),
+        ]
+        self.querysets[1].prefetch_related.assert_not_called()
+
+    def test_slice_within_later_field_skips_earlier_ones(self):
+        rows = self._rows()
+
+        assert [obj.pk for obj, _field in rows[5:7]] == [12, 13]
+        self.querysets[0].prefetch_related.return_value.__getitem__.assert_not_called()
+
+
+class TestRollupQuerysets:
+    def _field(self, name, field_type):
+        field = MagicMock()
+        field.name = name
+        field.type = field_type
+        return field
+
+    def test_children_are_matched_with_subquery(self):
+        from netbox_custom_objects_tab.views import rollup
+
+        site_field = self._field("site", CustomFieldTypeChoices.TYPE_OBJECT)
+        device_field = self._field("devices", CustomFieldTypeChoices.TYPE_MULTIOBJECT)
+        site_model, device_model = MagicMock(), MagicMock()
+        instance = MagicMock(pk=5)
+        instance._meta.model = site_model
+
+        def reference_fields(model_class):
+            return [site_field] if model_class is site_model else [device_field]
+
+        with (
+            patch.object(rollup, "get_reference_fields", side_effect=reference_fields),
+            patch.object(rollup, "read_alias", return_value=None),
+        ):
+            result = rollup._rollup_querysets(instance, [(device_model, "site")])
+
+        assert [(field, source) for field, source, _qs in result] == [
+            (site_field, site_model),
+            (device_field, device_model),
+        ]
+        device_model.objects.filter.assert_called_once_with(site=5)
+        child_pks = device_model.objects.filter.return_value.values.return_value
+        device_field.custom_object_type.get_model.return_value.objects.filter.assert_called_once_with(
+            devices__in=child_pks
+        )
+        site_field.custom_object_type.get_model.return_value.objects.filter.assert_called_once_with(site_id=5)
+
+
+def test_unknown_rollup_models_are_skipped():
+    from netbox_custom_objects_tab.views import rollup
+
+    device = MagicMock()
+
+    def get_model(label):
+        if label == "dcim.device":
+            return device
+        raise LookupError(label)
+
+    with patch.object(rollup.apps, "get_model", side_effect=get_model):
+        result = rollup._resolve_rollup_models(
+            {"dcim.nope": {"dcim.device": "site"}, "dcim.device": {"dcim.nope": "x", "dcim.device": "parent"}}
+        )
+
+    assert result == [(device, [(device, "parent")])]
@@ -370,3 +370,111 @@ class TestRegisterTypedTabs:
             register_typed_tabs([model_class], weight=2100)
 
         mock_register.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# _visible_related_lookups / _load_related
+# ---------------------------------------------------------------------------
+class TestRelatedLookups:
+    def _field(self, name, field_type):
+        field = MagicMock()
+        field.name = name
+        field.type = field_type
+        return field
+
+    def _table(self, columns):
+        table = MagicMock()
+        table.columns.iteritems.return_value = [(name, MagicMock(visible=visible)) for name, visible in columns]
+        return table
+
+    def test_only_visible_related_columns(self):
+        from netbox_custom_objects_tab.views.typed import _visible_related_lookups
+
+        cot = MagicMock()
+        cot.fields.all.return_value = [
+            self._field("device", CustomFieldTypeChoices.TYPE_OBJECT),
+            self._field("site", CustomFieldTypeChoices.TYPE_OBJECT),
+            self._field("interfaces", CustomFieldTypeChoices.TYPE_MULTIOBJECT),
+            self._field("name", CustomFieldTypeChoices.TYPE_TEXT),
+        ]
+        table = self._table(
+            [("id", True), ("device", True), ("site", False), ("interfaces", True), ("name", True), ("tags", True)]
+        )
+
+        assert _visible_related_lookups(table, cot) == (["device"], ["interfaces", "tags"])
+
+    def test_lookups_applied_to_current_page(self):
+        from netbox_custom_objects_tab.views.typed import _load_related
+
+        table = MagicMock()
+        page_qs = MagicMock(spec=["select_related"])
+        table.paginated_rows.data = page_qs
+
+        _load_related(table, ["device"], ["tags"])
+
+        page_qs.select_related.assert_called_once_with("device")
+        page_qs.select_related.return_value.prefetch_related.assert_called_once_with("tags")
+        assert table.paginated_rows.data is page_qs.select_related.return_value.prefetch_related.return_value
+
+
+# ---------------------------------------------------------------------------
+# Typed tab export
+# ---------------------------------------------------------------------------
+class TestTypedExport:
+    def _table(self, objects):
+        import django_tables2 as tables2
+
+        class _Table(tables2.Table):
+            pk = tables2.Column()
+            name = tables2.Column(verbose_name="Name")
+            device = tables2.Column(verbose_name="Device")
+            serial = tables2.Column(verbose_name="Serial")
+
+        table = _Table([])
+        table.columns.hide("serial")
+        queryset = MagicMock()
+        queryset.select_related.return_value.prefetch_related.return_value.iterator.return_value = iter(objects)
+        table.data = MagicMock(data=queryset)
+        return table, queryset
+
+    def test_columns_follow_visible_configuration(self):
+        from netbox_custom_objects_tab.views.typed import _export_columns
+
+        table, _queryset = self._table([])
+
+        assert _export_columns(table) == [("name", "Name"), ("device", "Device")]
+
+    def test_csv_streams_cell_values(self):
+        from types import SimpleNamespace
+
+        from netbox_custom_objects_tab.views.typed import (
+            _export_columns,
+            _iter_typed_export_rows,
+            _stream_typed_csv,
+        )
+
+        objects = [
+            SimpleNamespace(pk=1, name="srv-1", device="dev-a", serial="x"),
+            SimpleNamespace(pk=2, name="srv-2", device=None, serial="y"),
+        ]
+        table, queryset = self._table(objects)
+        columns = _export_columns(table)
+
+        rows = _iter_typed_export_rows(table, columns, ["device"], ["tags"], chunk_size=500)
+        output = "".join(_stream_typed_csv(columns, rows))
+
+        assert output.splitlines() == ["Name,Device", "srv-1,dev-a", "srv-2,"]
+        queryset.select_related.assert_called_once_with("device")
+        queryset.select_related.return_value.prefetch_related.return_value.iterator.assert_called_once_with(
+            chunk_size=500
+        )
+
+    def test_yaml_is_one_list(self):
+        import yaml
+
+        from netbox_custom_objects_tab.views.typed import _stream_typed_yaml
+
+        columns = [("name", "Name"), ("device", "Device")]
+        output = "".join(_stream_typed_yaml(columns, iter([["srv-1", "dev-a"], ["srv-2", ""]])))
+
+        assert yaml.safe_load(output) == [{"name": "srv-1", "device": "dev-a"}, {"name": "srv-2", "device": ""}]
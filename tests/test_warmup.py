@@ -0,0 +1,95 @@
+"""
+Unit tests for netbox_custom_objects_tab.warmup (cache warm-up command helpers).
+"""
+
+from unittest.mock import MagicMock, patch
+
+
+def _type(pk, pks):
+    custom_object_type = MagicMock(pk=pk)
+    qs = custom_object_type.get_model.return_value.objects.order_by.return_value
+    qs.filter.return_value.values_list.return_value.iterator.return_value = iter(pks)
+    qs.values_list.return_value.iterator.return_value = iter(pks)
+    return custom_object_type, qs
+
+
+class TestIterBatches:
+    def test_splits_pks_into_batches(self):
+        from netbox_custom_objects_tab.warmup import iter_batches
+
+        custom_object_type, _qs = _type(3, [1, 2, 5, 8, 9])
+
+        assert list(iter_batches(custom_object_type, 2)) == [(3, 1, 2, 2), (3, 5, 8, 2), (3, 9, 9, 1)]
+
+    def test_resumes_after_checkpoint(self):
+        from netbox_custom_objects_tab.warmup import iter_batches
+
+        custom_object_type, qs = _type(3, [9])
+
+        assert list(iter_batches(custom_object_type, 2, after_pk=8)) == [(3, 9, 9, 1)]
+        qs.filter.assert_called_once_with(pk__gt=8)
+
+    def test_unloadable_model_is_skipped(self):
+        from netbox_custom_objects_tab.warmup import iter_batches
+
+        custom_object_type = MagicMock(pk=3)
+        custom_object_type.get_model.side_effect = RuntimeError
+
+        assert list(iter_batches(custom_object_type, 2)) == []
+
+
+class TestThrottle:
+    def test_sleeps_to_respect_rate(self):
+        from netbox_custom_objects_tab import warmup
+
+        with (
+            patch.object(warmup.time, "monotonic", return_value=0.0),
+            patch.object(warmup.time, "sleep") as sleep,
+        ):
+            batches = list(warmup.throttle([(3, 1, 10, 10), (3, 11, 20, 10)], rate=5))
+
+        assert len(batches) == 2
+        sleep.assert_called_once_with(2.0)
+
+    def test_no_rate_never_sleeps(self):
+        from netbox_custom_objects_tab import warmup
+
+        with patch.object(warmup.time, "sleep") as sleep:
+            list(warmup.throttle([(3, 1, 10, 10), (3, 11, 20, 10)], rate=0))
+
+        sleep.assert_not_called()
+
+
+class TestRun:
+    def test_inline_run_checkpoints_each_batch(self, tmp_path):
+        from netbox_custom_objects_tab import warmup
+
+        state_file = str(tmp_path / "warm.json")
+        state = {}
+
+        def on_done(batch):
+            state[batch[0]] = batch[2]
+            warmup.save_state(state_file, state)
+
+        with patch.object(warmup, "warm_batch", side_effect=lambda batch: batch) as warm_batch:
+            warmup.run([(3, 1, 2, 2), (4, 7, 7, 1)], workers=1, on_done=on_done)
+
+        assert warm_batch.call_count == 2
+        assert warmup.load_state(state_file) == {3: 2, 4: 7}
+
+    def test_pool_input_closes_connections_once_exhausted(self):
+        from netbox_custom_objects_tab import warmup
+
+        with patch.object(warmup, "connections") as connections:
+            batches = warmup._closing_connections(iter([(3, 1, 2, 2)]))
+            assert next(batches) == (3, 1, 2, 2)
+            connections.close_all.assert_not_called()
+            assert list(batches) == []
+
+        connections.close_all.assert_called_once_with()
+
+    def test_missing_state_file_starts_fresh(self, tmp_path):
+        from netbox_custom_objects_tab.warmup import load_state
+
+        assert load_state(str(tmp_path / "missing.json")) == {}
+        assert load_state(None) == {}
@@ -0,0 +1,82 @@
+"""
+Unit tests for netbox_custom_objects_tab.widgets (most referenced objects widget).
+"""
+
+import importlib
+import sys
+from unittest.mock import MagicMock, patch
+
+import pytest
+from django import forms
+
+
+@pytest.fixture
+def widgets():
+    dashboard = {
+        "extras.dashboard": MagicMock(),
+        "extras.dashboard.utils": MagicMock(register_widget=lambda cls: cls),
+        "extras.dashboard.widgets": MagicMock(DashboardWidget=object, WidgetConfigForm=forms.Form),
+    }
+    with patch.dict(sys.modules, dashboard):
+        yield importlib.import_module("netbox_custom_objects_tab.widgets")
+
+
+def _viewable(visible_pks):
+    def viewable(_user, ranking):
+        return {(ct_id, pk): MagicMock(pk=pk) for ct_id, pk, _count in ranking if pk in visible_pks}
+
+    return viewable
+
+
+class TestVisibleRanking:
+    def test_widens_window_until_enough_objects_are_visible(self, widgets):
+        ranking = [(20, pk, 100 - pk) for pk in range(1, 21)]
+        with (
+            patch.object(widgets, "top_referenced", side_effect=lambda limit, *_args: ranking[:limit]) as top,
+            patch.object(widgets, "_viewable_objects", side_effect=_viewable({2, 9, 15})),
+        ):
+            visible, _objects = widgets.visible_ranking(MagicMock(), 3)
+
+        assert visible == [(20, 2, 98), (20, 9, 91), (20, 15, 85)]
+        assert [call.args[0] for call in top.call_args_list] == [3, 12, 48]
+
+    def test_stops_when_ranking_is_exhausted(self, widgets):
+        with (
+            patch.object(widgets, "top_referenced", return_value=[(20, 1, 5), (20, 2, 3)]) as top,
+            patch.object(widgets, "_viewable_objects", side_effect=_viewable({2})),
+        ):
+            visible, _objects = widgets.visible_ranking(MagicMock(), 3)
+
+        assert visible == [(20, 2, 3)]
+        top.assert_called_once()
+
+
+class TestRankedObjects:
+    def test_cache_is_keyed_by_permission_signature(self, widgets):
+        with (
+            patch.object(widgets, "cache") as mock_cache,
+            patch.object(widgets, "permission_signature", side_effect=["restricted", "superuser"]),
+            patch.object(widgets, "visible_ranking", return_value=([], {})),
+        ):
+            mock_cache.get.return_value = None
+            widgets.ranked_objects(MagicMock(), 5, cache_timeout=300)
+            widgets.ranked_objects(MagicMock(), 5, cache_timeout=300)
+
+        first, second = (call.args[0] for call in mock_cache.get.call_args_list)
+        assert first != second
+
+    def test_cached_ranking_skips_ranking_queries(self, widgets):
+        obj = MagicMock()
+        obj._meta.verbose_name = "device"
+        with (
+            patch.object(widgets, "cache") as mock_cache,
+            patch.object(widgets, "permission_signature", return_value="superuser"),
+            patch.object(widgets, "visible_ranking") as visible_ranking,
+            patch.object(widgets, "_viewable_objects", return_value={(20, 7): obj}),
+            patch.object(widgets, "_object_url", return_value="/dcim/devices/7/"),
+        ):
+            mock_cache.get.return_value = [(20, 7, 5)]
+            rows = widgets.ranked_objects(MagicMock(), 5, cache_timeout=300)
+
+        visible_ranking.assert_not_called()
+        assert rows == [{"object": obj, "model": "device", "url": "/dcim/devices/7/", "count": 5}]